@@ -0,0 +1,52 @@
+"""dedupe states and add unique (abs_id, client_name) index
+
+Revision ID: a7c3e5f1b9d2
+Revises: f6b2c4d8e9a1
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5f1b9d2"
+down_revision: Union[str, Sequence[str], None] = "f6b2c4d8e9a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_states_abs_id_client_name"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "states" not in inspector.get_table_names():
+        return
+    if INDEX_NAME in {i["name"] for i in inspector.get_indexes("states")}:
+        return
+
+    # Keep the most recently updated row for each (book, client); newest id breaks ties
+    op.execute(
+        """
+        DELETE FROM states WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY abs_id, client_name
+                    ORDER BY COALESCE(last_updated, 0) DESC, id DESC
+                ) AS rank
+                FROM states
+            ) WHERE rank > 1
+        )
+        """
+    )
+    op.create_index(INDEX_NAME, "states", ["abs_id", "client_name"], unique=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "states" in inspector.get_table_names() and INDEX_NAME in {i["name"] for i in inspector.get_indexes("states")}:
+        op.drop_index(INDEX_NAME, table_name="states")
@@ -0,0 +1,53 @@
+"""add indexes for hot lookup columns
+
+Revision ID: b8d4f6a2c0e3
+Revises: a7c3e5f1b9d2
+Create Date: 2026-10-18
+"""
+
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d4f6a2c0e3"
+down_revision: Union[str, Sequence[str], None] = "a7c3e5f1b9d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_books_status", "books", ["status"]),
+    ("ix_books_kosync_doc_id", "books", ["kosync_doc_id"]),
+    ("ix_kosync_documents_filename", "kosync_documents", ["filename"]),
+    ("ix_jobs_abs_id_last_attempt", "jobs", ["abs_id", "last_attempt"]),
+    ("ix_pending_suggestions_source_id_status", "pending_suggestions", ["source_id", "status"]),
+    ("ix_pending_suggestions_status_created_at", "pending_suggestions", ["status", "created_at"]),
+    ("ix_booklore_books_filename", "booklore_books", ["filename"]),
+]
+
+
+def _existing_indexes(inspector, table_name: str) -> Optional[set]:
+    """Index names on a table, or None when the table doesn't exist."""
+    if table_name not in inspector.get_table_names():
+        return None
+    return {idx["name"] for idx in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = _existing_indexes(inspector, table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, _ in reversed(INDEXES):
+        existing = _existing_indexes(inspector, table)
+        # ix_booklore_books_filename predates this revision on some databases
+        if existing and name in existing and name != "ix_booklore_books_filename":
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,86 @@
+"""store alignment maps in the blob store
+
+Revision ID: c9e1a3f5d7b4
+Revises: b8d4f6a2c0e3
+Create Date: 2026-10-18
+
+Adds blob reference columns to book_alignments and makes the inline
+alignment_map_json nullable. Existing maps are moved out at startup by
+DatabaseService.offload_inline_alignments(); downgrade reads them back
+from <database dir>/blobs.
+"""
+
+import gzip
+from pathlib import Path
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e1a3f5d7b4"
+down_revision: Union[str, Sequence[str], None] = "b8d4f6a2c0e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (column name, type)
+NEW_COLUMNS = [
+    ("blob_sha256", sa.String(length=64)),
+    ("blob_size", sa.Integer()),
+    ("point_count", sa.Integer()),
+]
+
+
+def _columns(inspector) -> dict:
+    if "book_alignments" not in inspector.get_table_names():
+        return {}
+    return {c["name"]: c for c in inspector.get_columns("book_alignments")}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = _columns(inspector)
+    if not columns:
+        return
+
+    with op.batch_alter_table("book_alignments") as batch_op:
+        for name, type_ in NEW_COLUMNS:
+            if name not in columns:
+                batch_op.add_column(sa.Column(name, type_, nullable=True))
+        if not columns["alignment_map_json"]["nullable"]:
+            batch_op.alter_column("alignment_map_json", existing_type=sa.Text(), nullable=True)
+
+    # Fresh inspector: the batch operation rebuilt the table
+    indexes = {idx["name"] for idx in sa.inspect(op.get_bind()).get_indexes("book_alignments")}
+    if "ix_book_alignments_blob_sha256" not in indexes:
+        op.create_index("ix_book_alignments_blob_sha256", "book_alignments", ["blob_sha256"], unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = _columns(inspector)
+    if "blob_sha256" not in columns:
+        return
+
+    # Put offloaded maps back inline before the reference columns go away
+    blob_root = Path(bind.engine.url.database).parent / "blobs"
+    rows = bind.execute(sa.text(
+        "SELECT abs_id, blob_sha256 FROM book_alignments "
+        "WHERE alignment_map_json IS NULL AND blob_sha256 IS NOT NULL"
+    )).fetchall()
+    for abs_id, digest in rows:
+        path = blob_root / digest[:2] / f"{digest}.gz"
+        if not path.exists():
+            raise RuntimeError(f"Cannot downgrade: alignment blob {digest} for '{abs_id}' is missing")
+        bind.execute(
+            sa.text("UPDATE book_alignments SET alignment_map_json = :json WHERE abs_id = :abs_id"),
+            {"json": gzip.decompress(path.read_bytes()).decode("utf-8"), "abs_id": abs_id},
+        )
+
+    op.drop_index("ix_book_alignments_blob_sha256", table_name="book_alignments")
+    with op.batch_alter_table("book_alignments") as batch_op:
+        for name, _ in NEW_COLUMNS:
+            batch_op.drop_column(name)
+        batch_op.alter_column("alignment_map_json", existing_type=sa.Text(), nullable=False)
@@ -0,0 +1,68 @@
+"""dedupe booklore_books and make filename unique
+
+Revision ID: d2f4b6a8c0e5
+Revises: c9e1a3f5d7b4
+Create Date: 2026-10-18
+
+The model has always declared booklore_books.filename unique, but tables
+created by older migrations only got a plain index. Bulk upserts need a
+real unique index to resolve ON CONFLICT(filename).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f4b6a8c0e5"
+down_revision: Union[str, Sequence[str], None] = "c9e1a3f5d7b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_booklore_books_filename"
+
+
+def _filename_is_unique(inspector) -> bool:
+    unique_indexes = [i["column_names"] for i in inspector.get_indexes("booklore_books") if i.get("unique")]
+    unique_constraints = [c["column_names"] for c in inspector.get_unique_constraints("booklore_books")]
+    return ["filename"] in unique_indexes + unique_constraints
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "booklore_books" not in inspector.get_table_names():
+        return
+    if _filename_is_unique(inspector):
+        return
+
+    # Keep the most recently refreshed row per filename; newest id breaks ties
+    op.execute(
+        """
+        DELETE FROM booklore_books WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY filename
+                    ORDER BY COALESCE(last_updated, '') DESC, id DESC
+                ) AS rank
+                FROM booklore_books
+            ) WHERE rank > 1
+        )
+        """
+    )
+    if INDEX_NAME in {i["name"] for i in inspector.get_indexes("booklore_books")}:
+        op.drop_index(INDEX_NAME, table_name="booklore_books")
+    op.create_index(INDEX_NAME, "booklore_books", ["filename"], unique=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "booklore_books" not in inspector.get_table_names():
+        return
+    indexes = {i["name"]: i for i in inspector.get_indexes("booklore_books")}
+    if INDEX_NAME in indexes and indexes[INDEX_NAME].get("unique"):
+        op.drop_index(INDEX_NAME, table_name="booklore_books")
+        op.create_index(INDEX_NAME, "booklore_books", ["filename"], unique=False)
@@ -0,0 +1,66 @@
+"""add the ebook full-text search index
+
+Revision ID: f3b5d7e9a1c6
+Revises: d2f4b6a8c0e5
+Create Date: 2026-10-18
+
+ebook_search is an FTS5 table over titles, authors, series and filenames
+from every ebook source; ebook_search_queries remembers recent remote
+searches so they can be answered from it. Both are derived data that the
+refresh paths rebuild. SQLite builds without FTS5 get neither table and
+search the sources directly.
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b5d7e9a1c6"
+down_revision: Union[str, Sequence[str], None] = "d2f4b6a8c0e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = sa.inspect(bind).get_table_names()
+
+    if "ebook_search" not in tables:
+        try:
+            op.execute(
+                """
+                CREATE VIRTUAL TABLE ebook_search USING fts5(
+                    title, authors, series, filename, terms,
+                    source UNINDEXED, source_id UNINDEXED, indexed_at UNINDEXED, payload UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+                """
+            )
+        except sa.exc.OperationalError as e:
+            logger.warning(f"⚠️ SQLite has no FTS5 support, ebook search index disabled: {e}")
+            return
+
+    if "ebook_search_queries" not in tables:
+        op.create_table(
+            "ebook_search_queries",
+            sa.Column("source", sa.String(length=50), nullable=False),
+            sa.Column("query", sa.String(length=500), nullable=False),
+            sa.Column("result_ids", sa.Text(), nullable=False),
+            sa.Column("fetched_at", sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint("source", "query"),
+        )
+
+
+def downgrade() -> None:
+    tables = sa.inspect(op.get_bind()).get_table_names()
+    if "ebook_search_queries" in tables:
+        op.drop_table("ebook_search_queries")
+    if "ebook_search" in tables:
+        op.execute("DROP TABLE ebook_search")
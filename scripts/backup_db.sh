@@ -1,10 +1,16 @@
 #!/bin/bash
 # scripts/backup_db.sh
+#
+# Backs up the database and its blob store (alignment maps), then checks the copy.
+# The database is copied with SQLite's online backup API, so it is consistent
+# even while the bridge is running. Blobs are content-addressed and never change,
+# so all backups share one blobs/ directory and only new blobs are copied.
 
 # Default to /data if DATA_DIR is not set
 DATA_DIR="${DATA_DIR:-/data}"
 BACKUP_DIR="${DATA_DIR}/backups"
 DB_FILE="database.db"
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 
 # Create backup directory if it doesn't exist
 mkdir -p "$BACKUP_DIR"
@@ -14,10 +20,35 @@ TIMESTAMP=$(date +"%Y%m%d_%H%M%S")
 BACKUP_FILE="${BACKUP_DIR}/abs_kosync_${TIMESTAMP}.db"
 
 # Check if database exists
-if [ -f "${DATA_DIR}/${DB_FILE}" ]; then
-    cp "${DATA_DIR}/${DB_FILE}" "$BACKUP_FILE"
-    echo "✅ Backup created: $BACKUP_FILE"
-else
+if [ ! -f "${DATA_DIR}/${DB_FILE}" ]; then
     echo "⚠️ Database file not found at ${DATA_DIR}/${DB_FILE}"
     exit 1
 fi
+
+# Snapshot the database first: blobs are written before the rows that point at them
+if ! python3 - "${DATA_DIR}/${DB_FILE}" "$BACKUP_FILE" <<'EOF'
+import sqlite3, sys
+src = sqlite3.connect(sys.argv[1])
+dst = sqlite3.connect(sys.argv[2])
+with dst:
+    src.backup(dst)
+# Keep the backup a single self-contained file
+dst.execute("PRAGMA journal_mode=DELETE")
+dst.close()
+src.close()
+EOF
+then
+    echo "❌ Database backup failed"
+    rm -f "$BACKUP_FILE"
+    exit 1
+fi
+echo "✅ Backup created: $BACKUP_FILE"
+
+if [ -d "${DATA_DIR}/blobs" ]; then
+    mkdir -p "${BACKUP_DIR}/blobs"
+    cp -Rn "${DATA_DIR}/blobs/." "${BACKUP_DIR}/blobs/"
+    echo "✅ Blobs copied to ${BACKUP_DIR}/blobs"
+fi
+
+# Verify the copy and every blob it references
+python3 "${SCRIPT_DIR}/check_db_integrity.py" "$BACKUP_FILE" --blobs "${BACKUP_DIR}/blobs" || exit 1
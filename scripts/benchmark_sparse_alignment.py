@@ -0,0 +1,156 @@
+"""
+Benchmark sparse ("anchor-only") vs. full transcription for alignment.
+
+Builds a synthetic book (random vocabulary, chapters with different narration
+speeds and intro pauses), simulates a Whisper transcript with word errors, and
+runs both modes through the real AlignmentService. Transcription cost is
+estimated as transcribed audio seconds × --rtf (real-time factor), since that
+dominates runtime in practice; alignment time is measured.
+
+Usage:
+    python scripts/benchmark_sparse_alignment.py --hours 20 --rtf 0.3
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from src.services.alignment_service import AlignmentService
+from src.utils.polisher import Polisher
+from src.utils.sparse_transcription import plan_sparse_windows, run_sparse_transcription
+
+
+def build_corpus(hours, seed):
+    """Return (text, words, chapter_starts, total_duration); words are (char, ts, rate, token)."""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocab = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(4000)]
+
+    total_target = hours * 3600
+    words, parts, chapter_starts = [], [], []
+    char, ts, chapter = 0, 0.0, 0
+    while ts < total_target:
+        chapter += 1
+        ts += rng.uniform(3, 20)  # intro music / silence
+        chapter_starts.append(ts)
+        rate = 2.6 * rng.uniform(0.8, 1.25)  # words per second for this narrator/chapter
+        length = int(rng.uniform(20, 60) * 60 * rate)
+        chapter_words = ["chapter", str(chapter)] + [rng.choice(vocab) for _ in range(length)]
+        for i, word in enumerate(chapter_words):
+            token = word + ("." if i % 15 == 14 else "")
+            words.append((char, ts, rate, token))
+            parts.append(token)
+            char += len(token) + 1
+            ts += 1.0 / rate
+    return " ".join(parts), words, chapter_starts, ts
+
+
+def make_transcriber(words, rng, error_rate):
+    times = [w[1] for w in words]
+    vocab = sorted({w[3].rstrip(".") for w in words[:5000]})
+
+    def transcribe(start, duration):
+        import bisect
+        lo = bisect.bisect_left(times, start)
+        hi = bisect.bisect_left(times, start + duration)
+        # One segment per sentence, like Whisper
+        segments = []
+        bounds = [lo] + [i + 1 for i in range(lo, hi) if words[i][3].endswith(".")] + [hi]
+        for a, b in zip(bounds, bounds[1:]):
+            if a >= b:
+                continue
+            group = words[a:b]
+            text = " ".join(rng.choice(vocab) if rng.random() < error_rate else w[3] for w in group)
+            segments.append({
+                "start": group[0][1] - start,
+                "end": group[-1][1] + 1.0 / group[-1][2] - start,
+                "text": text,
+            })
+        return segments
+    return transcribe
+
+
+def position_errors(alignment_map, words, text, total_duration, step=15.0):
+    import bisect
+    times = [w[1] for w in words]
+    chars_per_second = len(text) / total_duration
+    errors = []
+    t = 0.0
+    while t < total_duration:
+        idx = max(0, bisect.bisect_right(times, t) - 1)
+        estimated = AlignmentService._char_at_time(alignment_map, t)
+        errors.append(abs(estimated - words[idx][0]) / chars_per_second)
+        t += step
+    errors.sort()
+    return {
+        "mean": statistics.mean(errors),
+        "p95": errors[int(len(errors) * 0.95)],
+        "max": errors[-1],
+    }
+
+
+def run_mode(name, service, polisher, text, words, total_duration, windows, find_gaps, rtf, seed, error_rate):
+    transcribe = make_transcriber(words, random.Random(seed), error_rate)
+    start = time.perf_counter()
+    segments, windows = run_sparse_transcription(
+        transcribe, windows, total_duration, window_seconds=windows[0][1] - windows[0][0], find_gaps=find_gaps
+    )
+    segments.append({"start": total_duration, "end": total_duration, "text": ""})
+    alignment_map = service._generate_alignment_map(polisher.rebuild_fragmented_sentences(segments, text), text)
+    align_seconds = time.perf_counter() - start
+
+    audio_seconds = sum(end - s for s, end in windows)
+    errors = position_errors(alignment_map, words, text, total_duration)
+    return {
+        "mode": name,
+        "windows": len(windows),
+        "audio_min": audio_seconds / 60,
+        "est_transcribe_min": audio_seconds * rtf / 60,
+        "align_s": align_seconds,
+        **errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=10.0)
+    parser.add_argument("--window", type=float, default=60.0)
+    parser.add_argument("--interval", type=float, default=600.0)
+    parser.add_argument("--max-error", type=float, default=30.0)
+    parser.add_argument("--rtf", type=float, default=0.3, help="Transcription real-time factor (CPU seconds per audio second)")
+    parser.add_argument("--word-error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    polisher = Polisher()
+    service = AlignmentService(None, polisher)
+    text, words, chapter_starts, total = build_corpus(args.hours, args.seed)
+    print(f"Synthetic book: {len(words):,} words, {len(chapter_starts)} chapters, {total / 3600:.1f}h")
+
+    full_windows = [(s, min(s + 45 * 60, total)) for s in range(0, int(total) + 1, 45 * 60) if s < total]
+    sparse_windows = plan_sparse_windows(total, args.window, args.interval, chapter_starts)
+    find_gaps = lambda segs, wins: service.find_sparse_gaps(segs, wins, text, max_error_seconds=args.max_error)
+
+    results = [
+        run_mode("full", service, polisher, text, words, total, full_windows, None, args.rtf, args.seed, args.word_error_rate),
+        run_mode("sparse", service, polisher, text, words, total, sparse_windows, None, args.rtf, args.seed, args.word_error_rate),
+        run_mode("sparse+densify", service, polisher, text, words, total, sparse_windows, find_gaps, args.rtf, args.seed, args.word_error_rate),
+    ]
+
+    header = f"{'mode':<16}{'windows':>8}{'audio min':>11}{'est. ASR min':>14}{'align s':>9}{'err mean s':>12}{'err p95 s':>11}{'err max s':>11}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['mode']:<16}{r['windows']:>8}{r['audio_min']:>11.0f}{r['est_transcribe_min']:>14.1f}"
+              f"{r['align_s']:>9.1f}{r['mean']:>12.1f}{r['p95']:>11.1f}{r['max']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark state lookups and writes with and without the (abs_id, client_name) index.
+
+Fills a temporary database with --books books × --clients client states, then
+times get_states_for_book() and save_state() for random books. The "indexed"
+run uses the current schema and the ON CONFLICT upsert; the "no index" run
+drops the index and writes the way save_state did before it existed
+(SELECT the row, then UPDATE it).
+
+Usage:
+    python scripts/benchmark_state_index.py --books 10000 --clients 6 --samples 2000
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import text
+
+from src.db.database_service import STATE_COLUMNS, DatabaseService
+from src.db.models import State
+
+CLIENTS = ['abs', 'kosync', 'storyteller', 'booklore', 'hardcover', 'abs_ebook']
+
+
+def populate(db, books, clients):
+    with db.db_manager.engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO books (abs_id, abs_title, status) VALUES (:abs_id, :title, 'active')"),
+            [{'abs_id': f'book-{i}', 'title': f'Book {i}'} for i in range(books)],
+        )
+        conn.execute(
+            text("INSERT INTO states (abs_id, client_name, last_updated, percentage) VALUES (:abs_id, :client, 1.0, 0.1)"),
+            [{'abs_id': f'book-{i}', 'client': client} for i in range(books) for client in clients],
+        )
+
+
+def legacy_save_state(db, state):
+    """save_state as it was before the unique index: SELECT, then UPDATE or INSERT."""
+    with db.get_session() as session:
+        existing = session.query(State).filter(
+            State.abs_id == state.abs_id,
+            State.client_name == state.client_name
+        ).first()
+        if existing:
+            for attr in STATE_COLUMNS:
+                setattr(existing, attr, getattr(state, attr))
+        else:
+            session.add(state)
+
+
+def time_calls(fn, args):
+    timings = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"  {label:<10} mean {statistics.mean(timings):7.3f} ms   p50 {statistics.median(timings):7.3f} ms   p95 {p95:7.3f} ms")
+
+
+def run(db, label, save, samples, books, clients, rng):
+    book_ids = [f'book-{rng.randrange(books)}' for _ in range(samples)]
+    writes = [State(abs_id=f'book-{rng.randrange(books)}', client_name=rng.choice(clients),
+                    last_updated=time.time(), percentage=rng.random()) for _ in range(samples)]
+
+    print(f"{label}:")
+    report('lookup', time_calls(db.get_states_for_book, book_ids))
+    report('write', time_calls(save, writes))
+    with db.db_manager.engine.connect() as conn:
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM states WHERE abs_id = 'book-1' AND client_name = 'abs'"
+        )).fetchall()
+    print(f"  plan       {' | '.join(row[-1] for row in plan)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--books', type=int, default=10000)
+    parser.add_argument('--clients', type=int, default=6, choices=range(1, len(CLIENTS) + 1))
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    clients = CLIENTS[:args.clients]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DatabaseService(str(Path(temp_dir) / 'bench.db'))
+        populate(db, args.books, clients)
+        print(f"{args.books} books × {len(clients)} clients = {args.books * len(clients)} states\n")
+
+        run(db, 'indexed (upsert)', db.save_state, args.samples, args.books, clients, random.Random(args.seed))
+
+        with db.db_manager.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_states_abs_id_client_name"))
+        run(db, 'no index (select + update)', lambda state: legacy_save_state(db, state),
+            args.samples, args.books, clients, random.Random(args.seed))
+        db.db_manager.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Check a bridge database and its blob store.
+
+Runs PRAGMA integrity_check on the SQLite file, then makes sure every blob a
+row references exists and still matches its SHA-256. Unreferenced blobs are
+reported but not treated as errors. Opens the database read-only, so it is
+safe to point at a live database or a backup.
+
+Usage:
+    python scripts/check_db_integrity.py /data/database.db [--blobs /data/blobs]
+
+Exits 1 if anything is wrong.
+"""
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.db.blob_store import BlobStore
+
+
+def check(db_path: Path, blob_root: Path) -> bool:
+    store = BlobStore(blob_root)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        problems = [row[0] for row in conn.execute("PRAGMA integrity_check") if row[0] != 'ok']
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(book_alignments)")}
+        refs = []
+        if 'blob_sha256' in columns:
+            refs = conn.execute(
+                "SELECT abs_id, blob_sha256 FROM book_alignments WHERE blob_sha256 IS NOT NULL"
+            ).fetchall()
+    finally:
+        conn.close()
+
+    if problems:
+        print(f"❌ SQLite integrity check failed for {db_path}:")
+        for problem in problems[:20]:
+            print(f"   {problem}")
+    else:
+        print(f"✅ SQLite integrity check passed for {db_path}")
+
+    bad = 0
+    for abs_id, digest in refs:
+        if not store.exists(digest):
+            print(f"❌ Missing blob {digest} (alignment for '{abs_id}')")
+            bad += 1
+        elif not store.verify(digest):
+            print(f"❌ Corrupt blob {digest} (alignment for '{abs_id}')")
+            bad += 1
+    orphans = set(store.iter_digests()) - {digest for _, digest in refs}
+    print(f"{'❌' if bad else '✅'} {len(refs) - bad}/{len(refs)} referenced blobs OK in {blob_root}"
+          f"{f', {len(orphans)} unreferenced' if orphans else ''}")
+
+    return not problems and not bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('db_path', type=Path)
+    parser.add_argument('--blobs', type=Path, help="Blob store directory (default: 'blobs' next to the database)")
+    args = parser.parse_args()
+
+    if not args.db_path.exists():
+        print(f"⚠️ Database file not found at {args.db_path}")
+        sys.exit(1)
+    ok = check(args.db_path, args.blobs or args.db_path.parent / 'blobs')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,9 @@ import os
 import requests
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
 
 from src.utils.kosync_headers import hash_kosync_key, kosync_auth_headers
 from src.utils.logging_utils import sanitize_log_data
@@ -122,9 +125,13 @@ class ABSClient:
                 for af in audio_files:
                     stream_url = f"{self.base_url}/api/items/{item_id}/file/{af['ino']}?token={self.token}"
                     # Return dict with stream URL and extension (default to mp3)
+                    # plus ino/size/mtime so downloads can be verified and transcripts reused
                     files.append({
                         "stream_url": stream_url,
-                        "ext": af.get("ext", "mp3")
+                        "ext": af.get("ext", "mp3"),
+                        "ino": af.get("ino"),
+                        "size": (af.get("metadata") or {}).get("size"),
+                        "mtime_ms": (af.get("metadata") or {}).get("mtimeMs")
                     })
                 return files
             return []
@@ -148,9 +155,8 @@ class ABSClient:
                     ext = f.get('metadata', {}).get('ext') or f.get('ext') or ""
                     ext = ext.lower().replace('.', '')
                     if ext in ['epub', 'mobi', 'pdf', 'azw3']:
-                         stream_url = f"{self.base_url}/api/items/{item_id}/file/{f['ino']}?token={self.token}"
                          ebook_files.append({
-                             "stream_url": stream_url,
+                             "stream_url": self.ebook_stream_url(item_id, f['ino']),
                              "ext": ext,
                              "ino": f['ino']
                          })
@@ -160,6 +166,10 @@ class ABSClient:
             logger.error(f"❌ Error getting ebook files: {e}")
             return []
 
+    def ebook_stream_url(self, item_id, ino):
+        """Download URL for one library file, carrying the current token."""
+        return f"{self.base_url}/api/items/{item_id}/file/{ino}?token={self.token}"
+
     def search_ebooks(self, query):
         """Search for ebooks across all book libraries."""
         if not self.is_configured(): return []
@@ -569,7 +579,18 @@ class ABSClient:
 class KoSyncClient:
     def __init__(self):
         # Configuration is now dynamic via properties
+        try:
+            self.bulk_concurrency = max(1, int(os.environ.get("KOSYNC_BULK_CONCURRENCY", 8)))
+        except ValueError:
+            self.bulk_concurrency = 8
+        try:
+            self.timeout = float(os.environ.get("KOSYNC_TIMEOUT_SECONDS", 5))
+        except ValueError:
+            self.timeout = 5.0
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, self.bulk_concurrency))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     @property
     def base_url(self):
@@ -599,6 +620,33 @@ class KoSyncClient:
             return False
         return bool(self.base_url and self.user)
 
+    def is_local_server(self):
+        """
+        True when KOSYNC_SERVER points at this bridge's own KOSync endpoints.
+
+        KOSYNC_LOCAL_MODE=true/false overrides the detection (e.g. when the
+        bridge is addressed by its container name).
+        """
+        mode = os.environ.get("KOSYNC_LOCAL_MODE", "auto").lower()
+        if mode in ('true', 'on'):
+            return True
+        if mode in ('false', 'off'):
+            return False
+
+        try:
+            parsed = urlparse(self.base_url)
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        except ValueError:
+            return False
+        local_ports = {5757}
+        if os.environ.get("KOSYNC_PORT", "").isdigit():
+            local_ports.add(int(os.environ["KOSYNC_PORT"]))
+        return (
+            parsed.hostname in ('localhost', '127.0.0.1', '::1', '0.0.0.0')
+            and port in local_ports
+            and parsed.path.rstrip('/') in ('', '/koreader')
+        )
+
     def check_connection(self):
         if not self.is_configured():
             logger.warning("⚠️ KoSync not configured (skipping)")
@@ -644,20 +692,40 @@ class KoSyncClient:
         CRITICAL FIX: Returns TUPLE (percentage, xpath_string)
         This prevents the 'cannot unpack non-iterable float' crash.
         """
+        details = self.get_progress_details(doc_id)
+        if details is None:
+            return None, None
+        return details['pct'], details['xpath']
+
+    def get_progress_details(self, doc_id):
+        """Returns {'pct', 'xpath', 'ts'} for a document, or None if unavailable."""
         headers = kosync_auth_headers(self.user, self.auth_token)
         url = f"{self.base_url}/syncs/progress/{doc_id}"
         try:
-            r = self.session.get(url, headers=headers)
+            r = self.session.get(url, headers=headers, timeout=self.timeout)
             if r.status_code == 200:
                 data = r.json()
-                pct = float(data.get('percentage', 0))
-                # Grab the raw progress string (XPath)
-                xpath = data.get('progress')
-                return pct, xpath
+                return {
+                    'pct': float(data.get('percentage', 0)),
+                    # Grab the raw progress string (XPath)
+                    'xpath': data.get('progress'),
+                    'ts': data.get('timestamp'),
+                }
         except Exception as e:
             logger.error(f"❌ Error fetching KoSync progress for doc '{doc_id}': {e}")
-            pass
-        return None, None
+        return None
+
+    def get_progress_bulk(self, doc_ids):
+        """
+        Fetch progress for many documents concurrently (at most
+        KOSYNC_BULK_CONCURRENCY requests in flight). Returns {doc_id: details or None}.
+        """
+        doc_ids = list(dict.fromkeys(d for d in doc_ids if d))
+        if not doc_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.bulk_concurrency, len(doc_ids)),
+                                thread_name_prefix="kosync-bulk") as executor:
+            return dict(zip(doc_ids, executor.map(self.get_progress_details, doc_ids)))
 
     def update_progress(self, doc_id, percentage, xpath=None):
         if not self.is_configured(): return False
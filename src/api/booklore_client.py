@@ -1,18 +1,85 @@
 import os
 import time
+import hashlib
 import logging
 from typing import Optional
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import bisect
+from difflib import SequenceMatcher
+
 import requests
 from pathlib import Path
+from rapidfuzz import fuzz, process
 
 from src.utils.logging_utils import sanitize_log_data
 from src.sync_clients.sync_client_interface import LocatorResult
 
 logger = logging.getLogger(__name__)
 
+
+class _FilenameIndex:
+    """
+    Lookup structures over the cache keys (lowercase filenames) for
+    find_book_by_filename, built once per cache change instead of scanning
+    the cache on every call. Each step returns the same key the old linear
+    scans did: the first key in cache order that matches.
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self, names, normalize):
+        self.names = names
+        self.stems = {}
+        self.stripped = {}
+        for i, name in enumerate(names):
+            self.stems.setdefault(Path(name).stem.lower(), name)
+            self.stripped.setdefault(name.replace('.epub', ''), i)
+        self.stripped_lengths = sorted({len(s) for s in self.stripped})
+        # All names in one string so "target in name" is a single find()
+        self.joined = self.SEPARATOR.join(names)
+        self.offsets = []
+        position = 0
+        for name in names:
+            self.offsets.append(position)
+            position += len(name) + 1
+        self.norms = [normalize(Path(name).stem) for name in names]
+
+    def by_stem(self, target_stem):
+        return self.stems.get(target_stem)
+
+    def by_partial(self, target_stem):
+        """First name containing target_stem, or whose '.epub'-less form is inside target_stem."""
+        best = len(self.names)
+        position = self.joined.find(target_stem)
+        if position != -1:
+            best = bisect.bisect_right(self.offsets, position) - 1
+        for length in self.stripped_lengths:
+            if length > len(target_stem):
+                break
+            for start in range(len(target_stem) - length + 1):
+                i = self.stripped.get(target_stem[start:start + length])
+                if i is not None and i < best:
+                    best = i
+        return self.names[best] if best < len(self.names) else None
+
+    def by_similarity(self, target_norm, threshold=0.90):
+        """
+        Name whose normalized stem has the highest difflib ratio above `threshold`.
+        rapidfuzz's ratio is never below difflib's, so its cutoff only drops
+        names that could not qualify; difflib then scores the survivors.
+        """
+        candidates = process.extract(target_norm, self.norms, scorer=fuzz.ratio, processor=None,
+                                     score_cutoff=threshold * 100, limit=None)
+        best_match, best_ratio = None, 0.0
+        for _, _, i in sorted(candidates, key=lambda c: c[2]):
+            ratio = SequenceMatcher(None, target_norm, self.norms[i]).ratio()
+            if ratio > threshold and ratio > best_ratio:
+                best_match, best_ratio = self.names[i], ratio
+        return best_match, best_ratio
+
+
 class BookloreClient:
     def __init__(self, database_service=None):
         raw_url = os.environ.get("BOOKLORE_SERVER", "").rstrip('/')
@@ -25,12 +92,31 @@ class BookloreClient:
         
         # In-memory cache for performance (populated from DB)
         self._book_cache = {} 
+        # Filename lookup index over _book_cache; bump _cache_version when keys change
+        self._cache_version = 0
+        self._filename_index = None
+        self._filename_index_key = None
+        # Cache version last mirrored into the ebook search index
+        self._search_index_version = None
         self._book_id_cache = {}
         self._cache_timestamp = 0
         self._last_refresh_failed = False
         self._last_refresh_attempt = 0
         self._refresh_cooldown = 300  # 5 min cooldown after failed refresh
 
+        # Incremental refresh: newest-first down to the highest id seen, with a
+        # full reconciliation every BOOKLORE_FULL_REFRESH_HOURS
+        try:
+            full_refresh_hours = float(os.environ.get("BOOKLORE_FULL_REFRESH_HOURS", "24"))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid BOOKLORE_FULL_REFRESH_HOURS value, defaulting to 24")
+            full_refresh_hours = 24.0
+        self._full_refresh_interval = full_refresh_hours * 3600
+        self._high_water_id = None
+        self._last_full_refresh = 0
+        self._refresh_stats = {'full_refreshes': 0, 'incremental_refreshes': 0, 'detail_fetches': 0}
+        self._last_refresh = {}
+
         self._token = None
         self._token_timestamp = 0
         self._token_max_age = 300
@@ -88,6 +174,7 @@ class BookloreClient:
             try:
                 db_books = self.db.get_all_booklore_books()
                 self._book_cache = {}
+                self._cache_version += 1
                 self._book_id_cache = {}
                 
                 for db_book in db_books:
@@ -114,14 +201,14 @@ class BookloreClient:
             except Exception as e:
                 logger.error(f"❌ Failed to load Booklore cache from DB: {e}")
                 self._book_cache = {}
+                self._cache_version += 1
 
     def _save_cache(self):
         """
         Save cache to DB.
-        Note: We now save individual books on update, so this is mostly a no-op 
-        or used for bulk updates/timestamp management.
+        Note: _refresh_book_cache persists rows in bulk as it goes, so this is a no-op.
         """
-        pass # Database persistence is handled atomically per book elsewhere
+        pass # Database persistence is handled by _refresh_book_cache
 
     def _get_fresh_token(self):
         if self._token and (time.time() - self._token_timestamp) < self._token_max_age:
@@ -274,30 +361,60 @@ class BookloreClient:
             return True
         return False
 
-    def _refresh_book_cache(self):
+    def _needs_full_refresh(self) -> bool:
+        if self._high_water_id is None or not self._book_id_cache:
+            return True
+        return time.time() - self._last_full_refresh >= self._full_refresh_interval
+
+    @staticmethod
+    def _numeric_id(book_id) -> Optional[int]:
+        try:
+            return int(book_id)
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _list_fingerprint(book) -> str:
+        """Short hash of the list-view fields that change when a book is edited."""
+        primary_file = book.get('primaryFile') or {}
+        metadata = book.get('metadata') or {}
+        values = [
+            primary_file.get('fileName', book.get('fileName')),
+            metadata.get('title') or book.get('title'),
+            metadata.get('authors'),
+            book.get('libraryId'),
+            book.get('metadataUpdatedAt') or book.get('updatedAt') or book.get('lastModified'),
+        ]
+        return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+    def _fetch_book_list(self, stop_at_id: Optional[int] = None):
         """
-        Refresh the book cache using robust pagination.
-        Fetches books in batches to ensure complete library sync.
+        Page through /api/v1/books, filtered to the target library.
+
+        With `stop_at_id`, pages are requested newest first (highest id) and
+        the walk stops at the first page reaching that id. If the server
+        doesn't honour the ordering, every page is walked instead.
+
+        Returns (books, complete), where complete means every page was read,
+        or (None, False) if a page couldn't be fetched.
         """
-        self._last_refresh_attempt = time.time()
         all_books_list = []
         page = 0
         batch_size = 200  # Reasonable chunk size
-        
-        logger.info("📚 Booklore: Starting full library scan...")
-        
+        order = "&sort=id,desc" if stop_at_id is not None else ""
+
         while True:
             # Request specific page and size
             # Note: Booklore/Spring usually expects 'page' (0-indexed) and 'size'
-            endpoint = f"/api/v1/books?page={page}&size={batch_size}"
+            endpoint = f"/api/v1/books?page={page}&size={batch_size}{order}"
             response = self._make_request("GET", endpoint)
             
             if not response or response.status_code != 200:
                 logger.error(f"❌ Booklore: Failed to fetch page {page}")
-                self._last_refresh_failed = True
-                return False
+                return None, False
 
             data = response.json()
+            self._last_refresh['pages'] += 1
             
             # Handle different response shapes (List vs Page Object)
             current_batch = []
@@ -309,6 +426,16 @@ class BookloreClient:
             
             if not current_batch:
                 break  # No more books, we are done
+            page_size = len(current_batch)
+
+            reached_mark = False
+            if stop_at_id is not None:
+                ids = [self._numeric_id(b.get('id')) for b in current_batch]
+                if None not in ids and ids == sorted(ids, reverse=True):
+                    reached_mark = ids[-1] <= stop_at_id
+                else:
+                    logger.debug("Booklore: Server ignored id ordering, reading the whole library")
+                    stop_at_id = None
             
             # Filter by libraryId if configured
             if self.target_library_id and current_batch:
@@ -330,109 +457,95 @@ class BookloreClient:
 
             all_books_list.extend(current_batch)
             logger.debug(f"Booklore: Fetched page {page} ({len(current_batch)} items)")
+
+            if reached_mark:
+                return all_books_list, False
             
             # If we got fewer items than requested, we are on the last page
             # Also break if we got MORE items than requested (server ignored size param)
-            if len(current_batch) != batch_size:
+            # (Compare the unfiltered page: the library filter can shorten a full page)
+            if page_size != batch_size:
                 break
                 
             page += 1
 
-        if not all_books_list:
+        return all_books_list, True
+
+    def _refresh_book_cache(self, full: Optional[bool] = None):
+        """
+        Refresh the book cache.
+
+        A full refresh reads every page, prunes books that are gone or were
+        replaced, and fetches details for new books and for books whose list
+        entry changed. It runs on first use and then every
+        BOOKLORE_FULL_REFRESH_HOURS. In between, refreshes are incremental:
+        they read newest-first only down to the highest id already seen, so
+        only books added since are fetched.
+        """
+        self._last_refresh_attempt = time.time()
+        started = time.monotonic()
+        if full is None:
+            full = self._needs_full_refresh()
+        high_water_id = None if full else self._high_water_id
+        self._last_refresh = {'mode': 'full' if full else 'incremental', 'pages': 0, 'listed': 0,
+                              'new': 0, 'modified': 0, 'pruned': 0, 'detail_fetches': 0}
+
+        if full:
+            logger.info("📚 Booklore: Starting full library scan...")
+        else:
+            logger.debug(f"Booklore: Checking for books added since id {high_water_id}")
+
+        all_books_list, complete = self._fetch_book_list(stop_at_id=high_water_id)
+        if all_books_list is None:
+            self._last_refresh_failed = True
+            return False
+        # A complete listing (e.g. the server ignored the ordering) is always reconciled
+        full = complete
+        self._last_refresh['mode'] = 'full' if full else 'incremental'
+        self._last_refresh['listed'] = len(all_books_list)
+
+        if not all_books_list and full:
             logger.debug("Booklore: No books found in library")
             self._book_cache = {}
+            self._cache_version += 1
             self._book_id_cache = {}
-            self._cache_timestamp = time.time()
-            self._save_cache() # No-op now
-            self._last_refresh_failed = False
+            self._high_water_id = None
+            self._finish_refresh(full, started)
             return True
 
-        logger.info(f"📚 Booklore: Scan complete. Found {len(all_books_list)} total books.")
+        if full:
+            logger.info(f"📚 Booklore: Scan complete. Found {len(all_books_list)} total books.")
 
         # --- Pruning Stale Data ---
-        if self.db and all_books_list:
+        if full and self.db and all_books_list:
             # 1. Map valid IDs to their live data for strict verification
             live_map = {str(b['id']): b for b in all_books_list if b.get('id')}
-            
-            # 2. Check existing cache for ghosts
-            cached_filenames = list(self._book_cache.keys())
-            stale_count = 0
-            
-            for fname in cached_filenames:
-                book_info = self._book_cache[fname]
-                bid = book_info.get('id')
-                
-                is_stale = False
-                
-                # Check 1: ID Validity
-                if not bid or str(bid) not in live_map:
-                    is_stale = True
-                    logger.debug(f"   Pruning {fname}: ID {bid} not in live map")
+            self._last_refresh['pruned'] = self._prune_stale_books(live_map)
+
+        # Step 2: Fetch details for new books, and on a full refresh for changed ones
+        fingerprints = {b['id']: self._list_fingerprint(b) for b in all_books_list if b.get('id') is not None}
+        new_book_ids, modified_ids, adopted = [], [], []
+        for book_id, fingerprint in fingerprints.items():
+            cached = self._book_id_cache.get(book_id)
+            if cached is None:
+                numeric = self._numeric_id(book_id)
+                if full or high_water_id is None or numeric is None or numeric > high_water_id:
+                    new_book_ids.append(book_id)
+            elif full and cached.get('listFingerprint') != fingerprint:
+                if cached.get('listFingerprint') is None:
+                    # Cached before fingerprints existed: adopt it rather than re-fetch
+                    cached['listFingerprint'] = fingerprint
+                    adopted.append(cached)
                 else:
-                    # Check 2: Content Consistency
-                    
-                    # A. Filename Check
-                    # Ideally, we compare the Live filename with the Cached filename.
-                    # Problem 1: The Live API 'List' view might return empty filenames (Live: '').
-                    # Problem 2: Cache Key 'fname' is lowercase, but real filename is in book_info['fileName'].
-                    
-                    live_book = live_map[str(bid)]
-                    raw_live_filename = live_book.get('primaryFile', {}).get('fileName', live_book.get('fileName', ''))
-                    # Clean filename to ensure we don't treat whitespace/control chars as valid names
-                    live_filename = str(raw_live_filename).strip() if raw_live_filename else ''
-                    
-                    cached_real_filename = book_info.get('fileName', fname)
-                    
-                    # Only prune if we HAVE a valid, non-empty live filename to compare against
-                    if live_filename:
-                        # Strict check: If API returns explicit filename, it must match.
-                        # We compare against the REAL cached filename (preserving case if possible)
-                        # Normalize both sides to be safe (strip)
-                        if live_filename != str(cached_real_filename).strip():
-                             is_stale = True
-                             # Use repr() to reveal any invisible characters/whitespace in debug logs
-                             logger.debug(f"   Pruning {fname}: Filename mismatch. Live: {repr(raw_live_filename)} vs Cache: {repr(cached_real_filename)}")
-                    else:
-                        # B. Fallback Title Check (if filename is missing in List View)
-                        # If titles differ significantly, it's likely a reused ID (Ghost)
-                        live_title = live_book.get('title')
-                        cached_title = book_info.get('title')
-                        
-                        if live_title and cached_title:
-                            # Normalize for safety (ignore case/whitespace/symbols)
-                            # This catches "The Book" vs "Another Book" (ID Reuse)
-                            lt_norm = self._normalize_string(live_title)
-                            ct_norm = self._normalize_string(cached_title)
-                            
-                            # Use a generous equality check to avoid false positives on minor edits
-                            if lt_norm and ct_norm and lt_norm != ct_norm:
-                                 is_stale = True
-                                 logger.debug(f"   Pruning {fname}: Title mismatch (ID Reuse?). Live: '{live_title}' vs Cache: '{cached_title}'")
-
-                if is_stale:
-                    stale_count += 1
-                    # Remove from Memory
-                    self._book_cache.pop(fname, None)
-                    if bid:
-                        self._book_id_cache.pop(bid, None)
-                    
-                    # Remove from Database
-                    try:
-                        # Use the CACHE KEY (fname) which corresponds to the database `filename` column (lowercase)
-                        self.db.delete_booklore_book(fname)
-                    except Exception as e:
-                        logger.error(f"❌ Failed to prune stale book {fname}: {e}")
-
-            if stale_count > 0:
-                logger.info(f"🧹 Booklore: Pruned {stale_count} stale books from database.")
-
-        # --- Proceed with Step 2: Detail Fetching (Same as before) ---
-        
-        # Step 2: For books not in cache, fetch details to get fileName
-        new_book_ids = [b['id'] for b in all_books_list if b['id'] not in self._book_id_cache]
-
-        if new_book_ids:
-            logger.debug(f"Booklore: Fetching details for {len(new_book_ids)} new books...")
+                    modified_ids.append(book_id)
+        self._last_refresh['new'] = len(new_book_ids)
+        self._last_refresh['modified'] = len(modified_ids)
+
+        new_rows = [self._booklore_row(info) for info in adopted]
+        failed_ids = []
+        fetch_ids = new_book_ids + modified_ids
+        if fetch_ids:
+            logger.debug(f"Booklore: Fetching details for {len(new_book_ids)} new and {len(modified_ids)} changed books...")
             token = self._get_fresh_token()
             if not token:
                 self._last_refresh_failed = True
@@ -441,29 +554,162 @@ class BookloreClient:
             def fetch_one(book_id):
                 return book_id, self._fetch_book_detail(book_id, token)
 
+            self._last_refresh['detail_fetches'] = len(fetch_ids)
             with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(fetch_one, bid): bid for bid in new_book_ids}
+                futures = {executor.submit(fetch_one, bid): bid for bid in fetch_ids}
                 for future in as_completed(futures):
+                    book_id = futures[future]
                     try:
-                        book_id, detail = future.result()
-                        if detail and isinstance(detail, dict):
-                            self._process_book_detail(detail)
+                        _, detail = future.result()
+                        if not detail or not isinstance(detail, dict):
+                            failed_ids.append(book_id)
+                            continue
+                        row = self._process_book_detail(detail, persist=False,
+                                                        list_fingerprint=fingerprints.get(book_id))
+                        if row is not None:
+                            new_rows.append(row)
                     except Exception as e:
+                        failed_ids.append(book_id)
                         logger.debug(f"Booklore: Error fetching details: {e}")
+            if failed_ids:
+                logger.warning(f"⚠️ Booklore: Could not fetch details for {len(failed_ids)} book(s), will retry on the next refresh")
 
-        # Refresh existing items from the new list
-        for book in all_books_list:
-             if book['id'] in self._book_id_cache:
-                 # Optional: Update shallow fields if needed
-                 pass
+        # Persist the whole batch in one transaction instead of one per book
+        if self.db and new_rows:
+            try:
+                self.db.save_booklore_books(new_rows)
+            except Exception as e:
+                logger.error(f"❌ Failed to persist {len(new_rows)} Booklore books to DB: {e}")
+
+        listed_ids = [n for n in (self._numeric_id(bid) for bid in fingerprints) if n is not None]
+        if len(listed_ids) == len(fingerprints) and listed_ids:
+            high_water = max(listed_ids + [high_water_id or 0])
+            # Stay below new books whose details failed, so the next incremental refresh lists them again
+            new_ids = set(new_book_ids)
+            failed_new = [self._numeric_id(bid) for bid in failed_ids if bid in new_ids]
+            if failed_new:
+                high_water = min(high_water, min(failed_new) - 1)
+            self._high_water_id = high_water
+        elif full:
+            # Ids aren't numbers: incremental refreshes can't work, stay on full ones
+            self._high_water_id = None
+
+        self._finish_refresh(full, started)
+        return True
 
-        self._cache_timestamp = time.time()
-        # self._save_cache() # DB is updated inside _process_book_detail
+    def _finish_refresh(self, full: bool, started: float):
+        now = time.time()
+        self._cache_timestamp = now
+        if full:
+            self._last_full_refresh = now
         self._last_refresh_failed = False
-        return True
+        self._last_refresh['duration_s'] = round(time.monotonic() - started, 3)
+        self._last_refresh['at'] = now
+        self._refresh_stats['full_refreshes' if full else 'incremental_refreshes'] += 1
+        self._refresh_stats['detail_fetches'] += self._last_refresh['detail_fetches']
+        self._get_filename_index()
+        if full or self._last_refresh['modified'] or self._search_index_version != self._cache_version:
+            self._update_search_index()
+        if full or self._last_refresh['detail_fetches']:
+            logger.info(f"📚 Booklore: {self._last_refresh['mode'].capitalize()} refresh done — "
+                        f"{self._last_refresh['new']} new, {self._last_refresh['modified']} changed, "
+                        f"{self._last_refresh['pruned']} pruned, {self._last_refresh['detail_fetches']} detail fetches")
+
+    def get_refresh_stats(self) -> dict:
+        """Refresh counters, including how many detail fetches each refresh made."""
+        return {
+            **self._refresh_stats,
+            'high_water_id': self._high_water_id,
+            'last_full_refresh_at': self._last_full_refresh or None,
+            'full_refresh_interval_hours': self._full_refresh_interval / 3600,
+            'last_refresh': dict(self._last_refresh),
+        }
+
+    def _prune_stale_books(self, live_map) -> int:
+        """
+        Drop cached books whose id is gone from the live library, or whose
+        filename/title no longer match (id reuse). Returns the number pruned.
+        """
+        # Check existing cache for ghosts
+        cached_filenames = list(self._book_cache.keys())
+        stale_filenames = []
+
+        for fname in cached_filenames:
+            book_info = self._book_cache[fname]
+            bid = book_info.get('id')
+
+            is_stale = False
+
+            # Check 1: ID Validity
+            if not bid or str(bid) not in live_map:
+                is_stale = True
+                logger.debug(f"   Pruning {fname}: ID {bid} not in live map")
+            else:
+                # Check 2: Content Consistency
+
+                # A. Filename Check
+                # Ideally, we compare the Live filename with the Cached filename.
+                # Problem 1: The Live API 'List' view might return empty filenames (Live: '').
+                # Problem 2: Cache Key 'fname' is lowercase, but real filename is in book_info['fileName'].
+
+                live_book = live_map[str(bid)]
+                raw_live_filename = live_book.get('primaryFile', {}).get('fileName', live_book.get('fileName', ''))
+                # Clean filename to ensure we don't treat whitespace/control chars as valid names
+                live_filename = str(raw_live_filename).strip() if raw_live_filename else ''
+
+                cached_real_filename = book_info.get('fileName', fname)
+
+                # Only prune if we HAVE a valid, non-empty live filename to compare against
+                if live_filename:
+                    # Strict check: If API returns explicit filename, it must match.
+                    # We compare against the REAL cached filename (preserving case if possible)
+                    # Normalize both sides to be safe (strip)
+                    if live_filename != str(cached_real_filename).strip():
+                         is_stale = True
+                         # Use repr() to reveal any invisible characters/whitespace in debug logs
+                         logger.debug(f"   Pruning {fname}: Filename mismatch. Live: {repr(raw_live_filename)} vs Cache: {repr(cached_real_filename)}")
+                else:
+                    # B. Fallback Title Check (if filename is missing in List View)
+                    # If titles differ significantly, it's likely a reused ID (Ghost)
+                    live_title = live_book.get('title')
+                    cached_title = book_info.get('title')
+
+                    if live_title and cached_title:
+                        # Normalize for safety (ignore case/whitespace/symbols)
+                        # This catches "The Book" vs "Another Book" (ID Reuse)
+                        lt_norm = self._normalize_string(live_title)
+                        ct_norm = self._normalize_string(cached_title)
+
+                        # Use a generous equality check to avoid false positives on minor edits
+                        if lt_norm and ct_norm and lt_norm != ct_norm:
+                             is_stale = True
+                             logger.debug(f"   Pruning {fname}: Title mismatch (ID Reuse?). Live: '{live_title}' vs Cache: '{cached_title}'")
+
+            if is_stale:
+                # Remove from Memory
+                self._book_cache.pop(fname, None)
+                self._cache_version += 1
+                if bid:
+                    self._book_id_cache.pop(bid, None)
+                # Use the CACHE KEY (fname) which corresponds to the database `filename` column (lowercase)
+                stale_filenames.append(fname)
+
+        # Remove from Database, all in one transaction
+        if stale_filenames:
+            try:
+                self.db.delete_booklore_books(stale_filenames)
+                logger.info(f"🧹 Booklore: Pruned {len(stale_filenames)} stale books from database.")
+            except Exception as e:
+                logger.error(f"❌ Failed to prune {len(stale_filenames)} stale books: {e}")
+        return len(stale_filenames)
 
-    def _process_book_detail(self, detail):
-        """Process a book detail response and add to cache."""
+    def _process_book_detail(self, detail, persist=True, list_fingerprint=None):
+        """
+        Process a book detail response and add to cache.
+        Returns the BookloreBook row for it, saved right away unless `persist`
+        is False (the caller then saves it in bulk), or None if it was skipped.
+        `list_fingerprint` is kept so a later full refresh can tell if the book changed.
+        """
         # Library ID Filter
         if self.target_library_id:
             lid = detail.get('libraryId')
@@ -499,35 +745,67 @@ class BookloreClient:
             'title': title,
             'subtitle': subtitle,
             'authors': author_str,
+            'series': metadata.get('seriesName') or '',
             'bookType': book_type,
             'epubProgress': detail.get('epubProgress'),
             'pdfProgress': detail.get('pdfProgress'),
             'cbxProgress': detail.get('cbxProgress'),
             'koreaderProgress': detail.get('koreaderProgress'),
         }
+        if list_fingerprint:
+            book_info['listFingerprint'] = list_fingerprint
 
         # Let's keep it consistent with what we see in database migration
         
+        if filename.lower() not in self._book_cache:
+            self._cache_version += 1
         self._book_cache[filename.lower()] = book_info
         self._book_id_cache[detail['id']] = book_info
 
+        b_model = self._booklore_row(book_info)
+
         # Persist to DB
-        if self.db:
+        if self.db and persist:
             try:
-                from src.db.models import BookloreBook
-                import json as pyjson
-                
-                b_model = BookloreBook(
-                    filename=filename.lower(), # Store key as lowercase filename for consistency
-                    title=title,
-                    authors=author_str,
-                    raw_metadata=pyjson.dumps(book_info)
-                )
                 self.db.save_booklore_book(b_model)
             except Exception as e:
                 logger.error(f"❌ Failed to persist book {filename} to DB: {e}")
 
-        return None
+        return b_model
+
+    @staticmethod
+    def _booklore_row(book_info):
+        """BookloreBook row for a cached book_info dict."""
+        from src.db.models import BookloreBook
+        return BookloreBook(
+            filename=book_info['fileName'].lower(), # Store key as lowercase filename for consistency
+            title=book_info.get('title'),
+            authors=book_info.get('authors'),
+            raw_metadata=json.dumps(book_info)
+        )
+
+    @staticmethod
+    def _search_doc(book_info):
+        """Ebook search index document for a cached book_info dict."""
+        return {
+            'source_id': book_info.get('id') or book_info['fileName'],
+            'title': book_info.get('title'),
+            'authors': book_info.get('authors'),
+            'series': book_info.get('series'),
+            'filename': book_info['fileName'],
+            'payload': {k: book_info.get(k) for k in ('id', 'fileName', 'filePath', 'title', 'subtitle',
+                                                      'authors', 'series', 'bookType')},
+        }
+
+    def _update_search_index(self):
+        """Mirror the cache into the ebook search index."""
+        if not self.db:
+            return
+        try:
+            self.db.search_index.replace_source('Booklore', [self._search_doc(b) for b in self._book_cache.values()])
+            self._search_index_version = self._cache_version
+        except Exception as e:
+            logger.warning(f"⚠️ Booklore: Could not update the search index: {e}")
 
     def _normalize_string(self, s):
         """Remove non-alphanumeric characters and lowercase."""
@@ -535,6 +813,14 @@ class BookloreClient:
         if not s: return ""
         return re.sub(r'[\W_]+', '', s.lower())
 
+    def _get_filename_index(self) -> _FilenameIndex:
+        """The filename index for the current cache, rebuilt when its keys changed."""
+        key = (id(self._book_cache), len(self._book_cache), self._cache_version)
+        if self._filename_index is None or self._filename_index_key != key:
+            self._filename_index = _FilenameIndex(list(self._book_cache), self._normalize_string)
+            self._filename_index_key = key
+        return self._filename_index
+
     def find_book_by_filename(self, ebook_filename, allow_refresh=True):
         """
         Find a book by its filename using exact, stem, or normalized matching.
@@ -553,38 +839,25 @@ class BookloreClient:
         if target_name in self._book_cache: return self._book_cache[target_name]
 
         target_stem = Path(ebook_filename).stem.lower()
+        index = self._get_filename_index()
         
         # 2. Strict Stem Match
-        for cached_name, book_info in list(self._book_cache.items()):
-            if Path(cached_name).stem.lower() == target_stem: return book_info
+        cached_name = index.by_stem(target_stem)
+        if cached_name is not None: return self._book_cache[cached_name]
 
         # 3. Partial Stem Match
-        for cached_name, book_info in list(self._book_cache.items()):
-            if target_stem in cached_name or cached_name.replace('.epub', '') in target_stem:
-                # High confidence check: ensure significant overlap
-                return book_info
+        cached_name = index.by_partial(target_stem)
+        if cached_name is not None: return self._book_cache[cached_name]
 
         # 4. Fuzzy / Normalized Match (Handling "Dragon's" vs "Dragons")
         # Use similarity ratio instead of substring to avoid false positives
         target_norm = self._normalize_string(target_stem)
         if len(target_norm) > 5:
-            from difflib import SequenceMatcher
-            best_match = None
-            best_ratio = 0.0
-            
-            for cached_name, book_info in list(self._book_cache.items()):
-                cached_norm = self._normalize_string(Path(cached_name).stem)
-                # Calculate similarity ratio
-                ratio = SequenceMatcher(None, target_norm, cached_norm).ratio()
-                
-                # Require high similarity (90%+) to avoid matching sequels
-                if ratio > 0.90 and ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = (cached_name, book_info)
-            
-            if best_match:
-                logger.debug(f"Fuzzy match: '{target_stem}' ~= '{best_match[0]}' (similarity: {best_ratio:.1%})")
-                return best_match[1]
+            # Require high similarity (90%+) to avoid matching sequels
+            cached_name, ratio = index.by_similarity(target_norm, threshold=0.90)
+            if cached_name is not None:
+                logger.debug(f"Fuzzy match: '{target_stem}' ~= '{cached_name}' (similarity: {ratio:.1%})")
+                return self._book_cache[cached_name]
 
         # If not found, try refreshing cache once
         if allow_refresh and time.time() - self._cache_timestamp > 60 and not self._is_refresh_on_cooldown():
@@ -600,10 +873,14 @@ class BookloreClient:
         if not self._book_cache and not self._is_refresh_on_cooldown(): self._refresh_book_cache()
         return list(self._book_cache.values())
 
+    def refresh_if_stale(self, max_age: float = 5):
+        """Refresh the book cache, and with it the search index, if it is older than `max_age` seconds."""
+        if time.time() - self._cache_timestamp > max_age and not self._is_refresh_on_cooldown(): self._refresh_book_cache()
+        if not self._book_cache and not self._is_refresh_on_cooldown(): self._refresh_book_cache()
+
     def search_books(self, search_term):
         """Search books by title, author, or filename. Returns list of matching books."""
-        if time.time() - self._cache_timestamp > 5 and not self._is_refresh_on_cooldown(): self._refresh_book_cache()
-        if not self._book_cache and not self._is_refresh_on_cooldown(): self._refresh_book_cache()
+        self.refresh_if_stale()
 
         if not search_term:
             return list(self._book_cache.values())
@@ -58,6 +58,12 @@ def _record_kosync_event(abs_id: str, title: str) -> None:
         threading.Thread(target=_kosync_debounce_loop, daemon=True).start()
 
 
+def discard_pending_event(abs_id: str) -> bool:
+    """Drop a pending debounced sync for a book. Returns True if one was queued."""
+    with _kosync_debounce_lock:
+        return _kosync_debounce.pop(abs_id, None) is not None
+
+
 def _kosync_debounce_loop() -> None:
     """Check every 10s for books that stopped receiving KoSync PUTs."""
     debounce_seconds = int(os.environ.get('ABS_SOCKET_DEBOUNCE_SECONDS', '30'))
@@ -459,10 +465,8 @@ def kosync_put_progress():
         if is_internal:
             # Internal writes (sync/reset flows) should cancel any pending user debounce
             # event for this book so we don't replay stale progress right after a reset.
-            with _kosync_debounce_lock:
-                if linked_book.abs_id in _kosync_debounce:
-                    del _kosync_debounce[linked_book.abs_id]
-                    logger.debug(f"KOSync PUT: Cleared pending debounce for internal update on '{linked_book.abs_title}'")
+            if discard_pending_event(linked_book.abs_id):
+                logger.debug(f"KOSync PUT: Cleared pending debounce for internal update on '{linked_book.abs_title}'")
         if linked_book.status == 'active' and _manager and not is_internal and instant_sync_enabled:
             logger.debug(f"KOSync PUT: Progress event recorded for '{linked_book.abs_title}'")
             _record_kosync_event(linked_book.abs_id, linked_book.abs_title)
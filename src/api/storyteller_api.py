@@ -1,10 +1,13 @@
 # [START FILE: abs-kosync-enhanced/storyteller_api.py]
 import os
 import re
+import threading
 import time
 import logging
 import requests
-from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Iterable, Tuple
 from pathlib import Path
 
 from src.utils.logging_utils import sanitize_log_data
@@ -25,8 +28,18 @@ class StorytellerAPIClient:
         self._token = None
         self._token_timestamp = 0
         self._token_max_age = 30
+        self._token_lock = threading.Lock()
+        try:
+            self.bulk_concurrency = max(1, int(os.environ.get("STORYTELLER_BULK_CONCURRENCY", 4)))
+        except ValueError:
+            self.bulk_concurrency = 4
+        # None until we know whether /api/v2/books embeds reading positions
+        self._list_includes_positions: Optional[bool] = None
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, self.bulk_concurrency))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._filename_to_book_cache = {}  # Cache filename -> book mapping
 
     def clear_cache(self):
@@ -46,6 +59,13 @@ class StorytellerAPIClient:
         if not self.username or not self.password:
             # logger.warning("Storyteller API: No credentials configured")
             return None
+        # Bulk position fetches run concurrently - only one of them should log in
+        with self._token_lock:
+            if self._token and (time.time() - self._token_timestamp) < self._token_max_age:
+                return self._token
+            return self._login()
+
+    def _login(self) -> Optional[str]:
         try:
             response = requests.post(
                 f"{self.base_url}/api/token",
@@ -100,6 +120,10 @@ class StorytellerAPIClient:
         return bool(self._get_fresh_token())
 
     def _refresh_book_cache(self) -> bool:
+        return self._fetch_book_list() is not None
+
+    def _fetch_book_list(self) -> Optional[list]:
+        """GET /api/v2/books and rebuild the title cache from it."""
         response = self._make_request("GET", "/api/v2/books")
         if response and response.status_code == 200:
             books = response.json()
@@ -112,8 +136,8 @@ class StorytellerAPIClient:
                     'title': book.get('title')
                 }
             self._cache_timestamp = time.time()
-            return True
-        return False
+            return books
+        return None
 
     def find_book_by_title(self, ebook_filename: str) -> Optional[Dict]:
         if time.time() - self._cache_timestamp > 3600: self._refresh_book_cache()
@@ -153,40 +177,88 @@ class StorytellerAPIClient:
         """
         Returns: (percentage, timestamp, href, fragment_id)
         """
+        data = self._fetch_position(book_uuid)
+        if data is not None:
+            return self._parse_position(data)
+
+        return None, None, None, None
+
+    def _fetch_position(self, book_uuid: str) -> Optional[dict]:
+        """Raw position payload for one book, or None."""
         response = self._make_request("GET", f"/api/v2/books/{book_uuid}/positions")
         if response and response.status_code == 200:
-            data = response.json()
-            locator = data.get('locator', {})
-            locations = locator.get('locations', {})
+            return response.json()
+        return None
 
-            pct = float(locations.get('totalProgression', 0))
-            ts = int(data.get('timestamp', 0))
+    @staticmethod
+    def _parse_position(data: dict) -> Tuple[Optional[float], Optional[int], Optional[str], Optional[str]]:
+        """Parse a Storyteller position payload into (percentage, timestamp, href, fragment_id)."""
+        locator = data.get('locator') or {}
+        locations = locator.get('locations') or {}
 
-            # --- EXTRACT PRECISION DATA ---
-            href = locator.get('href') # e.g. "OEBPS/Text/part0000.html"
-            fragment = None
-            if locations.get('fragments') and len(locations['fragments']) > 0:
-                fragment = locations['fragments'][0] # e.g. "id628-sentence94"
+        pct = float(locations.get('totalProgression', 0))
+        ts = int(data.get('timestamp', 0))
 
-            return pct, ts, href, fragment
+        # --- EXTRACT PRECISION DATA ---
+        href = locator.get('href') # e.g. "OEBPS/Text/part0000.html"
+        fragment = None
+        if locations.get('fragments') and len(locations['fragments']) > 0:
+            fragment = locations['fragments'][0] # e.g. "id628-sentence94"
 
-        return None, None, None, None
+        return pct, ts, href, fragment
+
+    @classmethod
+    def _position_entry(cls, book_uuid: str, data: dict, fetched_at: float) -> dict:
+        """
+        Bulk snapshot entry: exactly what get_position_details() returns for the
+        book, so a state built from the snapshot matches a per-book fetch.
+        """
+        pct, ts, href, frag = cls._parse_position(data)
+        return {'pct': pct, 'ts': ts, 'href': href, 'frag': frag, 'uuid': book_uuid, 'fetched_at': fetched_at}
+
+    def get_all_positions_bulk(self, uuids: Optional[Iterable[str]] = None) -> dict:
+        """
+        Fetch reading positions for many books at once.
+
+        Args:
+            uuids: Only fetch these books (the ones linked to an active mapping).
+                   None fetches every book in the Storyteller library.
+
+        Returns:
+            {uuid: {pct, ts, href, frag, uuid, fetched_at}}
+        """
+        wanted = set(uuids) if uuids is not None else None
+        if wanted is not None and not wanted:
+            return {}
 
-    def get_all_positions_bulk(self) -> dict:
-        """Fetch all book positions in one pass. Returns {title_lower: {pct, ts, href, frag, uuid}}"""
-        if not self._book_cache:
-            self._refresh_book_cache()
-        
         positions = {}
-        for title, book in self._book_cache.items():
-            uuid = book.get('uuid')
-            if not uuid:
-                continue
-            pct, ts, href, frag = self.get_position_details(uuid)
-            if pct is not None:
-                positions[title.lower()] = {
-                    'pct': pct, 'ts': ts, 'href': href, 'frag': frag, 'uuid': uuid
-                }
+        fetched_at = time.time()
+
+        # The book listing is one request; newer Storyteller builds embed the
+        # user's position in it, which saves one GET per book.
+        use_listing = wanted is None or (
+            self._list_includes_positions is not False and len(wanted) > self.bulk_concurrency
+        )
+        if use_listing:
+            books = self._fetch_book_list() or []
+            if wanted is None:
+                wanted = {book.get('uuid') for book in books if book.get('uuid')}
+            for book in books:
+                uuid = book.get('uuid')
+                position = book.get('position')
+                if uuid in wanted and isinstance(position, dict) and position.get('locator'):
+                    positions[uuid] = self._position_entry(uuid, position, fetched_at)
+            if books:
+                self._list_includes_positions = any('position' in book for book in books)
+
+        remaining = [uuid for uuid in wanted if uuid not in positions]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(self.bulk_concurrency, len(remaining))) as executor:
+                for uuid, data in zip(remaining, executor.map(self._fetch_position, remaining)):
+                    if data is not None:
+                        positions[uuid] = self._position_entry(uuid, data, fetched_at)
+
+        logger.debug(f"Storyteller bulk: {len(positions)}/{len(wanted)} positions ({len(remaining)} fetched individually)")
         return positions
 
     def update_position(self, book_uuid: str, percentage: float, rich_locator: LocatorResult = None) -> bool:
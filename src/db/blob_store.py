@@ -0,0 +1,133 @@
+"""
+Content-addressed on-disk store for large artifacts kept out of the SQLite file.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStore:
+    """
+    Stores byte strings under the SHA-256 of their content.
+
+    Blobs are gzip-compressed and laid out as `<root>/<first 2 hex>/<digest>.gz`,
+    so a given content is written once no matter how many rows point at it and a
+    file's name is enough to check it. Writes go through a temp file and an
+    atomic rename, so a crash never leaves a truncated blob behind.
+    """
+
+    SUFFIX = '.gz'
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{self.SUFFIX}"
+
+    def put(self, data: bytes) -> str:
+        """Store `data` (if not already present) and return its digest."""
+        digest = self.digest(data)
+        path = self.path_for(digest)
+        try:
+            # Already stored: reset its age so collect_garbage() can't take it
+            # before the row that now references it is committed
+            os.utime(path)
+            return digest
+        except FileNotFoundError:
+            pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=6))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return digest
+
+    def get(self, digest: str, verify: bool = True) -> bytes:
+        """
+        Read a blob. Raises FileNotFoundError if it is missing and ValueError
+        if its content no longer matches the digest.
+        """
+        with open(self.path_for(digest), 'rb') as f:
+            data = gzip.decompress(f.read())
+        if verify and self.digest(data) != digest:
+            raise ValueError(f"Blob {digest} is corrupt")
+        return data
+
+    def exists(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def verify(self, digest: str) -> bool:
+        """True if the blob exists, decompresses and matches its digest."""
+        try:
+            self.get(digest, verify=True)
+            return True
+        except (OSError, EOFError, ValueError):
+            return False
+
+    def delete(self, digest: str) -> bool:
+        try:
+            self.path_for(digest).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_digests(self) -> Iterator[str]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob(f"??/*{self.SUFFIX}"):
+            yield path.name[:-len(self.SUFFIX)]
+
+    def collect_garbage(self, referenced: Iterable[str], min_age_seconds: float = 3600) -> int:
+        """
+        Delete blobs no row references. Blobs younger than `min_age_seconds`
+        are kept: they may belong to a write whose row isn't committed yet.
+        """
+        keep = set(referenced)
+        cutoff = time.time() - min_age_seconds
+        removed = 0
+        for digest in list(self.iter_digests()):
+            if digest in keep:
+                continue
+            path = self.path_for(digest)
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                continue
+        if removed:
+            logger.info(f"🧹 Removed {removed} unreferenced blobs")
+        return removed
+
+    def stats(self) -> dict:
+        """Number of blobs and their size on disk."""
+        count = 0
+        total = 0
+        for digest in self.iter_digests():
+            try:
+                total += self.path_for(digest).stat().st_size
+                count += 1
+            except FileNotFoundError:
+                continue
+        return {'path': str(self.root), 'count': count, 'bytes': total}
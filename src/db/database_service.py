@@ -6,13 +6,57 @@ Direct model-based interface without dictionary conversions.
 import json
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from contextlib import contextmanager
-from .models import DatabaseManager, Book, State, Job, HardcoverDetails, Setting, KosyncDocument, PendingSuggestion, BookloreBook, Base
+from .models import DatabaseManager, Book, BookAlignment, State, Job, HardcoverDetails, Setting, KosyncDocument, PendingSuggestion, BookloreBook, Base
+from .blob_store import BlobStore
+from .read_cache import EntityCache
+from .maintenance import SQLiteMaintenance
+from .search_index import EbookSearchIndex
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+BOOK_COLUMNS = ['abs_title', 'ebook_filename', 'original_ebook_filename', 'kosync_doc_id',
+                'transcript_file', 'status', 'duration', 'sync_mode', 'transcript_source', 'storyteller_uuid',
+                'abs_ebook_item_id']
+STATE_COLUMNS = ['last_updated', 'percentage', 'timestamp', 'xpath', 'cfi']
+
+
+class UnitOfWork:
+    """
+    Stages Book and State writes and flushes them together in one transaction.
+
+    Get one from DatabaseService.unit_of_work(). Later writes for the same book
+    or (book, client) pair replace earlier ones. Nothing reaches the database
+    until commit().
+    """
+
+    def __init__(self, database_service: 'DatabaseService'):
+        self._database_service = database_service
+        self._books: Dict[str, Book] = {}
+        self._states: Dict[tuple, State] = {}
+
+    def save_book(self, book: Book) -> None:
+        self._books[book.abs_id] = book
+
+    def save_state(self, state: State) -> None:
+        self._states[(state.abs_id, state.client_name)] = state
+
+    def __len__(self):
+        return len(self._books) + len(self._states)
+
+    def commit(self) -> int:
+        """Write everything staged in one transaction. Returns the number of rows written."""
+        if not self:
+            return 0
+        books, states = list(self._books.values()), list(self._states.values())
+        self._books, self._states = {}, {}
+        with self._database_service._writing(('books', *(b.abs_id for b in books))) as session:
+            self._database_service._upsert_books(session, books)
+            self._database_service._upsert_states(session, states)
+        return len(books) + len(states)
+
 
 class DatabaseService:
     """
@@ -27,6 +71,11 @@ class DatabaseService:
         self.db_path = Path(os.path.abspath(db_path))
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_manager = DatabaseManager(str(self.db_path))
+        self.read_cache = EntityCache()
+        self.maintenance = SQLiteMaintenance(self.db_manager)
+        # Alignment maps and other large artifacts live next to the DB, not in it
+        self.blob_store = BlobStore(self.db_path.parent / 'blobs')
+        self.search_index = EbookSearchIndex(self.db_manager)
 
         # Run Alembic migrations to ensure schema is up to date
         self._run_alembic_migrations()
@@ -120,18 +169,116 @@ class DatabaseService:
         finally:
             session.close()
 
+    @contextmanager
+    def _writing(self, *targets):
+        """
+        Session for a write to cached rows. Each target is (namespace, *keys);
+        a namespace without keys is dropped entirely. Invalidation runs after
+        the commit so a concurrent read can't re-cache the old row.
+        """
+        try:
+            with self.get_session() as session:
+                yield session
+        finally:
+            for namespace, *keys in targets:
+                self.read_cache.invalidate(namespace, *keys)
+
+    @staticmethod
+    def _snapshot(row) -> Optional[dict]:
+        """Column values of a row, for the read cache."""
+        if row is None:
+            return None
+        return {attr.key: getattr(row, attr.key) for attr in row.__mapper__.column_attrs}
+
+    @staticmethod
+    def _from_snapshot(model, snapshot: Optional[dict]):
+        """Build a fresh detached instance from a cached snapshot."""
+        if snapshot is None:
+            return None
+        from sqlalchemy.orm import make_transient_to_detached
+
+        instance = model.__mapper__.class_manager.new_instance()
+        for key, value in snapshot.items():
+            setattr(instance, key, value)
+        make_transient_to_detached(instance)
+        return instance
+
+    def get_read_cache_stats(self) -> dict:
+        """Hit/miss counters of the read cache."""
+        return self.read_cache.stats()
+
+    def run_maintenance(self) -> Optional[dict]:
+        """Scheduled WAL checkpoint, ANALYZE, vacuum, blob and search cache cleanup pass. Never raises."""
+        try:
+            result = self.maintenance.run()
+            result['orphan_blobs'] = self.collect_orphan_blobs()
+            result['expired_search_results'] = self.search_index.purge_expired()
+            return result
+        except Exception as e:
+            logger.warning(f"⚠️ Database maintenance failed: {e}")
+            return None
+
+    def get_storage_stats(self) -> dict:
+        """Database/WAL size, page counts, blob store and search index sizes and the last maintenance results."""
+        return {**self.maintenance.stats(), 'blobs': self.blob_store.stats(), 'search_index': self.search_index.stats()}
+
+    # Blob store operations
+    def offload_inline_alignments(self, batch_size: int = 50) -> int:
+        """
+        Move alignment maps still stored inline in book_alignments into the
+        blob store, leaving only the reference behind. Returns rows moved.
+        """
+        with self.get_session() as session:
+            abs_ids = [abs_id for (abs_id,) in session.query(BookAlignment.abs_id).filter(
+                BookAlignment.alignment_map_json.isnot(None)
+            )]
+        if not abs_ids:
+            return 0
+
+        logger.info(f"🔄 Moving {len(abs_ids)} alignment maps out of the database...")
+        moved = 0
+        for start in range(0, len(abs_ids), batch_size):
+            with self.get_session() as session:
+                rows = session.query(BookAlignment).filter(
+                    BookAlignment.abs_id.in_(abs_ids[start:start + batch_size])
+                ).all()
+                for row in rows:
+                    try:
+                        points = json.loads(row.alignment_map_json)
+                    except (ValueError, TypeError):
+                        logger.warning(f"⚠️ Alignment for '{row.abs_id}' is not valid JSON, leaving it inline")
+                        continue
+                    data = row.alignment_map_json.encode('utf-8')
+                    row.blob_sha256 = self.blob_store.put(data)
+                    row.blob_size = len(data)
+                    row.point_count = len(points) if isinstance(points, list) else 0
+                    row.alignment_map_json = None
+                    moved += 1
+        logger.info(f"✅ Moved {moved} alignment maps to {self.blob_store.root}")
+        return moved
+
+    def collect_orphan_blobs(self, min_age_seconds: float = 3600) -> int:
+        """Delete blobs no longer referenced by any row. Returns blobs removed."""
+        with self.get_session() as session:
+            referenced = {digest for (digest,) in session.query(BookAlignment.blob_sha256).filter(
+                BookAlignment.blob_sha256.isnot(None)
+            ).distinct()}
+        return self.blob_store.collect_garbage(referenced, min_age_seconds)
+
     # Setting operations
     def get_setting(self, key: str, default: str = None) -> Optional[str]:
         """Get a setting value by key."""
-        with self.get_session() as session:
-            setting = session.query(Setting).filter(Setting.key == key).first()
-            if setting:
-                return setting.value
-            return default
+        def load():
+            with self.get_session() as session:
+                setting = session.query(Setting).filter(Setting.key == key).first()
+                return (setting.value,) if setting else None
+
+        cached = self.read_cache.get_or_load('settings', key, load)
+        return cached[0] if cached else default
 
     def set_setting(self, key: str, value: str) -> Setting:
         """Set a setting value."""
-        with self.get_session() as session:
+        with self._writing(('settings', key)) as session:
             existing = session.query(Setting).filter(Setting.key == key).first()
             if existing:
                 existing.value = str(value) if value is not None else None
@@ -155,7 +302,7 @@ class DatabaseService:
             
     def delete_setting(self, key: str) -> bool:
         """Delete a setting by key."""
-        with self.get_session() as session:
+        with self._writing(('settings', key)) as session:
             setting = session.query(Setting).filter(Setting.key == key).first()
             if setting:
                 session.delete(setting)
@@ -165,11 +312,11 @@ class DatabaseService:
     # Book operations
     def get_book(self, abs_id: str) -> Optional[Book]:
         """Get a book by its ABS ID."""
-        with self.get_session() as session:
-            book = session.query(Book).filter(Book.abs_id == abs_id).first()
-            if book:
-                session.expunge(book)  # Detach from session
-            return book
+        def load():
+            with self.get_session() as session:
+                return self._snapshot(session.query(Book).filter(Book.abs_id == abs_id).first())
+
+        return self._from_snapshot(Book, self.read_cache.get_or_load('books', abs_id, load))
 
     def get_book_by_kosync_id(self, kosync_id: str) -> Optional[Book]:
         """Get a book by its KoSync document ID."""
@@ -189,7 +336,7 @@ class DatabaseService:
 
     def create_book(self, book: Book) -> Book:
         """Create a new book from a Book model."""
-        with self.get_session() as session:
+        with self._writing(('books', book.abs_id)) as session:
             session.add(book)
             session.flush()
             session.refresh(book)
@@ -198,14 +345,12 @@ class DatabaseService:
 
     def save_book(self, book: Book) -> Book:
         """Save or update a book model."""
-        with self.get_session() as session:
+        with self._writing(('books', book.abs_id)) as session:
             existing = session.query(Book).filter(Book.abs_id == book.abs_id).first()
 
             if existing:
                 # Update existing book
-                for attr in ['abs_title', 'ebook_filename', 'original_ebook_filename', 'kosync_doc_id',
-                           'transcript_file', 'status', 'duration', 'sync_mode', 'transcript_source', 'storyteller_uuid',
-                           'abs_ebook_item_id']:
+                for attr in BOOK_COLUMNS:
                     if hasattr(book, attr):
                         setattr(existing, attr, getattr(book, attr))
                 session.flush()
@@ -225,7 +370,7 @@ class DatabaseService:
         Migrate all associated data (States, Jobs, Links) from one book ID to another.
         Used when merging an existing ebook-only entry into a new audiobook entry.
         """
-        with self.get_session() as session:
+        with self._writing(('books', old_abs_id, new_abs_id), ('kosync_documents',)) as session:
             try:
                 # Migrate Foreign Keys
                 # synchronize_session=False is required for updates on collections
@@ -247,7 +392,7 @@ class DatabaseService:
 
     def delete_book(self, abs_id: str) -> bool:
         """Delete a book and all its related data."""
-        with self.get_session() as session:
+        with self._writing(('books', abs_id), ('kosync_documents',)) as session:
             # First, unlink any kosync documents explicitly
             session.query(KosyncDocument).filter(
                 KosyncDocument.linked_abs_id == abs_id
@@ -287,6 +432,18 @@ class DatabaseService:
                 session.expunge(state)
             return states
 
+    def get_states_for_active_books(self) -> Dict[str, List[State]]:
+        """Get the states of every active book in one query, grouped by abs_id."""
+        with self.get_session() as session:
+            states = session.query(State).join(Book, Book.abs_id == State.abs_id).filter(
+                Book.status == 'active'
+            ).all()
+            grouped = {}
+            for state in states:
+                session.expunge(state)
+                grouped.setdefault(state.abs_id, []).append(state)
+            return grouped
+
     def get_all_states(self) -> List[State]:
         """Get all states."""
         with self.get_session() as session:
@@ -296,29 +453,51 @@ class DatabaseService:
             return states
 
     def save_state(self, state: State) -> State:
-        """Save or update a state model."""
+        """Save or update a state model (upsert on abs_id + client_name)."""
         with self.get_session() as session:
-            existing = session.query(State).filter(
-                State.abs_id == state.abs_id,
-                State.client_name == state.client_name
-            ).first()
-
-            if existing:
-                # Update existing state
-                for attr in ['last_updated', 'percentage', 'timestamp', 'xpath', 'cfi']:
-                    if hasattr(state, attr):
-                        setattr(existing, attr, getattr(state, attr))
-                session.flush()
-                session.refresh(existing)
-                session.expunge(existing)
-                return existing
-            else:
-                # Create new state
-                session.add(state)
-                session.flush()
-                session.refresh(state)
-                session.expunge(state)
-                return state
+            saved = session.scalars(self._state_upsert([state]).returning(State)).one()
+            session.expunge(saved)
+            return saved
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Start staging book and state writes to commit in a single transaction."""
+        return UnitOfWork(self)
+
+    @staticmethod
+    def _upsert_books(session, books: List[Book]) -> None:
+        """INSERT ... ON CONFLICT(abs_id) DO UPDATE for each book, in the caller's transaction."""
+        if not books:
+            return
+        from sqlalchemy.dialects.sqlite import insert
+
+        rows = [{'abs_id': b.abs_id, **{c: getattr(b, c) for c in BOOK_COLUMNS}} for b in books]
+        stmt = insert(Book)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Book.abs_id],
+            set_={c: stmt.excluded[c] for c in BOOK_COLUMNS},
+        )
+        session.execute(stmt, rows)
+
+    @staticmethod
+    def _state_upsert(states: List[State]):
+        """INSERT ... ON CONFLICT(abs_id, client_name) DO UPDATE for the given states."""
+        from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(State).values([{
+            'abs_id': s.abs_id,
+            'client_name': s.client_name,
+            **{c: getattr(s, c) for c in STATE_COLUMNS},
+        } for s in states])
+        return stmt.on_conflict_do_update(
+            index_elements=[State.abs_id, State.client_name],
+            set_={c: stmt.excluded[c] for c in STATE_COLUMNS},
+        )
+
+    @classmethod
+    def _upsert_states(cls, session, states: List[State]) -> None:
+        """Upsert states by (abs_id, client_name) in the caller's transaction."""
+        if states:
+            session.execute(cls._state_upsert(states))
 
     def delete_states_for_book(self, abs_id: str) -> int:
         """Delete all states for a book."""
@@ -472,17 +651,17 @@ class DatabaseService:
 
     def get_kosync_document(self, document_hash: str) -> Optional[KosyncDocument]:
         """Get a KOSync document by its hash."""
-        with self.get_session() as session:
-            doc = session.query(KosyncDocument).filter(
-                KosyncDocument.document_hash == document_hash
-            ).first()
-            if doc:
-                session.expunge(doc)
-            return doc
+        def load():
+            with self.get_session() as session:
+                return self._snapshot(session.query(KosyncDocument).filter(
+                    KosyncDocument.document_hash == document_hash
+                ).first())
+
+        return self._from_snapshot(KosyncDocument, self.read_cache.get_or_load('kosync_documents', document_hash, load))
 
     def save_kosync_document(self, doc: KosyncDocument) -> KosyncDocument:
         """Save or update a KOSync document."""
-        with self.get_session() as session:
+        with self._writing(('kosync_documents', doc.document_hash)) as session:
             doc.last_updated = datetime.utcnow()
             merged = session.merge(doc)
             session.flush()
@@ -522,7 +701,7 @@ class DatabaseService:
 
     def link_kosync_document(self, document_hash: str, abs_id: str) -> bool:
         """Link a KOSync document to an ABS book."""
-        with self.get_session() as session:
+        with self._writing(('kosync_documents', document_hash)) as session:
             doc = session.query(KosyncDocument).filter(
                 KosyncDocument.document_hash == document_hash
             ).first()
@@ -534,7 +713,7 @@ class DatabaseService:
 
     def unlink_kosync_document(self, document_hash: str) -> bool:
         """Remove the ABS book link from a KOSync document."""
-        with self.get_session() as session:
+        with self._writing(('kosync_documents', document_hash)) as session:
             doc = session.query(KosyncDocument).filter(
                 KosyncDocument.document_hash == document_hash
             ).first()
@@ -546,7 +725,7 @@ class DatabaseService:
 
     def delete_kosync_document(self, document_hash: str) -> bool:
         """Delete a KOSync document."""
-        with self.get_session() as session:
+        with self._writing(('kosync_documents', document_hash)) as session:
             doc = session.query(KosyncDocument).filter(
                 KosyncDocument.document_hash == document_hash
             ).first()
@@ -575,6 +754,34 @@ class DatabaseService:
                 session.expunge(doc)
             return docs
 
+    def get_kosync_documents_for_active_books(self, abs_ids: Optional[List[str]] = None) -> Dict[str, List[KosyncDocument]]:
+        """
+        Get the KOSync documents of all active books in one query, grouped by abs_id.
+
+        A document belongs to a book when it is linked to it or is the book's
+        kosync_doc_id. Pass abs_ids to restrict the lookup to those books.
+        """
+        from sqlalchemy import or_
+        with self.get_session() as session:
+            query = session.query(Book.abs_id, KosyncDocument).join(
+                KosyncDocument,
+                or_(
+                    KosyncDocument.linked_abs_id == Book.abs_id,
+                    KosyncDocument.document_hash == Book.kosync_doc_id,
+                ),
+            ).filter(Book.status == 'active')
+            if abs_ids is not None:
+                query = query.filter(Book.abs_id.in_(list(abs_ids)))
+
+            grouped: Dict[str, List[KosyncDocument]] = {}
+            seen = set()
+            for abs_id, doc in query.all():
+                grouped.setdefault(abs_id, []).append(doc)
+                if doc.document_hash not in seen:
+                    seen.add(doc.document_hash)
+                    session.expunge(doc)
+            return grouped
+
     def get_book_by_ebook_filename(self, filename: str) -> Optional['Book']:
         """Find a book by its ebook filename (current or original)."""
         from sqlalchemy import or_
@@ -776,6 +983,41 @@ class DatabaseService:
             logger.error(f"❌ Failed to delete Booklore book '{filename}': {e}")
             return False
 
+    def save_booklore_books(self, booklore_books: List[BookloreBook]) -> int:
+        """
+        Upsert many Booklore books by filename in one transaction.
+        Later entries for the same filename win. Returns the number of rows written.
+        """
+        rows = {b.filename: {'filename': b.filename, 'title': b.title, 'authors': b.authors,
+                             'raw_metadata': b.raw_metadata, 'last_updated': datetime.utcnow()}
+                for b in booklore_books}
+        if not rows:
+            return 0
+        from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(BookloreBook)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BookloreBook.filename],
+            set_={c: stmt.excluded[c] for c in ('title', 'authors', 'raw_metadata', 'last_updated')},
+        )
+        with self.get_session() as session:
+            session.execute(stmt, list(rows.values()))
+        return len(rows)
+
+    def delete_booklore_books(self, filenames: List[str], chunk_size: int = 500) -> int:
+        """Delete many Booklore books by exact filename in one transaction. Returns rows deleted."""
+        filenames = list(dict.fromkeys(filenames))
+        if not filenames:
+            return 0
+        deleted = 0
+        with self.get_session() as session:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(filenames), chunk_size):
+                deleted += session.query(BookloreBook).filter(
+                    BookloreBook.filename.in_(filenames[start:start + chunk_size])
+                ).delete(synchronize_session=False)
+        return deleted
+
 
 class DatabaseMigrator:
     """Handles migration from JSON files to SQLAlchemy database."""
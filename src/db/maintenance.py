@@ -0,0 +1,167 @@
+"""
+Scheduled SQLite housekeeping: WAL checkpoints, planner statistics and vacuuming.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_MODES = {0: 'none', 1: 'full', 2: 'incremental'}
+
+
+class SQLiteMaintenance:
+    """
+    Keeps a WAL-mode SQLite database small and its query plans current.
+
+    Each run:
+    - truncates the WAL with a checkpoint, but only once no commit has happened
+      for `idle_seconds`, so writers are never made to wait behind it
+    - runs `PRAGMA optimize`, and a full `ANALYZE` every `analyze_hours`
+    - reclaims free pages with an incremental vacuum once they pass
+      `vacuum_free_percent` of the file (idle only). A database created without
+      incremental auto-vacuum is converted with one full VACUUM the first time
+    """
+
+    # Don't bother vacuuming a handful of free pages
+    VACUUM_MIN_FREE_PAGES = 256
+    # Checkpoints give up quickly instead of waiting on the normal 30 s lock timeout
+    CHECKPOINT_BUSY_TIMEOUT_MS = 2000
+
+    def __init__(self, db_manager, idle_seconds: Optional[float] = None, analyze_hours: Optional[float] = None,
+                 vacuum_free_percent: Optional[float] = None):
+        self.db_manager = db_manager
+        self.engine = db_manager.engine
+        self._lock = threading.Lock()
+        self._last_commit = 0.0
+        self._last_analyze = 0.0
+        self._stats = {
+            'runs': 0,
+            'skipped_busy': 0,
+            'last_run_at': None,
+            'last_checkpoint': None,
+            'last_analyze_at': None,
+            'last_vacuum_at': None,
+            'last_vacuum_pages': None,
+        }
+        event.listen(self.engine, 'commit', self._note_commit)
+        self.configure(idle_seconds, analyze_hours, vacuum_free_percent)
+
+    def configure(self, idle_seconds: Optional[float] = None, analyze_hours: Optional[float] = None,
+                  vacuum_free_percent: Optional[float] = None):
+        """(Re)read thresholds, falling back to the environment."""
+        self.idle_seconds = self._env_float('DB_MAINTENANCE_IDLE_SECONDS', 60) if idle_seconds is None else idle_seconds
+        self.analyze_hours = self._env_float('DB_ANALYZE_INTERVAL_HOURS', 24) if analyze_hours is None else analyze_hours
+        self.vacuum_free_percent = (self._env_float('DB_VACUUM_FREE_PERCENT', 20)
+                                    if vacuum_free_percent is None else vacuum_free_percent)
+
+    @staticmethod
+    def _env_float(key: str, default: float) -> float:
+        try:
+            return float(os.environ.get(key, str(default)))
+        except (ValueError, TypeError):
+            logger.warning(f"⚠️ Invalid {key} value, defaulting to {default}")
+            return float(default)
+
+    def _note_commit(self, conn):
+        self._last_commit = time.monotonic()
+
+    def is_idle(self) -> bool:
+        return time.monotonic() - self._last_commit >= self.idle_seconds
+
+    def run(self) -> dict:
+        """Run one maintenance pass. Returns what was done."""
+        with self._lock:
+            idle = self.is_idle()
+            done = {'idle': idle, 'checkpoint': None, 'analyze': None, 'vacuum_pages': None}
+
+            full_analyze = self.analyze_hours > 0 and time.time() - self._last_analyze >= self.analyze_hours * 3600
+            done['analyze'] = 'full' if full_analyze else 'optimize'
+            self.optimize(full=full_analyze)
+
+            # Checkpoint last so it also takes in what ANALYZE and vacuum wrote
+            if idle:
+                done['vacuum_pages'] = self.vacuum_if_needed()
+                done['checkpoint'] = self.checkpoint()
+            else:
+                self._stats['skipped_busy'] += 1
+
+            self._stats['runs'] += 1
+            self._stats['last_run_at'] = time.time()
+            return done
+
+    def checkpoint(self) -> dict:
+        """PRAGMA wal_checkpoint(TRUNCATE). Returns busy flag and page counts."""
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql(f"PRAGMA busy_timeout={self.CHECKPOINT_BUSY_TIMEOUT_MS}")
+            try:
+                busy, log_pages, checkpointed = conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").one()
+            finally:
+                conn.exec_driver_sql("PRAGMA busy_timeout=30000")
+        result = {'busy': bool(busy), 'wal_pages': log_pages, 'checkpointed_pages': checkpointed, 'at': time.time()}
+        self._stats['last_checkpoint'] = result
+        if busy:
+            logger.debug("🔍 WAL checkpoint could not finish — readers still active")
+        return result
+
+    def optimize(self, full: bool = False):
+        """PRAGMA optimize, or a full ANALYZE when `full` is set."""
+        with self.engine.connect() as conn:
+            if full:
+                started = time.monotonic()
+                conn.exec_driver_sql("ANALYZE")
+                conn.commit()
+                self._last_analyze = time.time()
+                self._stats['last_analyze_at'] = self._last_analyze
+                logger.debug(f"🔍 ANALYZE finished in {time.monotonic() - started:.2f}s")
+            else:
+                conn.exec_driver_sql("PRAGMA optimize")
+                conn.commit()
+
+    def vacuum_if_needed(self) -> int:
+        """Free pages past the threshold. Returns the number of pages released."""
+        storage = self.storage_stats()
+        free_pages = storage['freelist_count']
+        if free_pages < self.VACUUM_MIN_FREE_PAGES or storage['free_percent'] < self.vacuum_free_percent:
+            return 0
+
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            if storage['auto_vacuum'] == 'incremental':
+                # Each step of the pragma frees one page; executescript steps it to completion
+                conn.connection.driver_connection.executescript("PRAGMA incremental_vacuum;")
+            else:
+                logger.info(f"🧹 Converting database to incremental auto-vacuum ({free_pages} free pages)")
+                conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.exec_driver_sql("VACUUM")
+
+        released = free_pages - self.storage_stats()['freelist_count']
+        self._stats['last_vacuum_at'] = time.time()
+        self._stats['last_vacuum_pages'] = released
+        logger.info(f"🧹 Vacuum released {released} pages")
+        return released
+
+    def storage_stats(self) -> dict:
+        """File sizes and page counts of the database."""
+        path = self.db_manager.db_path
+        with self.engine.connect() as conn:
+            page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+            page_count = conn.exec_driver_sql("PRAGMA page_count").scalar()
+            freelist_count = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+            auto_vacuum = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+        return {
+            'db_bytes': os.path.getsize(path) if os.path.exists(path) else 0,
+            'wal_bytes': os.path.getsize(f"{path}-wal") if os.path.exists(f"{path}-wal") else 0,
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'free_percent': round(100.0 * freelist_count / page_count, 1) if page_count else 0.0,
+            'auto_vacuum': AUTO_VACUUM_MODES.get(auto_vacuum, str(auto_vacuum)),
+        }
+
+    def stats(self) -> dict:
+        return {**self.storage_stats(), 'maintenance': dict(self._stats)}
@@ -2,7 +2,7 @@
 SQLAlchemy ORM models for abs-kosync-bridge database.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, ForeignKey, Numeric
+from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, ForeignKey, Numeric, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -31,7 +31,7 @@ class KosyncDocument(Base):
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Hash cache replacement fields
-    filename = Column(String(500), nullable=True)
+    filename = Column(String(500), nullable=True, index=True)
     source = Column(String(50), nullable=True)
     booklore_id = Column(String(255), nullable=True, index=True)
     mtime = Column(Float, nullable=True)
@@ -73,7 +73,7 @@ class Book(Base):
     original_ebook_filename = Column(String(500))  # NEW COLUMN
     kosync_doc_id = Column(String(255), index=True)
     transcript_file = Column(String(500))
-    status = Column(String(50), default='active')
+    status = Column(String(50), default='active', index=True)
     duration = Column(Float)  # Duration in seconds from AudioBookShelf
     sync_mode = Column(String(20), default='audiobook')  # 'audiobook' or 'ebook_only'
     transcript_source = Column(String(32), nullable=True)  # 'storyteller', 'smil', 'whisper'
@@ -151,6 +151,9 @@ class State(Base):
     State model storing sync state per book and client.
     """
     __tablename__ = 'states'
+    __table_args__ = (
+        Index('ix_states_abs_id_client_name', 'abs_id', 'client_name', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     abs_id = Column(String(255), ForeignKey('books.abs_id'), nullable=False)
@@ -184,6 +187,9 @@ class Job(Base):
     Job model storing job execution data for books.
     """
     __tablename__ = 'jobs'
+    __table_args__ = (
+        Index('ix_jobs_abs_id_last_attempt', 'abs_id', 'last_attempt'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     abs_id = Column(String(255), ForeignKey('books.abs_id'), nullable=False)
@@ -214,6 +220,10 @@ class PendingSuggestion(Base):
     Model for progress-triggered ebook suggestions.
     """
     __tablename__ = 'pending_suggestions'
+    __table_args__ = (
+        Index('ix_pending_suggestions_source_id_status', 'source_id', 'status'),
+        Index('ix_pending_suggestions_status_created_at', 'status', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     source = Column(String(50), default='abs')
@@ -273,19 +283,30 @@ class BookAlignment(Base):
     """
     Model for storing the computed alignment map for a book.
     Replaces legacy JSON files in transcripts/ directory.
+
+    The map itself lives in the blob store (see blob_store.py) under
+    `blob_sha256`; only rows written before that existed still carry it
+    inline in `alignment_map_json` until they are offloaded.
     """
     __tablename__ = 'book_alignments'
 
     abs_id = Column(String(255), ForeignKey('books.abs_id', ondelete='CASCADE'), primary_key=True)
-    alignment_map_json = Column(Text, nullable=False)  # JSON-encoded list of dicts or optimized structure
+    alignment_map_json = Column(Text, nullable=True)  # Legacy inline JSON, NULL once offloaded
+    blob_sha256 = Column(String(64), nullable=True, index=True)
+    blob_size = Column(Integer, nullable=True)  # Uncompressed JSON bytes
+    point_count = Column(Integer, nullable=True)
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship
     book = relationship("Book", back_populates="alignment")
 
-    def __init__(self, abs_id: str, alignment_map_json: str):
+    def __init__(self, abs_id: str, alignment_map_json: str = None, blob_sha256: str = None,
+                 blob_size: int = None, point_count: int = None):
         self.abs_id = abs_id
         self.alignment_map_json = alignment_map_json
+        self.blob_sha256 = blob_sha256
+        self.blob_size = blob_size
+        self.point_count = point_count
 
 
 class BookloreBook(Base):
@@ -337,6 +358,8 @@ class DatabaseManager:
         @event.listens_for(self.engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
+            # Only takes effect on a new file; existing databases are converted by maintenance
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
             cursor.execute("PRAGMA journal_mode=WAL")
             cursor.execute("PRAGMA synchronous=NORMAL")
             cursor.close()
@@ -0,0 +1,129 @@
+"""
+In-process read-through cache for small, hot database rows.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCache:
+    """
+    Read-through cache keyed by (namespace, key), e.g. ('books', abs_id).
+
+    Loaders return plain, immutable snapshots (column dicts, strings or None
+    for "no such row"), so nothing the caller does to a rebuilt model can
+    leak back into the cache. DatabaseService invalidates a key whenever it
+    writes that row; `ttl` bounds how long a row changed some other way can
+    be served. Oldest entries are dropped once `max_entries` is reached.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Bumped on every invalidation so a load that raced a write isn't stored
+        self._generations = {}
+        self._counters = {}
+        self.configure(enabled, ttl, max_entries)
+
+    def configure(self, enabled: Optional[bool] = None, ttl: Optional[float] = None,
+                  max_entries: Optional[int] = None):
+        """(Re)read settings, falling back to the environment, and drop all entries."""
+        if enabled is None:
+            enabled = os.environ.get("DB_READ_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+        if ttl is None:
+            try:
+                ttl = float(os.environ.get("DB_READ_CACHE_TTL_SECONDS", "60"))
+            except (ValueError, TypeError):
+                logger.warning("⚠️ Invalid DB_READ_CACHE_TTL_SECONDS value, defaulting to 60")
+                ttl = 60.0
+        if max_entries is None:
+            try:
+                max_entries = int(os.environ.get("DB_READ_CACHE_MAX_ENTRIES", "5000"))
+            except (ValueError, TypeError):
+                logger.warning("⚠️ Invalid DB_READ_CACHE_MAX_ENTRIES value, defaulting to 5000")
+                max_entries = 5000
+
+        with self._lock:
+            self.enabled = bool(enabled) and ttl > 0 and max_entries > 0
+            self.ttl = ttl
+            self.max_entries = max_entries
+            self._entries.clear()
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached snapshot for the key, calling `loader` on a miss."""
+        if not self.enabled:
+            return loader()
+
+        cache_key = (namespace, key)
+        now = time.monotonic()
+        with self._lock:
+            counters = self._counters_for(namespace)
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[1] > now:
+                counters["hits"] += 1
+                return entry[0]
+            counters["misses"] += 1
+            generation = self._generations.get(namespace, 0)
+
+        value = loader()
+
+        with self._lock:
+            if self._generations.get(namespace, 0) == generation:
+                self._entries[cache_key] = (value, now + self.ttl)
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, namespace: str, *keys: Hashable):
+        """Drop the given keys, or the whole namespace when no keys are passed."""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            counters = self._counters_for(namespace)
+            if keys:
+                for key in keys:
+                    if self._entries.pop((namespace, key), None) is not None:
+                        counters["invalidations"] += 1
+            else:
+                for cache_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[cache_key]
+                    counters["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            for namespace in {k[0] for k in self._entries}:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters per namespace plus overall totals."""
+        with self._lock:
+            namespaces = {
+                name: {**counters, "entries": sum(1 for k in self._entries if k[0] == name)}
+                for name, counters in self._counters.items()
+            }
+            hits = sum(c["hits"] for c in self._counters.values())
+            misses = sum(c["misses"] for c in self._counters.values())
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl,
+                "max_entries": self.max_entries,
+                "entries": len(self._entries),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else None,
+                "namespaces": namespaces,
+            }
+
+    def _counters_for(self, namespace: str) -> dict:
+        counters = self._counters.get(namespace)
+        if counters is None:
+            counters = self._counters[namespace] = {"hits": 0, "misses": 0, "invalidations": 0}
+        return counters
@@ -0,0 +1,207 @@
+"""
+Local full-text index of ebooks from every source (Booklore, ABS, CWA, local files).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def _squash(word: str) -> str:
+    """Lowercase a word and drop punctuation, so "Dragon's" and "Dragons" index alike."""
+    return _NON_WORD.sub('', word.lower())
+
+
+def _normalize_query(term: str) -> str:
+    return ' '.join(term.lower().split())
+
+
+class EbookSearchIndex:
+    """
+    SQLite FTS5 index over titles, authors, series and filenames.
+
+    Documents are dicts with 'source_id', 'title', 'authors', 'series',
+    'filename' and 'payload' (what search returns). Sources come in two kinds:
+
+    - snapshot sources (Booklore, local files) are replaced wholesale by
+      their refresh paths with `replace_source()`
+    - search-only sources (ABS, CWA) have no listing API; the results of each
+      remote search are kept with `store_results()` and replayed by
+      `cached_results()` for `EBOOK_SEARCH_CACHE_HOURS`
+
+    If SQLite was built without FTS5 the migration skips the table and
+    `available` is False; callers then go to the sources directly.
+    """
+
+    TABLE = 'ebook_search'
+    QUERIES_TABLE = 'ebook_search_queries'
+
+    def __init__(self, db_manager, cache_hours: Optional[float] = None):
+        self.engine = db_manager.engine
+        self._lock = threading.Lock()
+        self._available = None
+        self.configure(cache_hours)
+
+    def configure(self, cache_hours: Optional[float] = None):
+        """(Re)read the search cache lifetime, falling back to the environment."""
+        if cache_hours is None:
+            try:
+                cache_hours = float(os.environ.get('EBOOK_SEARCH_CACHE_HOURS', '6'))
+            except (ValueError, TypeError):
+                logger.warning("⚠️ Invalid EBOOK_SEARCH_CACHE_HOURS value, defaulting to 6")
+                cache_hours = 6.0
+        self.cache_seconds = max(0.0, cache_hours) * 3600
+
+    @property
+    def available(self) -> bool:
+        if self._available is None:
+            with self.engine.connect() as conn:
+                self._available = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': self.TABLE}
+                ).first() is not None
+            if not self._available:
+                logger.warning("⚠️ Ebook search index unavailable (SQLite without FTS5?), searching sources directly")
+        return self._available
+
+    @staticmethod
+    def _terms(doc: dict) -> str:
+        """Punctuation-free copies of every word, for matching across apostrophes and the like."""
+        words = ' '.join(str(doc.get(k) or '') for k in ('title', 'authors', 'series', 'filename')).split()
+        return ' '.join(w for w in (_squash(w) for w in words) if w)
+
+    def _rows(self, source: str, docs: Iterable[dict], now: float) -> List[dict]:
+        return [{
+            'source': source,
+            'source_id': str(doc['source_id']),
+            'title': doc.get('title') or '',
+            'authors': doc.get('authors') or '',
+            'series': doc.get('series') or '',
+            'filename': doc.get('filename') or '',
+            'terms': self._terms(doc),
+            'indexed_at': now,
+            'payload': json.dumps(doc.get('payload', {})),
+        } for doc in docs]
+
+    def _insert(self, conn, rows: List[dict]):
+        if rows:
+            conn.execute(text(
+                f"INSERT INTO {self.TABLE} (source, source_id, title, authors, series, filename, terms, indexed_at, payload) "
+                "VALUES (:source, :source_id, :title, :authors, :series, :filename, :terms, :indexed_at, :payload)"
+            ), rows)
+
+    def _delete(self, conn, source: str, source_ids: List[str]):
+        for start in range(0, len(source_ids), 500):
+            chunk = source_ids[start:start + 500]
+            params = {f'id{i}': sid for i, sid in enumerate(chunk)}
+            placeholders = ', '.join(f':{key}' for key in params)
+            conn.execute(text(f"DELETE FROM {self.TABLE} WHERE source = :source AND source_id IN ({placeholders})"),
+                         {'source': source, **params})
+
+    def replace_source(self, source: str, docs: Iterable[dict]) -> int:
+        """Make the index hold exactly `docs` for `source`. Returns the document count."""
+        if not self.available:
+            return 0
+        rows = self._rows(source, docs, time.time())
+        with self._lock, self.engine.begin() as conn:
+            conn.execute(text(f"DELETE FROM {self.TABLE} WHERE source = :source"), {'source': source})
+            self._insert(conn, rows)
+        logger.debug(f"Search index: {len(rows)} '{source}' documents indexed")
+        return len(rows)
+
+    def search(self, source: str, term: Optional[str], limit: Optional[int] = None) -> List[dict]:
+        """
+        Payloads of `source` documents matching `term`, in indexing order.
+
+        Every word of the term must start a word of the title, authors,
+        series or filename; a plain substring of the filename also matches.
+        An empty term returns every document of the source.
+        """
+        if not self.available:
+            return []
+        params = {'source': source, 'limit': -1 if limit is None else limit}
+        where = "source = :source"
+        if term and term.strip():
+            words = [w for w in (_squash(w) for w in term.split()) if w]
+            params['needle'] = term.lower()
+            clauses = ["instr(lower(filename), :needle) > 0"]
+            if words:
+                # Squashed words are plain alphanumerics, safe to quote as FTS phrases
+                params['match'] = ' '.join(f'"{w}"*' for w in words)
+                clauses.append(f"rowid IN (SELECT rowid FROM {self.TABLE} WHERE {self.TABLE} MATCH :match)")
+            where += f" AND ({' OR '.join(clauses)})"
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(f"SELECT payload FROM {self.TABLE} WHERE {where} ORDER BY rowid LIMIT :limit"), params
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def cached_results(self, source: str, term: str) -> Optional[List[dict]]:
+        """Payloads a recent remote search for `term` returned, or None if it must be asked again."""
+        if not self.available or not self.cache_seconds or not term:
+            return None
+        with self.engine.connect() as conn:
+            row = conn.execute(text(
+                f"SELECT result_ids FROM {self.QUERIES_TABLE} "
+                "WHERE source = :source AND query = :query AND fetched_at >= :since"
+            ), {'source': source, 'query': _normalize_query(term), 'since': time.time() - self.cache_seconds}).first()
+            if row is None:
+                return None
+            ids = json.loads(row[0])
+            params = {f'id{i}': sid for i, sid in enumerate(ids)}
+            found = dict(conn.execute(text(
+                f"SELECT source_id, payload FROM {self.TABLE} "
+                f"WHERE source = :source AND source_id IN ({', '.join(f':{key}' for key in params) or 'NULL'})"
+            ), {'source': source, **params}).fetchall())
+        if any(sid not in found for sid in ids):
+            return None
+        return [json.loads(found[sid]) for sid in ids]
+
+    def store_results(self, source: str, term: str, docs: List[dict]) -> None:
+        """Keep what a remote search for `term` returned so `cached_results()` can replay it."""
+        if not self.available or not self.cache_seconds or not term:
+            return
+        now = time.time()
+        rows = self._rows(source, docs, now)
+        with self._lock, self.engine.begin() as conn:
+            self._delete(conn, source, [row['source_id'] for row in rows])
+            self._insert(conn, rows)
+            conn.execute(text(
+                f"INSERT INTO {self.QUERIES_TABLE} (source, query, result_ids, fetched_at) "
+                "VALUES (:source, :query, :ids, :now) "
+                "ON CONFLICT(source, query) DO UPDATE SET result_ids = excluded.result_ids, fetched_at = excluded.fetched_at"
+            ), {'source': source, 'query': _normalize_query(term),
+                'ids': json.dumps([row['source_id'] for row in rows]), 'now': now})
+
+    def purge_expired(self, sources: Iterable[str] = ('ABS', 'CWA')) -> int:
+        """Drop expired search results of search-only sources. Returns documents removed."""
+        if not self.available:
+            return 0
+        since = time.time() - self.cache_seconds
+        removed = 0
+        with self._lock, self.engine.begin() as conn:
+            conn.execute(text(f"DELETE FROM {self.QUERIES_TABLE} WHERE fetched_at < :since"), {'since': since})
+            for source in sources:
+                removed += conn.execute(
+                    text(f"DELETE FROM {self.TABLE} WHERE source = :source AND indexed_at < :since"),
+                    {'source': source, 'since': since}
+                ).rowcount or 0
+        return removed
+
+    def stats(self) -> dict:
+        """Document counts per source and the number of cached remote searches."""
+        if not self.available:
+            return {'available': False}
+        with self.engine.connect() as conn:
+            counts = dict(conn.execute(text(f"SELECT source, COUNT(*) FROM {self.TABLE} GROUP BY source")).fetchall())
+            queries = conn.execute(text(f"SELECT COUNT(*) FROM {self.QUERIES_TABLE}")).scalar()
+        return {'available': True, 'documents': counts, 'cached_searches': queries}
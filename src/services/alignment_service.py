@@ -14,6 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+from sqlalchemy import and_, or_
+
 from src.db.models import BookAlignment
 from src.utils.polisher import Polisher
 from src.utils.logging_utils import time_execution
@@ -259,18 +261,22 @@ class AlignmentService:
         alignment = self._get_alignment(abs_id)
         if not alignment:
             return None
-        
-        map_points = alignment
+
+        return self._char_at_time(alignment, timestamp)
+
+    @staticmethod
+    def _char_at_time(map_points: List[Dict], timestamp: float) -> int:
+        """Interpolate the character offset for a timestamp within an alignment map."""
         target_ts = timestamp
         
-        # 2. Binary search for interval
+        # 1. Binary search for interval
         left = 0
         right = len(map_points) - 1
         
         if target_ts <= map_points[0]['ts']:
-            return self._point_char(map_points[0])
+            return AlignmentService._point_char(map_points[0])
         if target_ts >= map_points[-1]['ts']:
-            return self._point_char(map_points[-1])
+            return AlignmentService._point_char(map_points[-1])
             
         floor_idx = 0
         while left <= right:
@@ -285,12 +291,12 @@ class AlignmentService:
         if floor_idx + 1 < len(map_points):
             p2 = map_points[floor_idx + 1]
         else:
-            return self._point_char(p1)
+            return AlignmentService._point_char(p1)
             
-        # 3. Interpolate
+        # 2. Interpolate
         time_span = p2['ts'] - p1['ts']
-        p1_char = self._point_char(p1)
-        p2_char = self._point_char(p2)
+        p1_char = AlignmentService._point_char(p1)
+        p2_char = AlignmentService._point_char(p2)
         char_span = p2_char - p1_char
 
         if time_span == 0: return p1_char
@@ -486,18 +492,84 @@ class AlignmentService:
 
         return final_map
 
+    def find_sparse_gaps(self, segments: List[Dict], windows: List[Tuple[float, float]], ebook_text: str,
+                         max_error_seconds: float = 30.0, min_gap_seconds: float = 180.0) -> List[float]:
+        """
+        Decide where a sparse transcript needs more windows.
+
+        Each window is checked leave-one-out: interpolating between the map
+        points outside it should land close to where its own anchors put it.
+        When it doesn't (narration speed changed, music, skipped front matter)
+        or the window produced no anchors, the gaps on either side get a new
+        window at their midpoint.
+
+        Returns:
+            Sorted window start times to transcribe next.
+        """
+        if not segments or not windows or not ebook_text:
+            return []
+
+        rebuilt = self.polisher.rebuild_fragmented_sentences(segments, ebook_text)
+        alignment_map = self._generate_alignment_map(rebuilt, ebook_text)
+        if len(alignment_map) < 2 or alignment_map[-1]['ts'] <= 0:
+            return []
+
+        chars_per_second = len(ebook_text) / alignment_map[-1]['ts']
+        windows = sorted(windows)
+        suspect = set()
+
+        for i, (w_start, w_end) in enumerate(windows):
+            inside = [p for p in alignment_map if w_start <= p['ts'] <= w_end and 't_idx' in p]
+            if not inside:
+                suspect.add(i)
+                continue
+
+            outside = [p for p in alignment_map if p['ts'] < w_start or p['ts'] > w_end]
+            if not outside or outside[0]['ts'] > w_start:
+                # Audio and text both start at zero even if the first anchor is in this window
+                outside.insert(0, {"char": 0, "ts": 0.0})
+            if len(outside) < 2:
+                continue
+            probe = inside[len(inside) // 2]
+            predicted = self._char_at_time(outside, probe['ts'])
+            error_seconds = abs(predicted - self._point_char(probe)) / chars_per_second
+            if error_seconds > max_error_seconds:
+                suspect.add(i)
+
+        starts = set()
+        for i in suspect:
+            w_start, w_end = windows[i]
+            gaps = []
+            if i > 0:
+                gaps.append((windows[i - 1][1], w_start))
+            if i + 1 < len(windows):
+                gaps.append((w_end, windows[i + 1][0]))
+            for gap_start, gap_end in gaps:
+                if gap_end - gap_start >= min_gap_seconds:
+                    starts.add(round((gap_start + gap_end - (w_end - w_start)) / 2, 3))
+
+        if suspect:
+            logger.info(f"   📊 Sparse check: {len(suspect)}/{len(windows)} windows disagree with interpolation")
+        return sorted(starts)
+
     def _save_alignment(self, abs_id: str, alignment_map: List[Dict]):
-        """Upsert alignment to SQLite."""
+        """Write the map to the blob store and upsert its reference in SQLite."""
+        json_blob = json.dumps(alignment_map).encode('utf-8')
+        # Blob first: a row must never point at a blob that isn't there yet.
+        # A replaced blob is left for collect_orphan_blobs().
+        digest = self.database_service.blob_store.put(json_blob)
+        reference = {'blob_sha256': digest, 'blob_size': len(json_blob), 'point_count': len(alignment_map)}
+
         with self.database_service.get_session() as session:
-            json_blob = json.dumps(alignment_map)
-            
             # Check exist
             existing = session.query(BookAlignment).filter_by(abs_id=abs_id).first()
             if existing:
-                existing.alignment_map_json = json_blob
+                existing.alignment_map_json = None
+                for key, value in reference.items():
+                    setattr(existing, key, value)
                 existing.last_updated = datetime.utcnow()
             else:
-                new_align = BookAlignment(abs_id=abs_id, alignment_map_json=json_blob)
+                new_align = BookAlignment(abs_id=abs_id, **reference)
                 session.add(new_align)
             
             # Context manager handles commit
@@ -506,9 +578,35 @@ class AlignmentService:
     def _get_alignment(self, abs_id: str) -> Optional[List[Dict]]:
         with self.database_service.get_session() as session:
             entry = session.query(BookAlignment).filter_by(abs_id=abs_id).first()
-            if entry:
+            if not entry:
+                return None
+            if entry.alignment_map_json:
+                # Not yet moved to the blob store
                 return json.loads(entry.alignment_map_json)
+            digest = entry.blob_sha256
+        if not digest:
+            return None
+        try:
+            return json.loads(self.database_service.blob_store.get(digest))
+        except (OSError, EOFError, ValueError) as e:
+            logger.error(f"❌ Alignment blob for '{abs_id}' could not be read: {e}")
             return None
+
+    def get_aligned_book_ids(self, abs_ids: Optional[List[str]] = None) -> set:
+        """
+        abs_ids that have a non-empty alignment map, checked in one query
+        without decoding any maps. Optionally limited to `abs_ids`.
+        """
+        with self.database_service.get_session() as session:
+            query = session.query(BookAlignment.abs_id).filter(or_(
+                BookAlignment.point_count > 0,
+                and_(BookAlignment.alignment_map_json.isnot(None),
+                     BookAlignment.alignment_map_json.notin_(['', '[]', 'null'])),
+            ))
+            if abs_ids is not None:
+                query = query.filter(BookAlignment.abs_id.in_(list(abs_ids)))
+            return {abs_id for (abs_id,) in query.all()}
+
     def get_book_duration(self, abs_id: str) -> Optional[float]:
         """Get the total duration of the book from its alignment map."""
         alignment = self._get_alignment(abs_id)
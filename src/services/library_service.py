@@ -6,6 +6,7 @@ AudioBookShelf (ABS), Booklore (Metadata), and our local database.
 
 import logging
 import os
+from pathlib import Path
 from typing import List, Optional
 
 from src.db.models import Book
@@ -22,6 +23,8 @@ class LibraryService:
         self.cwa_client = cwa_client
         self.abs_client = abs_client
         self.epub_cache_dir = epub_cache_dir
+        # (books_dir, newest directory mtime) the local ebook index was built from
+        self._local_index_state = None
         
         if not os.path.exists(self.epub_cache_dir):
             try:
@@ -167,3 +170,109 @@ class LibraryService:
         except Exception as e:
             logger.error(f"   ❌ Library sync failed: {e}")
 
+
+    # --- Ebook search ---
+    # Answered from the local search index first; sources are only asked
+    # when the index has nothing for them. Booklore's in-memory search is
+    # always merged in, as it also matches mid-word. Snapshot sources
+    # (Booklore, local files) are brought up to date before the index is queried.
+
+    def search_booklore(self, search_term):
+        """Booklore books matching the term (same dicts as BookloreClient.search_books)."""
+        if not self.booklore or not self.booklore.is_configured():
+            return []
+        try:
+            # An incremental refresh re-indexes new and changed books
+            self.booklore.refresh_if_stale()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not refresh Booklore before searching: {e}")
+        hits = self.database_service.search_index.search('Booklore', search_term)
+        # The index only matches word prefixes; the client's in-memory search adds
+        # mid-word and punctuation-insensitive matches (and books not indexed yet)
+        seen = {hit.get('id') for hit in hits}
+        return hits + [book for book in self.booklore.search_books(search_term) or [] if book.get('id') not in seen]
+
+    def search_abs_ebooks(self, search_term):
+        """
+        ABS search results that have an ebook file, with 'ext', 'ino' and a
+        'stream_url' for the first one. Recent searches are replayed from the index.
+        """
+        if not self.abs_client or not search_term:
+            return []
+        search_index = self.database_service.search_index
+        results = search_index.cached_results('ABS', search_term)
+        if results is None:
+            results = []
+            for ab in self.abs_client.search_ebooks(search_term) or []:
+                ebook_files = self.abs_client.get_ebook_files(ab['id'])
+                if ebook_files:
+                    results.append({**ab, 'ext': ebook_files[0]['ext'], 'ino': ebook_files[0]['ino']})
+            # An empty answer may just be an outage; don't remember it
+            if results:
+                search_index.store_results('ABS', search_term, [
+                    {'source_id': r['id'], 'title': r.get('title'), 'authors': r.get('author'), 'payload': r}
+                    for r in results
+                ])
+        else:
+            logger.debug(f"ABS search for '{search_term}' answered from the search index")
+        # Tokens rotate, so stream URLs are rebuilt rather than stored
+        return [{**r, 'stream_url': self.abs_client.ebook_stream_url(r['id'], r['ino'])} for r in results]
+
+    def search_cwa(self, search_term):
+        """CWA OPDS search results (same dicts as CWAClient.search_ebooks). Recent searches are replayed from the index."""
+        if not self.cwa_client or not self.cwa_client.is_configured() or not search_term:
+            return []
+        search_index = self.database_service.search_index
+        results = search_index.cached_results('CWA', search_term)
+        if results is not None:
+            logger.debug(f"CWA search for '{search_term}' answered from the search index")
+            return results
+        results = self.cwa_client.search_ebooks(search_term) or []
+        if results:
+            search_index.store_results('CWA', search_term, [
+                {'source_id': r.get('id'), 'title': r.get('title'), 'authors': r.get('author'), 'payload': r}
+                for r in results
+            ])
+        return results
+
+    def index_local_ebooks(self, books_dir) -> int:
+        """Rescan the local ebook directory into the search index. Returns the number of EPUBs found."""
+        if not books_dir or not Path(books_dir).exists():
+            return 0
+        try:
+            # Taken before the scan, so anything added while it runs triggers another
+            state = (str(books_dir), self._tree_mtime(books_dir))
+            docs = [{'source_id': str(epub), 'filename': epub.name, 'payload': {'path': str(epub)}}
+                    for epub in Path(books_dir).rglob("*.epub")]
+            self.database_service.search_index.replace_source('Local File', docs)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not index local ebooks: {e}")
+            return 0
+        self._local_index_state = state
+        return len(docs)
+
+    @staticmethod
+    def _tree_mtime(books_dir) -> float:
+        """Newest mtime of any directory under books_dir; it moves whenever an entry is added, removed or renamed."""
+        latest = 0.0
+        for root, _, _ in os.walk(books_dir):
+            try:
+                latest = max(latest, os.stat(root).st_mtime)
+            except OSError:
+                continue
+        return latest
+
+    def search_local_ebooks(self, search_term, books_dir) -> List[Path]:
+        """Local EPUBs whose filename matches the term. Rescans the directory when its tree changed since the last scan."""
+        if not books_dir or not Path(books_dir).exists():
+            return []
+        search_index = self.database_service.search_index
+        if not search_index.available:
+            needle = (search_term or '').lower()
+            return [epub for epub in Path(books_dir).rglob("*.epub") if needle in epub.name.lower()]
+
+        if self._local_index_state != (str(books_dir), self._tree_mtime(books_dir)):
+            self.index_local_ebooks(books_dir)
+        # Skip files deleted since the last scan
+        paths = [Path(hit['path']) for hit in search_index.search('Local File', search_term)]
+        return [path for path in paths if path.exists()]
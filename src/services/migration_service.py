@@ -31,11 +31,12 @@ class MigrationService:
            
            Option A: Load the transcript into a temporary structure? No, we want unified structure.
         Migrate all legacy JSON data to database:
-        1. Transcripts/Alignments
+        1. Transcripts/Alignments (then moved out to the blob store)
         2. Booklore Cache
         3. Clean up obsolete files
         """
         self._migrate_alignments()
+        self._offload_alignment_blobs()
         self._migrate_booklore_cache()
         self._cleanup_legacy_files()
 
@@ -84,6 +85,13 @@ class MigrationService:
         except Exception as e:
             logger.error(f"❌ Migration error: {e}")
 
+    def _offload_alignment_blobs(self):
+        """Move alignment maps still stored inline in SQLite to the blob store."""
+        try:
+            self.database_service.offload_inline_alignments()
+        except Exception as e:
+            logger.error(f"❌ Alignment blob migration error: {e}")
+
     def _migrate_booklore_cache(self):
         """Migrate booklore_cache.json to booklore_books table."""
         cache_file = self.data_dir / "booklore_cache.json"
@@ -33,6 +33,15 @@ class ABSSyncClient(SyncClient):
         """Pre-fetch all ABS progress data at once."""
         return self.abs_client.get_all_progress_raw()
 
+    def bulk_fingerprint(self, book: Book, bulk_context: Optional[dict]) -> Optional[tuple]:
+        if bulk_context is None:
+            return None
+        item = bulk_context.get(book.abs_id)
+        if item is None:
+            # Not in progress on ABS
+            return ('absent',)
+        return (item.get('currentTime'), item.get('lastUpdate'), item.get('isFinished'))
+
     def get_supported_sync_types(self) -> set:
         """ABS audiobook client only syncs audiobooks."""
         return {'audiobook'}
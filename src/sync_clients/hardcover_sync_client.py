@@ -37,6 +37,10 @@ class HardcoverSyncClient(SyncClient):
         """
         return False
 
+    def bulk_fingerprint(self, book: Book, bulk_context: Optional[dict]) -> Optional[tuple]:
+        """Hardcover never reports a state, so it never holds a book back from the fast path."""
+        return ()
+
     def get_supported_sync_types(self) -> set:
         """Hardcover supports both audiobook and ebook syncing (as a follower)."""
         return {'audiobook', 'ebook'}
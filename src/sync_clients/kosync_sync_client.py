@@ -1,10 +1,12 @@
 import os
+import threading
+from datetime import datetime
 from typing import Optional
 import logging
 import re
 
 from src.api.api_clients import KoSyncClient
-from src.db.models import Book, State
+from src.db.models import Book, KosyncDocument, State
 from src.utils.ebook_utils import EbookParser
 from src.sync_clients.sync_client_interface import SyncClient, SyncResult, UpdateProgressRequest, ServiceState
 
@@ -16,11 +18,124 @@ class KoSyncSyncClient(SyncClient):
         re.IGNORECASE,
     )
 
-    def __init__(self, kosync_client: KoSyncClient, ebook_parser: EbookParser):
+    SYNC_DEVICE = "abs-sync-bot"
+
+    def __init__(self, kosync_client: KoSyncClient, ebook_parser: EbookParser, database_service=None):
         super().__init__(ebook_parser)
         self.kosync_client = kosync_client
         self.ebook_parser = ebook_parser
+        self.database_service = database_service
         self.delta_kosync_thresh = float(os.getenv("SYNC_DELTA_KOSYNC_PERCENT", 1)) / 100.0
+        # abs_id -> (doc_id, timestamp, pct) the server reported when the book last synced
+        # successfully, to spot untouched documents; _pending holds this sync's reading
+        self._seen_documents = {}
+        self._pending_documents = {}
+        self._seen_lock = threading.Lock()
+
+    def _local_mode(self) -> bool:
+        """True when KOSYNC_SERVER is this bridge, so progress lives in our own database."""
+        return self.database_service is not None and self.kosync_client.is_local_server() is True
+
+    @staticmethod
+    def _best_document_entry(docs) -> Optional[dict]:
+        """
+        Pick the document the built-in server would answer a GET with: the
+        furthest-read hash linked to the book. None if nothing has progress yet.
+        """
+        with_progress = [d for d in docs if d.percentage and float(d.percentage) > 0]
+        if not with_progress:
+            return None
+        best = max(with_progress, key=lambda d: float(d.percentage))
+        return {
+            'pct': float(best.percentage),
+            'xpath': best.progress,
+            'ts': int(best.timestamp.timestamp()) if best.timestamp else 0,
+        }
+
+    def fetch_bulk_state(self) -> Optional[dict]:
+        """
+        Progress for every active book, keyed by abs_id.
+
+        Local mode reads it in one query instead of a loopback HTTP GET per book.
+        External servers are queried concurrently; a book whose GET failed maps
+        to None so it isn't fetched a second time in the same cycle.
+        """
+        if self.database_service is None:
+            return None
+
+        if self._local_mode():
+            docs_by_book = self.database_service.get_kosync_documents_for_active_books()
+            bulk = {}
+            for abs_id, docs in docs_by_book.items():
+                entry = self._best_document_entry(docs)
+                if entry:
+                    bulk[abs_id] = entry
+            logger.debug(f"KoSync local mode: read progress for {len(bulk)} book(s) from the database")
+            self._forget_documents_except(bulk)
+            return bulk
+
+        books = [b for b in self.database_service.get_books_by_status('active') if b.kosync_doc_id]
+        if not books:
+            return {}
+        progress = self.kosync_client.get_progress_bulk([b.kosync_doc_id for b in books])
+        bulk = {book.abs_id: progress.get(book.kosync_doc_id) for book in books}
+        logger.debug(f"KoSync bulk: fetched progress for {sum(1 for v in bulk.values() if v)}/{len(bulk)} book(s)")
+        self._forget_documents_except(bulk)
+        return bulk
+
+    def bulk_fingerprint(self, book: Book, bulk_context: Optional[dict]) -> Optional[tuple]:
+        if bulk_context is None:
+            return None
+        if book.abs_id not in bulk_context:
+            # Local mode answers these through the server's state fallback,
+            # which only moves when the book itself is synced
+            return ('absent',)
+        entry = bulk_context[book.abs_id]
+        return (entry['pct'], entry['ts']) if entry else ('missing',)
+
+    def _read_progress(self, book: Book, bulk_context: Optional[dict]) -> Optional[dict]:
+        """Return {'pct', 'xpath', 'ts'}, using the cycle's bulk snapshot when it has the book."""
+        if bulk_context is not None and book.abs_id in bulk_context:
+            # None means the external server's GET already came back empty this cycle
+            return bulk_context[book.abs_id]
+        if bulk_context is None and self._local_mode():
+            docs = self.database_service.get_kosync_documents_for_active_books([book.abs_id])
+            entry = self._best_document_entry(docs.get(book.abs_id, []))
+            if entry:
+                return entry
+
+        # Nothing stored locally (let the server apply its state fallbacks) or no snapshot
+        ko_pct, ko_xpath = self.kosync_client.get_progress(book.kosync_doc_id)
+        if ko_pct is None:
+            return None
+        return {'pct': ko_pct, 'xpath': ko_xpath, 'ts': None}
+
+    def _is_unchanged(self, book: Book, entry: dict) -> bool:
+        """
+        True when the server reports the same timestamp and percentage as when
+        the book last synced successfully, i.e. nobody has touched the document since.
+        """
+        ts = entry.get('ts')
+        if ts is None or not book.kosync_doc_id:
+            return False
+        seen = (book.kosync_doc_id, ts, entry['pct'])
+        with self._seen_lock:
+            self._pending_documents[book.abs_id] = seen
+            return self._seen_documents.get(book.abs_id) == seen
+
+    def book_synced(self, book: Book) -> None:
+        """Remember this sync's reading, so the next cycle can tell whether the document moved."""
+        with self._seen_lock:
+            seen = self._pending_documents.pop(book.abs_id, None)
+            if seen is not None:
+                self._seen_documents[book.abs_id] = seen
+
+    def _forget_documents_except(self, abs_ids):
+        """Drop readings of books that are no longer active (or no longer have progress)."""
+        with self._seen_lock:
+            for seen in (self._seen_documents, self._pending_documents):
+                for abs_id in [abs_id for abs_id in seen if abs_id not in abs_ids]:
+                    del seen[abs_id]
 
     def is_configured(self) -> bool:
         return self.kosync_client.is_configured()
@@ -33,8 +148,8 @@ class KoSyncSyncClient(SyncClient):
         return {'audiobook', 'ebook'}
 
     def get_service_state(self, book: Book, prev_state: Optional[State], title_snip: str = "", bulk_context: dict = None) -> Optional[ServiceState]:
-        ko_id = book.kosync_doc_id
-        ko_pct, ko_xpath = self.kosync_client.get_progress(ko_id)
+        entry = self._read_progress(book, bulk_context)
+        ko_pct, ko_xpath = (entry['pct'], entry['xpath']) if entry else (None, None)
         if ko_xpath is None:
             logger.warning(f"⚠️ '{title_snip}' KoSync xpath is None - will use fallback text extraction")
 
@@ -46,6 +161,13 @@ class KoSyncSyncClient(SyncClient):
         prev_kosync_pct = prev_state.percentage if prev_state else 0
 
         delta = abs(ko_pct - prev_kosync_pct)
+        unchanged = self._is_unchanged(book, entry)
+        if prev_state and unchanged and 0 < delta < self.delta_kosync_thresh:
+            # A sub-threshold drift already weighed by the last successful sync:
+            # don't redo the char-delta/locator work for it. Larger deltas stay
+            # visible so a sync that failed is retried.
+            logger.debug(f"'{title_snip}' KoSync document unchanged since last cycle (ts={entry['ts']})")
+            delta = 0.0
 
         return ServiceState(
             current={"pct": ko_pct, "xpath": ko_xpath},
@@ -126,10 +248,35 @@ class KoSyncSyncClient(SyncClient):
                 updated_state={'pct': pct, 'xpath': None, 'skipped': True}
             )
 
-        success = self.kosync_client.update_progress(ko_id, pct, safe_xpath)
+        if self._local_mode() and ko_id:
+            success = self._write_local_progress(book, ko_id, pct, safe_xpath)
+        else:
+            success = self.kosync_client.update_progress(ko_id, pct, safe_xpath)
         updated_state = {
             'pct': pct,
             'xpath': safe_xpath
         }
         return SyncResult(pct, success, updated_state)
 
+    def _write_local_progress(self, book: Book, ko_id: str, pct: float, xpath: str) -> bool:
+        """Store progress the way the built-in server's PUT handler would for the sync bot."""
+        from src.api.kosync_server import discard_pending_event
+
+        try:
+            doc = self.database_service.get_kosync_document(ko_id) or KosyncDocument(document_hash=ko_id)
+            doc.progress = xpath
+            doc.percentage = pct
+            doc.device = self.SYNC_DEVICE
+            doc.device_id = self.SYNC_DEVICE
+            doc.timestamp = datetime.utcnow()
+            if not doc.linked_abs_id:
+                doc.linked_abs_id = book.abs_id
+            self.database_service.save_kosync_document(doc)
+        except Exception as e:
+            logger.error(f"❌ Failed to store local KoSync progress for '{book.abs_title}': {e}")
+            return False
+
+        # Same as an internal PUT: don't replay a stale reader event after this write
+        discard_pending_event(book.abs_id)
+        logger.debug(f"KoSync local mode: stored {pct:.2%} for '{book.abs_title}'")
+        return True
@@ -1,4 +1,5 @@
 import os
+import time
 from typing import Optional
 import logging
 
@@ -9,6 +10,9 @@ from src.sync_clients.sync_client_interface import SyncClient, LocatorResult, Sy
 logger = logging.getLogger(__name__)
 
 class StorytellerSyncClient(SyncClient):
+    # Bulk snapshot entries older than this are re-fetched per book
+    BULK_MAX_AGE_SECONDS = 120
+
     def __init__(self, storyteller_client: StorytellerAPIClient, ebook_parser: EbookParser, database_service=None):
         super().__init__(ebook_parser)
         self.storyteller_client = storyteller_client
@@ -23,8 +27,24 @@ class StorytellerSyncClient(SyncClient):
         return self.storyteller_client.check_connection()
 
     def fetch_bulk_state(self):
-        """Pre-fetch all Storyteller progress data at once."""
-        return self.storyteller_client.get_all_positions_bulk()
+        """Pre-fetch Storyteller progress for every book linked to an active mapping."""
+        uuids = None
+        if self.database_service:
+            uuids = {
+                book.storyteller_uuid for book in self.database_service.get_books_by_status('active')
+                if book.storyteller_uuid
+            }
+            if not uuids:
+                return {}
+        return self.storyteller_client.get_all_positions_bulk(uuids)
+
+    def bulk_fingerprint(self, book: Book, bulk_context: Optional[dict]) -> Optional[tuple]:
+        if not book.storyteller_uuid:
+            return ('unlinked',)
+        entry = (bulk_context or {}).get(book.storyteller_uuid)
+        if entry is None:
+            return None
+        return (entry['pct'], entry['ts'], entry['href'], entry['frag'])
 
     def get_supported_sync_types(self) -> set:
         """Storyteller participates in both audiobook and ebook sync modes."""
@@ -40,12 +60,18 @@ class StorytellerSyncClient(SyncClient):
             return None
 
         st_pct, st_ts, st_href, st_frag = None, None, None, None
-        
-        try:
-            st_pct, st_ts, st_href, st_frag = self.storyteller_client.get_position_details(uuid)
-        except Exception as e:
-            logger.warning(f"⚠️ '{title_snip}' Storyteller UUID fetch failed for '{uuid}': {e}")
-            return None
+
+        entry = (bulk_context or {}).get(uuid)
+        if entry and time.time() - entry.get('fetched_at', 0) <= self.BULK_MAX_AGE_SECONDS:
+            # Resolved from the per-cycle snapshot - no round trip for this book
+            st_pct, st_ts = entry.get('pct'), entry.get('ts')
+            st_href, st_frag = entry.get('href'), entry.get('frag')
+        else:
+            try:
+                st_pct, st_ts, st_href, st_frag = self.storyteller_client.get_position_details(uuid)
+            except Exception as e:
+                logger.warning(f"⚠️ '{title_snip}' Storyteller UUID fetch failed for '{uuid}': {e}")
+                return None
 
         # Calculate delta
         prev_storyteller_pct = prev_state.percentage if prev_state else 0
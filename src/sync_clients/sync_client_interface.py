@@ -82,6 +82,14 @@ class SyncClient:
         """
         return None
 
+    def bulk_fingerprint(self, book: Book, bulk_context: Optional[dict]) -> Optional[tuple]:
+        """
+        Cheap summary of this book's progress as reported in the bulk snapshot.
+        The sync cycle skips a book whose fingerprints match the last cycle.
+        Return None when the client can't tell without a per-book fetch.
+        """
+        return None
+
     def get_supported_sync_types(self) -> set:
         """
         Return set of sync types this client supports.
@@ -96,6 +104,13 @@ class SyncClient:
             bulk_context: Optional pre-fetched data to avoid redundant API calls
         """
         ...
+    def book_synced(self, book: Book) -> None:
+        """
+        Called after a sync of `book` finished without error, so the client can
+        keep what get_service_state() read for it. Default does nothing.
+        """
+        return None
+
     def get_text_from_current_state(self, book: Book, state: ServiceState) -> Optional[str]:
         ...
     def get_fallback_text(self, book: Book, state: ServiceState) -> Optional[str]:
@@ -5,9 +5,10 @@ import os
 import threading
 import time
 import traceback
+from dataclasses import dataclass, field
 from pathlib import Path
 import schedule
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import re
 
 import json
@@ -17,7 +18,7 @@ from src.db.models import State, Book, PendingSuggestion
 from src.sync_clients.sync_client_interface import UpdateProgressRequest, LocatorResult, ServiceState, SyncResult, SyncClient
 from src.utils.storyteller_transcript import StorytellerTranscript
 # Logging utilities (placed at top to ensure availability during sync)
-from src.utils.logging_utils import sanitize_log_data
+from src.utils.logging_utils import sanitize_log_data, ThreadLogBuffer
 
 # [NEW] Service Imports
 from src.services.alignment_service import AlignmentService
@@ -38,7 +39,21 @@ if not hasattr(root_logger, '_configured') or not root_logger._configured:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CyclePreload:
+    """States and alignment presence for all active books, read once at the start of a full cycle."""
+    states_by_book: dict = field(default_factory=dict)
+    aligned_ids: set = field(default_factory=set)
+    loaded_at: float = 0.0
+
+
 class SyncManager:
+    # Mapping fields that change what a sync would do even if no client moved
+    FINGERPRINT_BOOK_FIELDS = (
+        'sync_mode', 'ebook_filename', 'original_ebook_filename', 'kosync_doc_id',
+        'storyteller_uuid', 'abs_ebook_item_id', 'transcript_file',
+    )
+
     def __init__(self,
                  abs_client=None,
                  booklore_client=None,
@@ -80,11 +95,49 @@ class SyncManager:
             val = 1.0
         self.sync_delta_between_clients = val / 100.0
         self.delta_chars_thresh = 2000  # ~400 words
+
+        try:
+            self.sync_book_workers = max(1, int(os.getenv("SYNC_BOOK_WORKERS", 1)))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid SYNC_BOOK_WORKERS value, defaulting to 1")
+            self.sync_book_workers = 1
+        try:
+            self.client_concurrency = max(1, int(os.getenv("SYNC_CLIENT_CONCURRENCY", 4)))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid SYNC_CLIENT_CONCURRENCY value, defaulting to 4")
+            self.client_concurrency = 4
+        try:
+            self.client_timeout = max(1.0, float(os.getenv("SYNC_CLIENT_TIMEOUT_SECONDS", 15)))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid SYNC_CLIENT_TIMEOUT_SECONDS value, defaulting to 15")
+            self.client_timeout = 15.0
+        self.client_timeouts = self._parse_client_timeouts(os.getenv("SYNC_CLIENT_TIMEOUT_OVERRIDES", ""))
+        try:
+            self.fingerprint_max_age = max(0.0, float(os.getenv("SYNC_UNCHANGED_SKIP_MAX_AGE_SECONDS", 900)))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid SYNC_UNCHANGED_SKIP_MAX_AGE_SECONDS value, defaulting to 900")
+            self.fingerprint_max_age = 900.0
         self.epub_cache_dir = epub_cache_dir or (self.data_dir / "epub_cache" if self.data_dir else Path("/data/epub_cache"))
 
         self._job_queue = []
         self._job_lock = threading.Lock()
-        self._sync_lock = threading.Lock()
+        # Full cycles are serialized by _cycle_lock; each book has its own lock so
+        # instant syncs for different books run concurrently and never block the daemon.
+        self._cycle_lock = threading.Lock()
+        self._pre_cycle_lock = threading.Lock()
+        self._book_locks: dict[str, threading.Lock] = {}
+        self._book_locks_guard = threading.Lock()
+        # Caps concurrent calls into each client while books are synced in parallel
+        self._client_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        # Long-lived state fetch pools, one per client, so a hung client only ties up its own threads
+        self._client_executors: dict[str, ThreadPoolExecutor] = {}
+        # Log buffer of the running parallel cycle, so state fetches can log into their book's buffer
+        self._log_buffer = None
+        self._cycle_metrics = {}
+        # abs_id -> (fingerprint, recorded_at) of the bulk snapshot the book was last processed with
+        self._book_fingerprints: dict[str, tuple] = {}
+        # abs_id -> when something outside the full cycle last changed the book's states
+        self._states_changed_at: dict[str, float] = {}
         self._job_thread = None
         self._last_library_sync = 0
         self._suggestion_in_flight: set[str] = set()
@@ -379,39 +432,137 @@ class SyncManager:
         return None
 
 
-    def _fetch_states_parallel(self, book, prev_states_by_client, title_snip, bulk_states_per_client=None, clients_to_use=None):
-        """Fetch states from specified clients (or all if not specified) in parallel."""
-        clients_to_use = clients_to_use or self.sync_clients
-        config = {}
-        bulk_states_per_client = bulk_states_per_client or {}
+    @staticmethod
+    def _parse_client_timeouts(raw) -> dict[str, float]:
+        """Parse 'KoSync=5,Storyteller=20' into {'kosync': 5.0, 'storyteller': 20.0}."""
+        timeouts = {}
+        for part in (raw or "").split(","):
+            if not part.strip():
+                continue
+            name, _, value = part.partition("=")
+            try:
+                timeouts[name.strip().lower()] = max(1.0, float(value))
+            except ValueError:
+                logger.warning(f"⚠️ Ignoring invalid SYNC_CLIENT_TIMEOUT_OVERRIDES entry '{part.strip()}'")
+        return timeouts
+
+    def _client_timeout(self, client_name) -> float:
+        return self.client_timeouts.get(client_name.lower(), self.client_timeout)
+
+    def _client_executor(self, client_name) -> ThreadPoolExecutor:
+        """Return the long-lived executor used to fetch state from one client."""
+        with self._book_locks_guard:
+            executor = self._client_executors.get(client_name)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.client_concurrency,
+                    thread_name_prefix=f"sync-{client_name.lower().replace(' ', '-')}",
+                )
+                self._client_executors[client_name] = executor
+            return executor
+
+    def shutdown_client_executors(self, wait=False):
+        """Stop the per-client fetch pools (threads stuck in a call finish on their own)."""
+        with self._book_locks_guard:
+            executors = list(self._client_executors.values())
+            self._client_executors = {}
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _fetch_bulk_states(self):
+        """
+        Call fetch_bulk_state() on every client concurrently.
 
-        with ThreadPoolExecutor(max_workers=len(clients_to_use)) as executor:
-            futures = {}
-            for client_name, client in clients_to_use.items():
-                prev_state = prev_states_by_client.get(client_name.lower())
+        Each client has its own timeout and failures are isolated: a client that
+        errors or times out simply has no bulk context this cycle and its books
+        fall back to per-book fetches.
 
-                # Get bulk context from the unified dict
-                bulk_ctx = bulk_states_per_client.get(client_name)
+        Returns:
+            (bulk_states_per_client, seconds_per_client)
+        """
+        submitted = time.monotonic()
+        futures = {}
+        for client_name, client in self.sync_clients.items():
+            futures[client_name] = self._client_executor(client_name).submit(self._timed_call, client.fetch_bulk_state)
+
+        bulk_states, timings = {}, {}
+        for client_name, future in futures.items():
+            timeout = self._client_timeout(client_name)
+            remaining = max(0.0, submitted + timeout - time.monotonic())
+            try:
+                bulk_data, elapsed = future.result(timeout=remaining)
+                timings[client_name] = round(elapsed, 3)
+                if bulk_data:
+                    bulk_states[client_name] = bulk_data
+                    logger.debug(f"📊 Pre-fetched bulk state for {client_name} in {elapsed:.2f}s")
+            except FutureTimeoutError:
+                future.cancel()
+                timings[client_name] = None
+                logger.warning(f"⚠️ '{client_name}' bulk state fetch timed out after {timeout:.0f}s - falling back to per-book fetches")
+            except Exception as e:
+                timings[client_name] = None
+                logger.warning(f"⚠️ '{client_name}' bulk state fetch failed: {e}")
 
-                future = executor.submit(
-                    client.get_service_state, book, prev_state, title_snip, bulk_ctx
-                )
-                futures[future] = client_name
+        return bulk_states, timings
 
-            for future in as_completed(futures, timeout=15):
-                client_name = futures[future]
-                try:
-                    state = future.result()
-                    if state is not None:
-                        config[client_name] = state
-                except Exception as e:
-                    logger.warning(f"⚠️ '{client_name}' state fetch failed: {e}")
+    @staticmethod
+    def _timed_call(fn, *args):
+        started = time.monotonic()
+        return fn(*args), time.monotonic() - started
 
-        return config
+    def _fetch_states_parallel(self, book, prev_states_by_client, title_snip, bulk_states_per_client=None, clients_to_use=None):
+        """
+        Fetch states from specified clients (or all if not specified) in parallel.
 
+        Each client runs on its own long-lived executor and is given its own
+        timeout; a client that is slow or hangs is left out of this book's
+        config without delaying the others.
+        """
+        clients_to_use = clients_to_use or self.sync_clients
+        config = {}
+        bulk_states_per_client = bulk_states_per_client or {}
 
+        # A parallel cycle buffers this book's log lines; client threads must log into the same buffer
+        log_buffer = self._log_buffer
+        if log_buffer is not None and not log_buffer.is_buffering():
+            log_buffer = None
+
+        submitted = time.monotonic()
+        futures = {}
+        for client_name, client in clients_to_use.items():
+            prev_state = prev_states_by_client.get(client_name.lower())
+
+            # Get bulk context from the unified dict
+            bulk_ctx = bulk_states_per_client.get(client_name)
+
+            fetch, collect = client.get_service_state, None
+            if log_buffer is not None:
+                fetch, collect = log_buffer.hand_off(fetch)
+            futures[client_name] = (
+                self._client_executor(client_name).submit(fetch, book, prev_state, title_snip, bulk_ctx),
+                collect,
+            )
 
+        for client_name, (future, collect) in futures.items():
+            timeout = self._client_timeout(client_name)
+            remaining = max(0.0, submitted + timeout - time.monotonic())
+            timed_out = False
+            try:
+                state = future.result(timeout=remaining)
+                if state is not None:
+                    config[client_name] = state
+            except FutureTimeoutError:
+                timed_out = True
+                future.cancel()
+            except Exception as e:
+                logger.warning(f"⚠️ '{client_name}' state fetch failed: {e}")
+            finally:
+                if collect:
+                    collect(abandon=timed_out)
+            if timed_out:
+                logger.warning(f"⚠️ '{client_name}' state fetch timed out after {timeout:.0f}s for '{title_snip}' - skipping it for this book")
 
+        return config
 
     def _get_local_epub(self, ebook_filename):
         """
@@ -662,7 +813,9 @@ class SyncManager:
             # 2a. Search Booklore
             if self.booklore_client and self.booklore_client.is_configured():
                 try:
-                    bl_results = self.booklore_client.search_books(search_title)
+                    search_booklore = (self.library_service.search_booklore if self.library_service
+                                       else self.booklore_client.search_books)
+                    bl_results = search_booklore(search_title)
                     logger.debug(f"Booklore returned {len(bl_results)} results for '{search_title}'")
                     for b in bl_results:
                          # Filter for EPUBs
@@ -684,18 +837,21 @@ class SyncManager:
             if self.books_dir and self.books_dir.exists():
                 try:
                     clean_title = search_title.lower()
+                    if self.library_service:
+                        epubs = self.library_service.search_local_ebooks(search_title, self.books_dir)
+                    else:
+                        epubs = [e for e in self.books_dir.rglob("*.epub") if clean_title in e.name.lower()]
                     fs_matches = 0
-                    for epub in self.books_dir.rglob("*.epub"):
+                    for epub in epubs:
                          if epub.name in found_filenames:
                              continue
-                         if clean_title in epub.name.lower():
-                             fs_matches += 1
-                             matches.append({
-                                 "source": "filesystem",
-                                 "filename": epub.name,
-                                 "path": str(epub),
-                                 "confidence": "high"
-                             })
+                         fs_matches += 1
+                         matches.append({
+                             "source": "filesystem",
+                             "filename": epub.name,
+                             "path": str(epub),
+                             "confidence": "high"
+                         })
                     logger.debug(f"Filesystem found {fs_matches} matches")
                 except Exception as e:
                     logger.warning(f"⚠️ Filesystem search failed during suggestion: {e}")
@@ -725,7 +881,7 @@ class SyncManager:
                     query = f"{search_title}"
                     if author:
                         query += f" {author}"
-                    cwa_results = self.library_service.cwa_client.search_ebooks(query)
+                    cwa_results = self.library_service.search_cwa(query)
                     if cwa_results:
                         logger.debug(f"CWA: Found {len(cwa_results)} result(s) for '{search_title}'")
                         for cr in cwa_results:
@@ -744,23 +900,27 @@ class SyncManager:
             # 2e. ABS Search (search other libraries for matching ebook)
             if self.abs_client:
                 try:
-                    abs_results = self.abs_client.search_ebooks(search_title)
+                    if self.library_service:
+                        abs_results = self.library_service.search_abs_ebooks(search_title)
+                    else:
+                        abs_results = []
+                        for ar in self.abs_client.search_ebooks(search_title) or []:
+                            # Keep only results with ebook files
+                            result_ebooks = self.abs_client.get_ebook_files(ar['id'])
+                            if result_ebooks:
+                                abs_results.append({**ar, **result_ebooks[0]})
                     if abs_results:
                         logger.debug(f"ABS Search: Found {len(abs_results)} result(s) for '{search_title}'")
                         for ar in abs_results:
-                            # Check if this result has ebook files
-                            result_ebooks = self.abs_client.get_ebook_files(ar['id'])
-                            if result_ebooks:
-                                ef = result_ebooks[0]
-                                matches.append({
-                                    "source": "abs_search",
-                                    "title": ar.get('title'),
-                                    "author": ar.get('author'),
-                                    "filename": f"{abs_id}_abs_search.{ef['ext']}",
-                                    "stream_url": ef['stream_url'],
-                                    "ext": ef['ext'],
-                                    "confidence": "medium"
-                                })
+                            matches.append({
+                                "source": "abs_search",
+                                "title": ar.get('title'),
+                                "author": ar.get('author'),
+                                "filename": f"{abs_id}_abs_search.{ar['ext']}",
+                                "stream_url": ar['stream_url'],
+                                "ext": ar['ext'],
+                                "confidence": "medium"
+                            })
                 except Exception as e:
                     logger.warning(f"⚠️ ABS Search failed during suggestion: {e}")
             
@@ -975,11 +1135,22 @@ class SyncManager:
                 logger.info("🔄 SMIL extraction skipped/failed, falling back to Whisper transcription")
                 
                 audio_files = self.abs_client.get_audio_files(abs_id)
-                raw_transcript = self.transcriber.process_audio(
-                    abs_id, audio_files,
-                    full_book_text=book_text, # Passed for context/alignment inside transcriber if old logic used
-                    progress_callback=lambda p: update_progress(p, 2)
-                )
+                if os.getenv("TRANSCRIPTION_MODE", "full").lower() == "sparse":
+                    max_error = float(os.getenv("SPARSE_MAX_ERROR_SECONDS", "30"))
+                    raw_transcript = self.transcriber.process_audio_sparse(
+                        abs_id, audio_files,
+                        chapters=chapters,
+                        find_gaps=lambda segs, wins: self.alignment_service.find_sparse_gaps(
+                            segs, wins, book_text, max_error_seconds=max_error
+                        ),
+                        progress_callback=lambda p: update_progress(p, 2)
+                    )
+                else:
+                    raw_transcript = self.transcriber.process_audio(
+                        abs_id, audio_files,
+                        full_book_text=book_text, # Passed for context/alignment inside transcriber if old logic used
+                        progress_callback=lambda p: update_progress(p, 2)
+                    )
                 if raw_transcript:
                     transcript_source = "whisper"
             elif not storyteller_aligned:
@@ -1281,6 +1452,32 @@ class SyncManager:
                 
         return leader, leader_pct
 
+    def _get_book_lock(self, abs_id) -> threading.Lock:
+        """Return the lock guarding sync/clear operations for a single book."""
+        with self._book_locks_guard:
+            lock = self._book_locks.get(abs_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._book_locks[abs_id] = lock
+            return lock
+
+    def _client_slot(self, client_name) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent calls into one client across book workers."""
+        with self._book_locks_guard:
+            semaphore = self._client_semaphores.get(client_name)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.client_concurrency)
+                self._client_semaphores[client_name] = semaphore
+            return semaphore
+
+    def _call_client(self, client_name, fn, *args):
+        with self._client_slot(client_name):
+            return fn(*args)
+
+    def get_cycle_metrics(self) -> dict:
+        """Timing and outcome counters for the most recent full sync cycle."""
+        return dict(self._cycle_metrics)
+
     def sync_cycle(self, target_abs_id=None):
         """
         Run a sync cycle.
@@ -1289,20 +1486,18 @@ class SyncManager:
             target_abs_id: If provided, only sync this specific book (Instant Sync trigger).
                            Otherwise, sync all active books using bulk-poll optimization.
         """
-        # Prevent race condition: If daemon is running, skip. If Instant Sync, wait.
-        acquired = False
+        # Instant Sync waits (up to 10s) for its own book only, never for the daemon.
+        # Daemon: Non-blocking attempt, skip if a previous full cycle is still running.
         if target_abs_id:
-             # Instant Sync: Block and wait for lock (up to 10s)
-             acquired = self._sync_lock.acquire(timeout=10)
-             if not acquired:
-                 logger.warning(f"⚠️ Sync lock timeout for '{target_abs_id}' - skipping")
-                 return
+            lock = self._get_book_lock(target_abs_id)
+            if not lock.acquire(timeout=10):
+                logger.warning(f"⚠️ Sync lock timeout for '{target_abs_id}' - skipping")
+                return
         else:
-             # Daemon: Non-blocking attempt
-             acquired = self._sync_lock.acquire(blocking=False)
-             if not acquired:
-                 logger.debug("Sync cycle skipped - another cycle is running")
-                 return
+            lock = self._cycle_lock
+            if not lock.acquire(blocking=False):
+                logger.debug("Sync cycle skipped - another cycle is running")
+                return
 
         try:
             self._sync_cycle_internal(target_abs_id)
@@ -1311,20 +1506,38 @@ class SyncManager:
             # Log traceback for robust debugging
             logger.error(traceback.format_exc())
         finally:
-            self._sync_lock.release()
+            lock.release()
+
+    def _run_pre_cycle(self):
+        """
+        Shared work done at the start of every cycle (cache reset, library refresh).
+
+        Guarded by a short non-blocking lock: if another cycle is already doing it,
+        there is nothing to gain from waiting, so we skip straight to the books.
+        """
+        if not self._pre_cycle_lock.acquire(blocking=False):
+            logger.debug("Pre-cycle work already running in another sync - skipping")
+            return
+
+        try:
+            # Clear caches at start of cycle
+            storyteller_client = self.sync_clients.get('Storyteller')
+            if storyteller_client and hasattr(storyteller_client, 'storyteller_client'):
+                if hasattr(storyteller_client.storyteller_client, 'clear_cache'):
+                    storyteller_client.storyteller_client.clear_cache()
+
+            # Refresh Library Metadata (Booklore) — throttle to once per 15 minutes
+            if self.library_service and (time.time() - self._last_library_sync > 900):
+                self.library_service.sync_library_books()
+                # Pick up ebooks added to or removed from the local folder for search
+                self.library_service.index_local_ebooks(self.books_dir)
+                self._last_library_sync = time.time()
+        finally:
+            self._pre_cycle_lock.release()
 
     def _sync_cycle_internal(self, target_abs_id=None):
-        # Clear caches at start of cycle
-        storyteller_client = self.sync_clients.get('Storyteller')
-        if storyteller_client and hasattr(storyteller_client, 'storyteller_client'):
-            if hasattr(storyteller_client.storyteller_client, 'clear_cache'):
-                storyteller_client.storyteller_client.clear_cache()
-                
-        # Refresh Library Metadata (Booklore) — throttle to once per 15 minutes
-        if self.library_service and (time.time() - self._last_library_sync > 900):
-            self.library_service.sync_library_books()
-            self._last_library_sync = time.time()
-    
+        self._run_pre_cycle()
+
         # Get active books directly from database service
         active_books = []
         if target_abs_id:
@@ -1341,334 +1554,538 @@ class SyncManager:
         # Optimization: Pre-fetch bulk data from all clients that support it
         # Only do this if we are in a full cycle (target_abs_id is None)
         bulk_states_per_client = {}
+        bulk_fetch_seconds = {}
 
         if not target_abs_id:
             logger.debug(f"🔄 Sync cycle starting - {len(active_books)} active book(s)")
-            for client_name, client in self.sync_clients.items():
-                bulk_data = client.fetch_bulk_state()
-                if bulk_data:
-                    bulk_states_per_client[client_name] = bulk_data
-                    logger.debug(f"📊 Pre-fetched bulk state for {client_name}")
-            
+            bulk_states_per_client, bulk_fetch_seconds = self._fetch_bulk_states()
+
             # Check for suggestions
             if 'ABS' in bulk_states_per_client:
                 self.check_for_suggestions(bulk_states_per_client['ABS'], active_books)
                 
         # Main sync loop - process each active book
+        if target_abs_id:
+            # Instant Sync already holds this book's lock (see sync_cycle)
+            for book in active_books:
+                try:
+                    if self._sync_book(book, bulk_states_per_client) is not False:
+                        self._notify_book_synced(book)
+                finally:
+                    self._invalidate_book_snapshot(book.abs_id)
+            logger.debug("End of sync cycle for active books")
+            return
+
+        cycle_started = time.time()
+        outcomes = []
+        fingerprints = {}
+        pending_books = []
         for book in active_books:
-            abs_id = book.abs_id
-            logger.info(f"🔄 '{abs_id}' Syncing '{sanitize_log_data(book.abs_title or 'Unknown')}'")
-            title_snip = sanitize_log_data(book.abs_title or 'Unknown')
+            fingerprint = self._book_fingerprint(book, bulk_states_per_client)
+            if fingerprint is not None and self._fingerprint_is_current(book.abs_id, fingerprint):
+                outcomes.append(('skipped', 0.0))
+                continue
+            fingerprints[book.abs_id] = fingerprint
+            pending_books.append(book)
+        if len(pending_books) < len(active_books):
+            logger.debug(f"⏩ Skipping {len(active_books) - len(pending_books)} book(s) with no client activity since last cycle")
+
+        preload = self._preload_cycle_data() if pending_books else None
+
+        workers = max(1, min(self.sync_book_workers, len(pending_books)))
+        if workers <= 1:
+            for book in pending_books:
+                outcome, elapsed, _ = self._sync_book_if_free(book, bulk_states_per_client, preload=preload)
+                self._remember_fingerprint(book.abs_id, fingerprints[book.abs_id], outcome)
+                outcomes.append((outcome, elapsed))
+        else:
+            # Buffer each worker's log lines and replay them per book in list order,
+            # so parallel syncs read the same as sequential ones
+            log_buffer = ThreadLogBuffer()
+            log_buffer.install()
+            self._log_buffer = log_buffer
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-book") as executor:
+                    futures = [
+                        (book, executor.submit(self._sync_book_if_free, book, bulk_states_per_client, log_buffer, preload))
+                        for book in pending_books
+                    ]
+                    for book, future in futures:
+                        outcome, elapsed, records = future.result()
+                        log_buffer.replay(records)
+                        self._remember_fingerprint(book.abs_id, fingerprints[book.abs_id], outcome)
+                        outcomes.append((outcome, elapsed))
+            finally:
+                self._log_buffer = None
+                log_buffer.uninstall()
+
+        self._record_cycle_metrics(cycle_started, workers, outcomes, bulk_fetch_seconds)
+        logger.debug("End of sync cycle for active books")
 
+    def _preload_cycle_data(self):
+        """Read every active book's states and the set of aligned books in two queries."""
+        preload = CyclePreload(loaded_at=time.time())
+        try:
+            preload.states_by_book = self.database_service.get_states_for_active_books()
+            if self.alignment_service:
+                preload.aligned_ids = set(self.alignment_service.get_aligned_book_ids())
+        except Exception as e:
+            logger.warning(f"⚠️ Could not preload cycle data, falling back to per-book queries: {e}")
+            return None
+        return preload
+
+    def _invalidate_book_snapshot(self, abs_id):
+        """Forget cached per-book cycle data after a sync outside the full cycle changed the book."""
+        self._book_fingerprints.pop(abs_id, None)
+        self._states_changed_at[abs_id] = time.time()
+
+    def _clients_for_book(self, book):
+        """Sync clients that take part in this book's sync mode."""
+        sync_type = 'ebook' if (hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only') else 'audiobook'
+        return {
+            name: client for name, client in self.sync_clients.items()
+            if sync_type in client.get_supported_sync_types()
+        }
+
+    def _notify_book_synced(self, book):
+        """Tell the book's clients its sync succeeded. Caller must hold the book's lock."""
+        for client_name, client in self._clients_for_book(book).items():
             try:
-                # -----------------------------------------------------------------
-                # MIGRATION UPGRADE
-                # -----------------------------------------------------------------
-                if self.alignment_service:
-                    alignment = self.alignment_service._get_alignment(abs_id)
-                    if alignment:
-                        # [MIGRATION UPGRADE] If the book has a map but still points to a legacy file, upgrade it
-                        if (
-                            getattr(book, 'transcript_file', None) != 'DB_MANAGED'
-                            and getattr(book, 'transcript_source', None) != 'storyteller'
-                        ):
-                            logger.info(f"   🔄 Upgrading '{title_snip}' to DB_MANAGED unified architecture")
-                            book.transcript_file = 'DB_MANAGED'
-                            self.database_service.save_book(book)
+                client.book_synced(book)
+            except Exception as e:
+                logger.debug(f"'{book.abs_id}' '{client_name}' book_synced failed: {e}")
 
-                # Get previous state for this book from database
-                previous_states = self.database_service.get_states_for_book(abs_id)
+    def _book_fingerprint(self, book, bulk_states_per_client):
+        """
+        Fingerprint of everything a full cycle would look at for this book: its
+        mapping plus each client's bulk-reported progress. None when some
+        client can only be read per book, so the book can't be skipped.
+        """
+        if not self.fingerprint_max_age:
+            return None
+        parts = [tuple(getattr(book, field, None) for field in self.FINGERPRINT_BOOK_FIELDS)]
+        for client_name, client in self._clients_for_book(book).items():
+            try:
+                client_fingerprint = client.bulk_fingerprint(book, bulk_states_per_client.get(client_name))
+            except Exception as e:
+                logger.debug(f"'{book.abs_id}' Could not fingerprint '{client_name}' state: {e}")
+                return None
+            if not isinstance(client_fingerprint, tuple):
+                return None
+            parts.append((client_name, client_fingerprint))
+        return tuple(parts)
+
+    def _fingerprint_is_current(self, abs_id, fingerprint):
+        """True when the book was last processed with this same fingerprint, recently enough."""
+        seen = self._book_fingerprints.get(abs_id)
+        return (
+            seen is not None
+            and seen[0] == fingerprint
+            and time.time() - seen[1] < self.fingerprint_max_age
+        )
 
-                # Create a mapping of client names to their previous states
-                prev_states_by_client = {}
-                last_updated = 0
-                for state in previous_states:
-                    prev_states_by_client[state.client_name] = state
-                    if state.last_updated and state.last_updated > last_updated:
-                        last_updated = state.last_updated
-
-                # Determine active clients based on sync_mode using interface method
-                sync_type = 'ebook' if (hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only') else 'audiobook'
-                active_clients = {
-                    name: client for name, client in self.sync_clients.items()
-                    if sync_type in client.get_supported_sync_types()
-                }
-                if sync_type == 'ebook':
-                    logger.debug(f"'{abs_id}' '{title_snip}' Ebook-only mode - using clients: {list(active_clients.keys())}")
-
-                # Build config using active_clients - parallel fetch
-                config = self._fetch_states_parallel(book, prev_states_by_client, title_snip, bulk_states_per_client, active_clients)
-
-                # Filtered config now only contains non-None states
-                if not config:
-                    continue  # No valid states to process
-
-                # Check for ABS offline condition (only for audiobook mode)
-                # Check for ABS offline condition (only for audiobook mode)
-                if not (hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only'):
-                    abs_state = config.get('ABS')
-                    if abs_state is None:
-                        # Fallback logic: If ABS is missing but we have ebook clients, try to sync them as ebook-only
-                        ebook_clients_active = [k for k in config.keys() if k != 'ABS']
-                        if ebook_clients_active:
-                             logger.info(f"'{abs_id}' '{title_snip}' ABS audiobook not found/offline, falling back to ebook-only sync between {ebook_clients_active}")
-                        else:
-                             logger.debug(f"'{abs_id}' '{title_snip}' ABS audiobook offline and no other clients, skipping")
-                             continue  # ABS offline and no fallback possible
+    def _remember_fingerprint(self, abs_id, fingerprint, outcome):
+        # A sync changes the clients, so the next cycle sees a new fingerprint and
+        # confirms the book settled; errors and busy books are always retried.
+        if fingerprint is not None and outcome in ('synced', 'unchanged'):
+            self._book_fingerprints[abs_id] = (fingerprint, time.time())
+        else:
+            self._book_fingerprints.pop(abs_id, None)
 
+    def _sync_book_if_free(self, book, bulk_states_per_client, log_buffer=None, preload=None):
+        """
+        Sync one book from a full cycle unless another sync holds its lock.
 
+        Returns:
+            (outcome, seconds, buffered_log_records) where outcome is 'synced',
+            'unchanged', 'locked' or 'error'.
+        """
+        if log_buffer:
+            log_buffer.start()
+        started = time.time()
+        try:
+            book_lock = self._get_book_lock(book.abs_id)
+            if not book_lock.acquire(blocking=False):
+                # An instant sync is already handling this book - don't wait for it
+                logger.debug(f"'{book.abs_id}' Sync already in progress for this book - skipping in this cycle")
+                outcome = 'locked'
+            else:
+                try:
+                    if preload is not None and self._states_changed_at.get(book.abs_id, 0) >= preload.loaded_at:
+                        # An instant sync or clear finished after the preload; its states are stale
+                        preload = None
+                    result = self._sync_book(book, bulk_states_per_client, preload)
+                    outcome = 'error' if result is False else ('synced' if result else 'unchanged')
+                    if outcome != 'error':
+                        self._notify_book_synced(book)
+                except Exception as e:
+                    logger.error(f"❌ Sync error for '{book.abs_id}': {e}")
+                    logger.error(traceback.format_exc())
+                    outcome = 'error'
+                finally:
+                    book_lock.release()
+        finally:
+            records = log_buffer.stop() if log_buffer else []
+        return outcome, time.time() - started, records
+
+    def _record_cycle_metrics(self, cycle_started, workers, outcomes, bulk_fetch_seconds=None):
+        book_times = [elapsed for _, elapsed in outcomes]
+        counts = {name: 0 for name in ('synced', 'unchanged', 'skipped', 'locked', 'error')}
+        for outcome, _ in outcomes:
+            counts[outcome] += 1
+        duration = time.time() - cycle_started
+        self._cycle_metrics = {
+            'last_cycle_at': cycle_started,
+            'duration_seconds': round(duration, 3),
+            'workers': workers,
+            'books': len(outcomes),
+            'books_synced': counts['synced'],
+            'books_unchanged': counts['unchanged'],
+            'books_skipped': counts['skipped'],
+            'books_locked': counts['locked'],
+            'books_failed': counts['error'],
+            'book_seconds_total': round(sum(book_times), 3),
+            'book_seconds_max': round(max(book_times, default=0.0), 3),
+            'bulk_fetch_seconds': bulk_fetch_seconds or {},
+        }
+        logger.debug(
+            f"⏱️ Sync cycle took {duration:.2f}s for {len(outcomes)} book(s) with {workers} worker(s) "
+            f"({counts['synced']} synced, {counts['skipped']} skipped, {counts['locked']} busy, {counts['error']} failed)"
+        )
 
-                # Check for sync delta threshold between clients
-                progress_values = [cfg.current.get('pct', 0) for cfg in config.values() if cfg.current.get('pct') is not None]
-                significant_diff = False
+    def _sync_book(self, book, bulk_states_per_client, preload=None):
+        """
+        Sync a single book across its clients. Caller must hold the book's lock.
+        `preload` supplies the cycle's prefetched states and alignment presence.
 
-                if len(progress_values) >= 2:
-                    max_progress = max(progress_values)
-                    min_progress = min(progress_values)
-                    progress_diff = max_progress - min_progress
+        Returns True when states were saved, False on error and None when there
+        was nothing to do. Book and state writes are staged and committed in one
+        transaction.
+        """
+        abs_id = book.abs_id
+        logger.info(f"🔄 '{abs_id}' Syncing '{sanitize_log_data(book.abs_title or 'Unknown')}'")
+        title_snip = sanitize_log_data(book.abs_title or 'Unknown')
+        unit = self.database_service.unit_of_work()
 
-                    if progress_diff >= self.sync_delta_between_clients:
-                        significant_diff = True
-                        # If we have a significant diff, we verify it's not just noise
-                        # by checking if we have at least one valid state
-                        logger.debug(f"'{abs_id}' '{title_snip}' Detected discrepancies between clients ({progress_diff:.2%}), forcing sync check even if deltas are 0")
-                        logger.debug(f"'{abs_id}' '{title_snip}' Client discrepancy detected: {min_progress:.1%} to {max_progress:.1%}")
-                    else:
-                        logger.debug(f"'{abs_id}' '{title_snip}' Progress difference {progress_diff:.2%} below threshold {self.sync_delta_between_clients:.2%} - skipping sync")
-                        # Do not continue here, let the consolidated check handle it
-
-                # Check for Character Delta Threshold (Fix 2B)
-                # Loop through ebook clients (KoSync, Storyteller, BookLore, ABS_Ebook)
-                # If state.delta > 0 and book has epub, get total chars via extract_text_and_map
-                # Calculate char_delta = int(state.delta * total_chars)
-                # If char_delta >= self.delta_chars_thresh, log it and set significant_diff = True
-                char_delta_triggered = False  # Track if character delta triggered significance
-                if not significant_diff and hasattr(book, 'ebook_filename') and book.ebook_filename:
-                    for client_name_key, client_state in config.items():
-                         if client_state.delta > 0:
-                             try:
-                                 # Ensure file is available locally (download if needed)
-                                 epub_path = self._get_local_epub(book.original_ebook_filename or book.ebook_filename)
-                                 if not epub_path:
-                                     logger.warning(f"⚠️ Could not locate or download EPUB for '{book.ebook_filename}'")
-                                     continue
-
-                                 # Use existing ebook_parser which has caching
-                                 full_text, _ = self.ebook_parser.extract_text_and_map(epub_path)
-                                 if full_text:
-                                     total_chars = len(full_text)
-                                     char_delta = int(client_state.delta * total_chars)
-
-                                     if char_delta >= self.delta_chars_thresh:
-                                         logger.info(f"'{abs_id}' '{title_snip}' Significant character change detected for '{client_name_key}': {char_delta} chars (Threshold: {self.delta_chars_thresh})")
-                                         significant_diff = True
-                                         char_delta_triggered = True  # Mark that this came from char delta
-                                         break
-                             except Exception as e:
-                                 logger.warning(f"⚠️ Failed to check char delta for '{client_name_key}': {e}")
-
-                # Check if all 'delta' fields in config are zero
-                # We typically skip if nothing changed, BUT if there is a significant discrepancy
-                # between clients (e.g. from a fresh push to DB), we must proceed to sync them.
-                deltas_zero = all(round(cfg.delta, 4) == 0 for cfg in config.values())
-                
-                # Check if any client has a significant delta (using time-based threshold)
-                any_significant_delta = any(
-                    self._has_significant_delta(k, config, book) 
-                    for k in config.keys()
-                )
+        try:
+            # -----------------------------------------------------------------
+            # MIGRATION UPGRADE
+            # -----------------------------------------------------------------
+            if self.alignment_service:
+                if preload is not None:
+                    has_alignment = abs_id in preload.aligned_ids
+                else:
+                    has_alignment = bool(self.alignment_service._get_alignment(abs_id))
+                if has_alignment:
+                    # [MIGRATION UPGRADE] If the book has a map but still points to a legacy file, upgrade it
+                    if (
+                        getattr(book, 'transcript_file', None) != 'DB_MANAGED'
+                        and getattr(book, 'transcript_source', None) != 'storyteller'
+                    ):
+                        logger.info(f"   🔄 Upgrading '{title_snip}' to DB_MANAGED unified architecture")
+                        book.transcript_file = 'DB_MANAGED'
+                        unit.save_book(book)
 
-                # If nothing changed AND clients are effectively in sync, skip
-                if deltas_zero and not significant_diff:
-                    logger.debug(f"'{abs_id}' '{title_snip}' No changes and clients in sync, skipping")
-                    continue
-                
-                # If there's a discrepancy but no client actually changed, skip
-                # (discrepancy will resolve next time someone reads)
-                # Exception: if character delta triggered, we have a real change
-                # Exception: if a client just appeared for the first time (no prior
-                #   saved state), its appearance IS the activity — e.g. Storyteller
-                #   book exists at 0% but was never in config before.
-                new_client_in_config = any(
-                    client_name.lower() not in prev_states_by_client
-                    for client_name in config.keys()
-                )
-                if significant_diff and not any_significant_delta and not char_delta_triggered and not new_client_in_config:
-                    logger.debug(f"'{abs_id}' '{title_snip}' Discrepancy exists ({max_progress*100:.1f}% vs {min_progress*100:.1f}%) but no recent client activity detected. Waiting for a new read event to determine true leader")
-                    continue
+            # Get previous state for this book from database
+            if preload is not None:
+                previous_states = preload.states_by_book.get(abs_id, [])
+            else:
+                previous_states = self.database_service.get_states_for_book(abs_id)
 
-                if significant_diff:
-                    logger.debug(f"'{abs_id}' '{title_snip}' Proceeding due to client discrepancy")
-
-                # Small changes (below thresholds) should be noisy-reduced
-                small_changes = []
-                for key, cfg in config.items():
-                    delta = cfg.delta
-                    threshold = cfg.threshold
-
-                    # Debug logging for potential None values
-                    if delta is None or threshold is None:
-                         logger.debug(f"'{title_snip}' '{key}' delta={delta}, threshold={threshold}")
-
-                    if delta is not None and threshold is not None and 0 < delta < threshold:
-                        label, fmt = cfg.display
-                        delta_str = cfg.value_seconds_formatter(delta) if cfg.value_seconds_formatter else cfg.value_formatter(delta)
-                        small_changes.append(f"✋ [{abs_id}] [{title_snip}] {label} delta {delta_str} (Below threshold)")
-
-                if small_changes and not any(cfg.delta >= cfg.threshold for cfg in config.values()):
-                    # If we have significant discrepancies between clients, we MUST NOT skip,
-                    # even if individual deltas are small (e.g. from DB pre-update).
-                    if significant_diff:
-                        logger.debug(f"'{abs_id}' '{title_snip}' Proceeding with sync despite small deltas due to client discrepancies")
+            # Create a mapping of client names to their previous states
+            prev_states_by_client = {}
+            last_updated = 0
+            for state in previous_states:
+                prev_states_by_client[state.client_name] = state
+                if state.last_updated and state.last_updated > last_updated:
+                    last_updated = state.last_updated
+
+            # Determine active clients based on sync_mode using interface method
+            active_clients = self._clients_for_book(book)
+            if getattr(book, 'sync_mode', None) == 'ebook_only':
+                logger.debug(f"'{abs_id}' '{title_snip}' Ebook-only mode - using clients: {list(active_clients.keys())}")
+
+            # Build config using active_clients - parallel fetch
+            config = self._fetch_states_parallel(book, prev_states_by_client, title_snip, bulk_states_per_client, active_clients)
+
+            # Filtered config now only contains non-None states
+            if not config:
+                return  # No valid states to process
+
+            # Check for ABS offline condition (only for audiobook mode)
+            # Check for ABS offline condition (only for audiobook mode)
+            if not (hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only'):
+                abs_state = config.get('ABS')
+                if abs_state is None:
+                    # Fallback logic: If ABS is missing but we have ebook clients, try to sync them as ebook-only
+                    ebook_clients_active = [k for k in config.keys() if k != 'ABS']
+                    if ebook_clients_active:
+                         logger.info(f"'{abs_id}' '{title_snip}' ABS audiobook not found/offline, falling back to ebook-only sync between {ebook_clients_active}")
                     else:
-                        for s in small_changes:
-                            logger.info(s)
-                        # No further action for only-small changes
-                        continue
+                         logger.debug(f"'{abs_id}' '{title_snip}' ABS audiobook offline and no other clients, skipping")
+                         return  # ABS offline and no fallback possible
 
-                # At this point we have a significant change to act on
-                logger.info(f"🔄 '{abs_id}' '{title_snip}' Change detected")
 
 
-                # Status block - show only changed lines
-                status_lines = []
-                for key, cfg in config.items():
-                    if cfg.delta > 0:
-                        prev = cfg.previous_pct
-                        curr = cfg.current.get('pct')
-                        label, fmt = cfg.display
-                        status_lines.append(f"📊 {label}: {fmt.format(prev=prev, curr=curr)}")
+            # Check for sync delta threshold between clients
+            progress_values = [cfg.current.get('pct', 0) for cfg in config.values() if cfg.current.get('pct') is not None]
+            significant_diff = False
 
-                for line in status_lines:
-                    logger.info(line)
+            if len(progress_values) >= 2:
+                max_progress = max(progress_values)
+                min_progress = min(progress_values)
+                progress_diff = max_progress - min_progress
 
-                # Determine leader
-                leader, leader_pct = self._determine_leader(config, book, abs_id, title_snip)
-                if not leader:
-                    continue
+                if progress_diff >= self.sync_delta_between_clients:
+                    significant_diff = True
+                    # If we have a significant diff, we verify it's not just noise
+                    # by checking if we have at least one valid state
+                    logger.debug(f"'{abs_id}' '{title_snip}' Detected discrepancies between clients ({progress_diff:.2%}), forcing sync check even if deltas are 0")
+                    logger.debug(f"'{abs_id}' '{title_snip}' Client discrepancy detected: {min_progress:.1%} to {max_progress:.1%}")
+                else:
+                    logger.debug(f"'{abs_id}' '{title_snip}' Progress difference {progress_diff:.2%} below threshold {self.sync_delta_between_clients:.2%} - skipping sync")
+                    # Do not continue here, let the consolidated check handle it
+
+            # Check for Character Delta Threshold (Fix 2B)
+            # Loop through ebook clients (KoSync, Storyteller, BookLore, ABS_Ebook)
+            # If state.delta > 0 and book has epub, get total chars via extract_text_and_map
+            # Calculate char_delta = int(state.delta * total_chars)
+            # If char_delta >= self.delta_chars_thresh, log it and set significant_diff = True
+            char_delta_triggered = False  # Track if character delta triggered significance
+            if not significant_diff and hasattr(book, 'ebook_filename') and book.ebook_filename:
+                for client_name_key, client_state in config.items():
+                     if client_state.delta > 0:
+                         try:
+                             # Ensure file is available locally (download if needed)
+                             epub_path = self._get_local_epub(book.original_ebook_filename or book.ebook_filename)
+                             if not epub_path:
+                                 logger.warning(f"⚠️ Could not locate or download EPUB for '{book.ebook_filename}'")
+                                 continue
+
+                             # Use existing ebook_parser which has caching
+                             full_text, _ = self.ebook_parser.extract_text_and_map(epub_path)
+                             if full_text:
+                                 total_chars = len(full_text)
+                                 char_delta = int(client_state.delta * total_chars)
+
+                                 if char_delta >= self.delta_chars_thresh:
+                                     logger.info(f"'{abs_id}' '{title_snip}' Significant character change detected for '{client_name_key}': {char_delta} chars (Threshold: {self.delta_chars_thresh})")
+                                     significant_diff = True
+                                     char_delta_triggered = True  # Mark that this came from char delta
+                                     break
+                         except Exception as e:
+                             logger.warning(f"⚠️ Failed to check char delta for '{client_name_key}': {e}")
+
+            # Check if all 'delta' fields in config are zero
+            # We typically skip if nothing changed, BUT if there is a significant discrepancy
+            # between clients (e.g. from a fresh push to DB), we must proceed to sync them.
+            deltas_zero = all(round(cfg.delta, 4) == 0 for cfg in config.values())
+            
+            # Check if any client has a significant delta (using time-based threshold)
+            any_significant_delta = any(
+                self._has_significant_delta(k, config, book) 
+                for k in config.keys()
+            )
+
+            # If nothing changed AND clients are effectively in sync, skip
+            if deltas_zero and not significant_diff:
+                logger.debug(f"'{abs_id}' '{title_snip}' No changes and clients in sync, skipping")
+                return
+            
+            # If there's a discrepancy but no client actually changed, skip
+            # (discrepancy will resolve next time someone reads)
+            # Exception: if character delta triggered, we have a real change
+            # Exception: if a client just appeared for the first time (no prior
+            #   saved state), its appearance IS the activity — e.g. Storyteller
+            #   book exists at 0% but was never in config before.
+            new_client_in_config = any(
+                client_name.lower() not in prev_states_by_client
+                for client_name in config.keys()
+            )
+            if significant_diff and not any_significant_delta and not char_delta_triggered and not new_client_in_config:
+                logger.debug(f"'{abs_id}' '{title_snip}' Discrepancy exists ({max_progress*100:.1f}% vs {min_progress*100:.1f}%) but no recent client activity detected. Waiting for a new read event to determine true leader")
+                return
 
-                leader_formatter = config[leader].value_formatter
+            if significant_diff:
+                logger.debug(f"'{abs_id}' '{title_snip}' Proceeding due to client discrepancy")
 
-                leader_client = self.sync_clients[leader]
-                leader_state = config[leader]
+            # Small changes (below thresholds) should be noisy-reduced
+            small_changes = []
+            for key, cfg in config.items():
+                delta = cfg.delta
+                threshold = cfg.threshold
 
-                epub = book.ebook_filename
-                txt = None
-                locator = None
-                locator_source = None
+                # Debug logging for potential None values
+                if delta is None or threshold is None:
+                     logger.debug(f"'{title_snip}' '{key}' delta={delta}, threshold={threshold}")
 
-                if leader == 'ABS':
-                    abs_timestamp = leader_state.current.get('ts')
-                    locator, txt = self._resolve_alignment_locator_from_abs_timestamp(book, abs_timestamp)
-                    if locator:
-                        locator_source = "alignment_direct"
-                        logger.debug(f"'{abs_id}' '{title_snip}' Using alignment direct timestamp->locator path")
+                if delta is not None and threshold is not None and 0 < delta < threshold:
+                    label, fmt = cfg.display
+                    delta_str = cfg.value_seconds_formatter(delta) if cfg.value_seconds_formatter else cfg.value_formatter(delta)
+                    small_changes.append(f"✋ [{abs_id}] [{title_snip}] {label} delta {delta_str} (Below threshold)")
 
-                    if not locator and getattr(book, 'transcript_source', None) == 'storyteller':
-                        locator, txt = self._resolve_storyteller_locator_from_abs_timestamp(
-                            book, abs_timestamp
-                        )
-                        if locator:
-                            locator_source = "storyteller_direct"
-                            logger.debug(f"'{abs_id}' '{title_snip}' Using storyteller direct timestamp->locator path")
+            if small_changes and not any(cfg.delta >= cfg.threshold for cfg in config.values()):
+                # If we have significant discrepancies between clients, we MUST NOT skip,
+                # even if individual deltas are small (e.g. from DB pre-update).
+                if significant_diff:
+                    logger.debug(f"'{abs_id}' '{title_snip}' Proceeding with sync despite small deltas due to client discrepancies")
+                else:
+                    for s in small_changes:
+                        logger.info(s)
+                    # No further action for only-small changes
+                    return
+
+            # At this point we have a significant change to act on
+            logger.info(f"🔄 '{abs_id}' '{title_snip}' Change detected")
+
+
+            # Status block - show only changed lines
+            status_lines = []
+            for key, cfg in config.items():
+                if cfg.delta > 0:
+                    prev = cfg.previous_pct
+                    curr = cfg.current.get('pct')
+                    label, fmt = cfg.display
+                    status_lines.append(f"📊 {label}: {fmt.format(prev=prev, curr=curr)}")
+
+            for line in status_lines:
+                logger.info(line)
+
+            # Determine leader
+            leader, leader_pct = self._determine_leader(config, book, abs_id, title_snip)
+            if not leader:
+                return
 
-                if not locator:
-                    txt = leader_client.get_text_from_current_state(book, leader_state)
-                    if not txt:
-                        logger.warning(f"⚠️ '{abs_id}' '{title_snip}' Could not get text from leader '{leader}'")
-                        continue
+            leader_formatter = config[leader].value_formatter
+
+            leader_client = self.sync_clients[leader]
+            leader_state = config[leader]
 
-                    locator = leader_client.get_locator_from_text(txt, epub, leader_pct)
+            epub = book.ebook_filename
+            txt = None
+            locator = None
+            locator_source = None
+
+            if leader == 'ABS':
+                abs_timestamp = leader_state.current.get('ts')
+                locator, txt = self._resolve_alignment_locator_from_abs_timestamp(book, abs_timestamp)
+                if locator:
+                    locator_source = "alignment_direct"
+                    logger.debug(f"'{abs_id}' '{title_snip}' Using alignment direct timestamp->locator path")
+
+                if not locator and getattr(book, 'transcript_source', None) == 'storyteller':
+                    locator, txt = self._resolve_storyteller_locator_from_abs_timestamp(
+                        book, abs_timestamp
+                    )
                     if locator:
-                        locator_source = "fuzzy_text"
-                    if not locator:
-                        if getattr(self.ebook_parser, 'useXpathSegmentFallback', False):
-                            fallback_txt = leader_client.get_fallback_text(book, leader_state)
-                            if fallback_txt and fallback_txt != txt:
-                                logger.info(f"🔄 '{abs_id}' '{title_snip}' Primary text match failed. Trying previous segment fallback...")
-                                locator = leader_client.get_locator_from_text(fallback_txt, epub, leader_pct)
-                                if locator:
-                                    logger.info(f"✅ '{abs_id}' '{title_snip}' Fallback successful!")
-                                    locator_source = "fuzzy_text_previous_segment"
+                        locator_source = "storyteller_direct"
+                        logger.debug(f"'{abs_id}' '{title_snip}' Using storyteller direct timestamp->locator path")
 
+            if not locator:
+                txt = leader_client.get_text_from_current_state(book, leader_state)
+                if not txt:
+                    logger.warning(f"⚠️ '{abs_id}' '{title_snip}' Could not get text from leader '{leader}'")
+                    return
+
+                locator = leader_client.get_locator_from_text(txt, epub, leader_pct)
+                if locator:
+                    locator_source = "fuzzy_text"
                 if not locator:
-                    logger.warning(f"⚠️ '{abs_id}' '{title_snip}' Could not resolve locator from text for leader '{leader}', falling back to percentage of leader")
-                    locator = LocatorResult(percentage=leader_pct)
-                    locator_source = "percent_fallback"
-                if txt is None:
-                    txt = ""
+                    if getattr(self.ebook_parser, 'useXpathSegmentFallback', False):
+                        fallback_txt = leader_client.get_fallback_text(book, leader_state)
+                        if fallback_txt and fallback_txt != txt:
+                            logger.info(f"🔄 '{abs_id}' '{title_snip}' Primary text match failed. Trying previous segment fallback...")
+                            locator = leader_client.get_locator_from_text(fallback_txt, epub, leader_pct)
+                            if locator:
+                                logger.info(f"✅ '{abs_id}' '{title_snip}' Fallback successful!")
+                                locator_source = "fuzzy_text_previous_segment"
 
-                logger.debug(
-                    f"'{abs_id}' '{title_snip}' Locator resolved via source={locator_source or 'unknown'} "
-                    f"epub='{sanitize_log_data(book.ebook_filename)}' "
-                    f"original_epub='{sanitize_log_data(getattr(book, 'original_ebook_filename', None))}'"
-                )
+            if not locator:
+                logger.warning(f"⚠️ '{abs_id}' '{title_snip}' Could not resolve locator from text for leader '{leader}', falling back to percentage of leader")
+                locator = LocatorResult(percentage=leader_pct)
+                locator_source = "percent_fallback"
+            if txt is None:
+                txt = ""
 
-                # Update all other clients and store results
-                results: dict[str, SyncResult] = {}
-                for client_name, client in self.sync_clients.items():
-                    if client_name == leader:
-                        continue
+            logger.debug(
+                f"'{abs_id}' '{title_snip}' Locator resolved via source={locator_source or 'unknown'} "
+                f"epub='{sanitize_log_data(book.ebook_filename)}' "
+                f"original_epub='{sanitize_log_data(getattr(book, 'original_ebook_filename', None))}'"
+            )
 
-                    # Skip ABS update if in ebook-only mode
-                    if client_name == 'ABS' and hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only':
-                        continue
-                    try:
-                        request = UpdateProgressRequest(locator, txt, previous_location=config.get(client_name).previous_pct if config.get(client_name) else None)
-                        result = client.update_progress(book, request)
-                        results[client_name] = result
-                    except Exception as e:
-                        logger.warning(f"⚠️ Failed to update '{client_name}': {e}")
-                        results[client_name] = SyncResult(None, False)
-
-                # Save states directly to database service using State models
-                current_time = time.time()
-
-                # Save leader state
-                leader_state_data = leader_state.current
-
-                leader_state_model = State(
-                    abs_id=book.abs_id,
-                    client_name=leader.lower(),
-                    last_updated=current_time,
-                    percentage=leader_state_data.get('pct'),
-                    timestamp=leader_state_data.get('ts'),
-                    xpath=leader_state_data.get('xpath'),
-                    cfi=leader_state_data.get('cfi')
-                )
-                self.database_service.save_state(leader_state_model)
-
-                # Save sync results from other clients
-                for client_name, result in results.items():
-                    if result.success:
-                        # Use updated_state if provided, otherwise fall back to basic state
-                        state_data = result.updated_state if result.updated_state else {'pct': result.location}
-                        logger.info(f"'{abs_id}' '{title_snip}' Updated state data for '{client_name}': {state_data}")
-                        client_state_model = State(
-                            abs_id=book.abs_id,
-                            client_name=client_name.lower(),
-                            last_updated=current_time,
-                            percentage=state_data.get('pct'),
-                            timestamp=state_data.get('ts'),
-                            xpath=state_data.get('xpath'),
-                            cfi=state_data.get('cfi')
-                        )
-                        self.database_service.save_state(client_state_model)
+            # Update all other clients and store results
+            results: dict[str, SyncResult] = {}
+            for client_name, client in self.sync_clients.items():
+                if client_name == leader:
+                    continue
+
+                # Skip ABS update if in ebook-only mode
+                if client_name == 'ABS' and hasattr(book, 'sync_mode') and book.sync_mode == 'ebook_only':
+                    continue
+                try:
+                    request = UpdateProgressRequest(locator, txt, previous_location=config.get(client_name).previous_pct if config.get(client_name) else None)
+                    result = self._call_client(client_name, client.update_progress, book, request)
+                    results[client_name] = result
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to update '{client_name}': {e}")
+                    results[client_name] = SyncResult(None, False)
+
+            # Save states directly to database service using State models
+            current_time = time.time()
+
+            # Save leader state
+            leader_state_data = leader_state.current
+
+            leader_state_model = State(
+                abs_id=book.abs_id,
+                client_name=leader.lower(),
+                last_updated=current_time,
+                percentage=leader_state_data.get('pct'),
+                timestamp=leader_state_data.get('ts'),
+                xpath=leader_state_data.get('xpath'),
+                cfi=leader_state_data.get('cfi')
+            )
+            unit.save_state(leader_state_model)
+
+            # Save sync results from other clients
+            for client_name, result in results.items():
+                if result.success:
+                    # Use updated_state if provided, otherwise fall back to basic state
+                    state_data = result.updated_state if result.updated_state else {'pct': result.location}
+                    logger.info(f"'{abs_id}' '{title_snip}' Updated state data for '{client_name}': {state_data}")
+                    client_state_model = State(
+                        abs_id=book.abs_id,
+                        client_name=client_name.lower(),
+                        last_updated=current_time,
+                        percentage=state_data.get('pct'),
+                        timestamp=state_data.get('ts'),
+                        xpath=state_data.get('xpath'),
+                        cfi=state_data.get('cfi')
+                    )
+                    unit.save_state(client_state_model)
 
-                logger.info(f"💾 '{abs_id}' '{title_snip}' States saved to database")
+            unit.commit()
+            logger.info(f"💾 '{abs_id}' '{title_snip}' States saved to database")
 
-                # Debugging crash: Flush logs to ensure we see this before any potential hard crash
-                for handler in logger.handlers:
+            # Debugging crash: Flush logs to ensure we see this before any potential hard crash
+            for handler in logger.handlers:
+                handler.flush()
+            if hasattr(root_logger, 'handlers'):
+                for handler in root_logger.handlers:
                     handler.flush()
-                if hasattr(root_logger, 'handlers'):
-                    for handler in root_logger.handlers:
-                        handler.flush()
 
-            except Exception as e:
-                logger.error(traceback.format_exc())
-                logger.error(f"❌ Sync error: {e}")
+            return True
 
-        logger.debug("End of sync cycle for active books")
+        except Exception as e:
+            logger.error(traceback.format_exc())
+            logger.error(f"❌ Sync error: {e}")
+            return False
+        finally:
+            # Early exits may still have staged a book upgrade
+            try:
+                unit.commit()
+            except Exception as e:
+                logger.error(f"❌ Failed to save staged changes for '{title_snip}': {e}")
 
     def clear_progress(self, abs_id):
         """
@@ -1683,94 +2100,98 @@ class SyncManager:
         try:
             logger.info(f"🧹 Clearing progress for book {sanitize_log_data(abs_id)}...")
 
-            # Acquire lock to prevent race conditions with active sync cycles
-            with self._sync_lock:
-                # Get the book first
-                book = self.database_service.get_book(abs_id)
-                if not book:
-                    raise ValueError(f"Book not found: {abs_id}")
-
-                # Clear all states for this book from database
-                cleared_count = self.database_service.delete_states_for_book(abs_id)
-                logger.info(f"💾 Cleared {cleared_count} state records from database")
-
-                # Delete KOSync document record to bypass "furthest wins" protection
-                # Without this, the integrated KOSync server will reject the 0% update
-                # and the old progress will sync back on the next cycle
-                if book.kosync_doc_id:
-                    deleted = self.database_service.delete_kosync_document(book.kosync_doc_id)
-                    if deleted:
-                        logger.info(f"🗑️ Deleted KOSync document record: {book.kosync_doc_id[:8]}...")
-
-                # Reset all sync clients to 0% progress
-                reset_results = {}
-                locator = LocatorResult(percentage=0.0)
-                request = UpdateProgressRequest(locator_result=locator, txt="", previous_location=None)
-
-                for client_name, client in self.sync_clients.items():
-                    if client_name == 'ABS' and book.sync_mode == 'ebook_only':
-                        logger.debug(f"'{book.abs_title}' Ebook-only mode - skipping ABS progress reset")
-                        continue
-                    try:
-                        result = client.update_progress(book, request)
-                        reset_results[client_name] = {
-                            'success': result.success,
-                            'message': 'Reset to 0%' if result.success else 'Failed to reset'
-                        }
-                        if result.success:
-                            logger.info(f"✅ Reset '{client_name}' to 0%")
-                        else:
-                            logger.warning(f"⚠️ Failed to reset '{client_name}'")
-                    except Exception as e:
-                        reset_results[client_name] = {
-                            'success': False,
-                            'message': str(e)
-                        }
-                        logger.warning(f"⚠️ Error resetting '{client_name}': {e}")
-
-                summary = {
-                    'book_id': abs_id,
-                    'book_title': book.abs_title,
-                    'database_states_cleared': cleared_count,
-                    'client_reset_results': reset_results,
-                    'successful_resets': sum(1 for r in reset_results.values() if r['success']),
-                    'total_clients': len(reset_results)
-                }
-
-                # [CHANGED LOGIC] Handle book status update based on alignment presence and user setting
-                smart_reset = os.getenv('REPROCESS_ON_CLEAR_IF_NO_ALIGNMENT', 'true').lower() == 'true'
+            # Acquire the book's lock to prevent races with a sync of the same book
+            with self._get_book_lock(abs_id):
+                try:
+                    # Get the book first
+                    book = self.database_service.get_book(abs_id)
+                    if not book:
+                        raise ValueError(f"Book not found: {abs_id}")
+
+                    # Clear all states for this book from database
+                    cleared_count = self.database_service.delete_states_for_book(abs_id)
+                    logger.info(f"💾 Cleared {cleared_count} state records from database")
+
+                    # Delete KOSync document record to bypass "furthest wins" protection
+                    # Without this, the integrated KOSync server will reject the 0% update
+                    # and the old progress will sync back on the next cycle
+                    if book.kosync_doc_id:
+                        deleted = self.database_service.delete_kosync_document(book.kosync_doc_id)
+                        if deleted:
+                            logger.info(f"🗑️ Deleted KOSync document record: {book.kosync_doc_id[:8]}...")
+
+                    # Reset all sync clients to 0% progress
+                    reset_results = {}
+                    locator = LocatorResult(percentage=0.0)
+                    request = UpdateProgressRequest(locator_result=locator, txt="", previous_location=None)
+
+                    for client_name, client in self.sync_clients.items():
+                        if client_name == 'ABS' and book.sync_mode == 'ebook_only':
+                            logger.debug(f"'{book.abs_title}' Ebook-only mode - skipping ABS progress reset")
+                            continue
+                        try:
+                            result = client.update_progress(book, request)
+                            reset_results[client_name] = {
+                                'success': result.success,
+                                'message': 'Reset to 0%' if result.success else 'Failed to reset'
+                            }
+                            if result.success:
+                                logger.info(f"✅ Reset '{client_name}' to 0%")
+                            else:
+                                logger.warning(f"⚠️ Failed to reset '{client_name}'")
+                        except Exception as e:
+                            reset_results[client_name] = {
+                                'success': False,
+                                'message': str(e)
+                            }
+                            logger.warning(f"⚠️ Error resetting '{client_name}': {e}")
+
+                    summary = {
+                        'book_id': abs_id,
+                        'book_title': book.abs_title,
+                        'database_states_cleared': cleared_count,
+                        'client_reset_results': reset_results,
+                        'successful_resets': sum(1 for r in reset_results.values() if r['success']),
+                        'total_clients': len(reset_results)
+                    }
+
+                    # [CHANGED LOGIC] Handle book status update based on alignment presence and user setting
+                    smart_reset = os.getenv('REPROCESS_ON_CLEAR_IF_NO_ALIGNMENT', 'true').lower() == 'true'
                 
-                if smart_reset:
-                    # Check if we already have a valid alignment map in the DB
-                    has_alignment = False
-                    if self.alignment_service:
-                        has_alignment = bool(self.alignment_service._get_alignment(abs_id))
-
-                    if has_alignment:
-                        # If we have an alignment, just ensure the book is active.
-                        # DO NOT set to 'pending' - this prevents re-transcription.
+                    if smart_reset:
+                        # Check if we already have a valid alignment map in the DB
+                        has_alignment = False
+                        if self.alignment_service:
+                            has_alignment = bool(self.alignment_service._get_alignment(abs_id))
+
+                        if has_alignment:
+                            # If we have an alignment, just ensure the book is active.
+                            # DO NOT set to 'pending' - this prevents re-transcription.
+                            if book.status != 'active':
+                                book.status = 'active'
+                                self.database_service.save_book(book)
+                            logger.info("   ✅ Alignment map exists — Reset progress to 0% without triggering re-transcription")
+                        else:
+                            # Only trigger a full re-process if we lack alignment data
+                            book.status = 'pending'
+                            self.database_service.save_book(book)
+                            logger.info("   ⚡ Book marked as 'pending' to trigger alignment check")
+                    else:
+                        # Legacy or explicit "just clear 0" behavior
+                        # If smart reset is disabled, we still want to ensure it's at least active
                         if book.status != 'active':
                             book.status = 'active'
                             self.database_service.save_book(book)
-                        logger.info("   ✅ Alignment map exists — Reset progress to 0% without triggering re-transcription")
-                    else:
-                        # Only trigger a full re-process if we lack alignment data
-                        book.status = 'pending'
-                        self.database_service.save_book(book)
-                        logger.info("   ⚡ Book marked as 'pending' to trigger alignment check")
-                else:
-                    # Legacy or explicit "just clear 0" behavior
-                    # If smart reset is disabled, we still want to ensure it's at least active
-                    if book.status != 'active':
-                        book.status = 'active'
-                        self.database_service.save_book(book)
-                    logger.info("   ✅ Reset progress to 0% (Smart re-process disabled)")
+                        logger.info("   ✅ Reset progress to 0% (Smart re-process disabled)")
 
-                logger.info(f"✅ Progress clearing completed for '{sanitize_log_data(book.abs_title)}'")
-                logger.info(f"   Database states cleared: {cleared_count}")
-                logger.info(f"   Client resets: {summary['successful_resets']}/{summary['total_clients']} successful")
+                    logger.info(f"✅ Progress clearing completed for '{sanitize_log_data(book.abs_title)}'")
+                    logger.info(f"   Database states cleared: {cleared_count}")
+                    logger.info(f"   Client resets: {summary['successful_resets']}/{summary['total_clients']} successful")
 
-                return summary
+                    return summary
+                finally:
+                    # Drop cached cycle data once the states are gone and clients reset
+                    self._invalidate_book_snapshot(abs_id)
 
         except Exception as e:
             error_msg = f"Error clearing progress for {abs_id}: {e}"
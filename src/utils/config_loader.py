@@ -16,13 +16,15 @@ ALL_SETTINGS = [
     
     # KOSync
     'KOSYNC_ENABLED', 'KOSYNC_SERVER', 'KOSYNC_USER', 'KOSYNC_KEY', 
-    'KOSYNC_HASH_METHOD', 'KOSYNC_USE_PERCENTAGE_FROM_SERVER',
+    'KOSYNC_HASH_METHOD', 'KOSYNC_USE_PERCENTAGE_FROM_SERVER', 'KOSYNC_LOCAL_MODE',
+    'KOSYNC_BULK_CONCURRENCY', 'KOSYNC_TIMEOUT_SECONDS',
     
     # Storyteller
     'STORYTELLER_ENABLED', 'STORYTELLER_API_URL', 'STORYTELLER_USER', 'STORYTELLER_PASSWORD',
     
     # Booklore
     'BOOKLORE_ENABLED', 'BOOKLORE_SERVER', 'BOOKLORE_USER', 'BOOKLORE_PASSWORD', 'BOOKLORE_SHELF_NAME', 'BOOKLORE_LIBRARY_ID',
+    'BOOKLORE_FULL_REFRESH_HOURS',
 
     # CWA (Calibre-Web Automated)
     'CWA_ENABLED', 'CWA_SERVER', 'CWA_USERNAME', 'CWA_PASSWORD',
@@ -42,7 +44,9 @@ ALL_SETTINGS = [
     'XPATH_FALLBACK_TO_PREVIOUS_SEGMENT', 'SYNC_ABS_EBOOK',
     'FUZZY_MATCH_THRESHOLD', 'SUGGESTIONS_ENABLED',
     'INSTANT_SYNC_ENABLED',
-    'STORYTELLER_POLL_MODE', 'STORYTELLER_POLL_SECONDS',
+    'SYNC_BOOK_WORKERS', 'SYNC_CLIENT_CONCURRENCY',
+    'SYNC_CLIENT_TIMEOUT_SECONDS', 'SYNC_CLIENT_TIMEOUT_OVERRIDES', 'SYNC_UNCHANGED_SKIP_MAX_AGE_SECONDS',
+    'STORYTELLER_POLL_MODE', 'STORYTELLER_POLL_SECONDS', 'STORYTELLER_BULK_CONCURRENCY',
     'BOOKLORE_POLL_MODE', 'BOOKLORE_POLL_SECONDS',
     
     # System
@@ -50,7 +54,12 @@ ALL_SETTINGS = [
     'AUDIOBOOKS_DIR', 'STORYTELLER_LIBRARY_DIR', 'STORYTELLER_ASSETS_DIR',
     'EBOOK_CACHE_SIZE',
     'JOB_MAX_RETRIES', 'JOB_RETRY_DELAY_MINS', 'WHISPER_MODEL',
-    'WHISPER_DEVICE', 'WHISPER_COMPUTE_TYPE',
+    'WHISPER_DEVICE', 'WHISPER_COMPUTE_TYPE', 'WHISPER_CPU_THREADS', 'WHISPER_MODEL_IDLE_TIMEOUT',
+    'TRANSCRIPTION_WORKERS', 'TRANSCRIPTION_MODE', 'SPARSE_WINDOW_SECONDS', 'SPARSE_INTERVAL_SECONDS',
+    'SPARSE_MAX_ERROR_SECONDS', 'AUDIO_DOWNLOAD_WORKERS', 'TRANSCRIPT_CACHE_MAX_MB', 'TRANSCRIPT_CACHE_MAX_AGE_DAYS',
+    'DB_READ_CACHE_ENABLED', 'DB_READ_CACHE_TTL_SECONDS', 'DB_READ_CACHE_MAX_ENTRIES',
+    'DB_MAINTENANCE_INTERVAL_MINS', 'DB_MAINTENANCE_IDLE_SECONDS', 'DB_ANALYZE_INTERVAL_HOURS',
+    'DB_VACUUM_FREE_PERCENT', 'EBOOK_SEARCH_CACHE_HOURS',
     'TRANSCRIPTION_PROVIDER', 'DEEPGRAM_API_KEY', 'DEEPGRAM_MODEL', 'WHISPER_CPP_URL'
 ]
 
@@ -67,10 +76,25 @@ DEFAULT_CONFIG = {
     'SYNC_DELTA_KOSYNC_PERCENT': '0.5',
     'SYNC_DELTA_BETWEEN_CLIENTS_PERCENT': '0.5',
     'SYNC_DELTA_KOSYNC_WORDS': '400',
+    'SYNC_BOOK_WORKERS': '1',
+    'SYNC_CLIENT_CONCURRENCY': '4',
+    'SYNC_CLIENT_TIMEOUT_SECONDS': '15',
+    'SYNC_CLIENT_TIMEOUT_OVERRIDES': '',
+    'SYNC_UNCHANGED_SKIP_MAX_AGE_SECONDS': '900',
     'FUZZY_MATCH_THRESHOLD': '80',
     'WHISPER_MODEL': 'tiny',
     'WHISPER_DEVICE': 'auto',
     'WHISPER_COMPUTE_TYPE': 'auto',
+    'WHISPER_CPU_THREADS': '4',
+    'WHISPER_MODEL_IDLE_TIMEOUT': '300',
+    'TRANSCRIPTION_WORKERS': '1',
+    'TRANSCRIPTION_MODE': 'full',
+    'SPARSE_WINDOW_SECONDS': '60',
+    'SPARSE_INTERVAL_SECONDS': '600',
+    'SPARSE_MAX_ERROR_SECONDS': '30',
+    'AUDIO_DOWNLOAD_WORKERS': '3',
+    'TRANSCRIPT_CACHE_MAX_MB': '500',
+    'TRANSCRIPT_CACHE_MAX_AGE_DAYS': '90',
     'TRANSCRIPTION_PROVIDER': 'local',
     'WHISPER_CPP_URL': '',
     'DEEPGRAM_API_KEY': '',
@@ -82,13 +106,25 @@ DEFAULT_CONFIG = {
     'STORYTELLER_ASSETS_DIR': '',
     'ABS_PROGRESS_OFFSET_SECONDS': '0',
     'EBOOK_CACHE_SIZE': '3',
+    'DB_READ_CACHE_ENABLED': 'true',
+    'DB_READ_CACHE_TTL_SECONDS': '60',
+    'DB_READ_CACHE_MAX_ENTRIES': '5000',
+    'DB_MAINTENANCE_INTERVAL_MINS': '15',
+    'DB_MAINTENANCE_IDLE_SECONDS': '60',
+    'DB_ANALYZE_INTERVAL_HOURS': '24',
+    'DB_VACUUM_FREE_PERCENT': '20',
+    'EBOOK_SEARCH_CACHE_HOURS': '6',
     'KOSYNC_HASH_METHOD': 'content',
+    'KOSYNC_LOCAL_MODE': 'auto',
+    'KOSYNC_BULK_CONCURRENCY': '8',
+    'KOSYNC_TIMEOUT_SECONDS': '5',
     'TELEGRAM_LOG_LEVEL': 'ERROR',
     'SHELFMARK_URL': '',
     'KOSYNC_ENABLED': 'false',
     'STORYTELLER_ENABLED': 'false',
     'BOOKLORE_ENABLED': 'false',
     'BOOKLORE_LIBRARY_ID': '',
+    'BOOKLORE_FULL_REFRESH_HOURS': '24',
     'CWA_ENABLED': 'false',
     'CWA_SERVER': '',
     'CWA_USERNAME': '',
@@ -105,6 +141,7 @@ DEFAULT_CONFIG = {
     'INSTANT_SYNC_ENABLED': 'true',
     'STORYTELLER_POLL_MODE': 'global',
     'STORYTELLER_POLL_SECONDS': '45',
+    'STORYTELLER_BULK_CONCURRENCY': '4',
     'BOOKLORE_POLL_MODE': 'global',
     'BOOKLORE_POLL_SECONDS': '300',
 }
@@ -170,7 +170,8 @@ class Container(containers.DeclarativeContainer):
     kosync_sync_client = providers.Singleton(
         KoSyncSyncClient,
         kosync_client,
-        ebook_parser
+        ebook_parser,
+        database_service
     )
 
     storyteller_sync_client = providers.Singleton(
@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 import os
 from datetime import datetime
@@ -38,6 +39,106 @@ class MemoryLogHandler(logging.Handler):
         return self.logs[-count:] if len(self.logs) > count else self.logs.copy()
 
 
+class ThreadLogBuffer(logging.Filter):
+    """
+    Handler filter that holds back records from threads that are buffering.
+
+    Used when several books are synced in parallel: each worker buffers its own
+    records and the caller replays them in a fixed order, so every book's log
+    lines stay together instead of interleaving.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+        self._handlers = []
+
+    def install(self, target_logger=None):
+        """Attach to the handlers of `target_logger` (root by default)."""
+        self._handlers = list((target_logger or logging.getLogger()).handlers)
+        for handler in self._handlers:
+            handler.addFilter(self)
+
+    def uninstall(self):
+        for handler in self._handlers:
+            handler.removeFilter(self)
+        self._handlers = []
+
+    def start(self):
+        """Start buffering records logged by the current thread."""
+        self._local.records = []
+
+    def stop(self):
+        """Stop buffering for the current thread and return what was held back."""
+        records = getattr(self._local, 'records', None) or []
+        self._local.records = None
+        return records
+
+    def is_buffering(self) -> bool:
+        return getattr(self._local, 'records', None) is not None
+
+    def extend(self, records):
+        """Add records to the current thread's buffer, or emit them if it isn't buffering."""
+        if self.is_buffering():
+            self._local.records.extend(records)
+        else:
+            self._emit(records)
+
+    def hand_off(self, fn):
+        """
+        Wrap `fn` for another thread working on behalf of the current one.
+
+        Returns (wrapped, collect). The wrapped call buffers what it logs;
+        collect(), called on this thread once the call is done, moves those
+        records into this thread's buffer. collect(abandon=True) is for a call
+        given up on (timeout): whatever it logs from then on is emitted directly.
+        """
+        lock = threading.Lock()
+        state = {'records': [], 'abandoned': False}
+
+        def wrapped(*args, **kwargs):
+            self.start()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                records = self.stop()
+                with lock:
+                    if state['abandoned']:
+                        self._emit(records)
+                    else:
+                        state['records'].extend(records)
+
+        def collect(abandon=False):
+            with lock:
+                records, state['records'] = state['records'], []
+                state['abandoned'] = abandon
+            self.extend(records)
+
+        return wrapped, collect
+
+    def filter(self, record):
+        records = getattr(self._local, 'records', None)
+        if records is None:
+            return True
+        # The same record passes through every handler; keep it once
+        if not records or records[-1] is not record:
+            records.append(record)
+        return False
+
+    def replay(self, records):
+        """Emit buffered records on the handlers we are installed on."""
+        for record in records:
+            for handler in self._handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+    @staticmethod
+    def _emit(records):
+        # Through the record's own logger, so it still lands once we are uninstalled
+        for record in records:
+            logging.getLogger(record.name).handle(record)
+
+
 def setup_file_logging():
     """Setup file logging handler."""
     DATA_DIR = Path(os.environ.get("DATA_DIR", "/data"))
@@ -0,0 +1,120 @@
+"""
+Sparse ("anchor-only") transcription.
+
+The anchored alignment only needs enough unique n-grams to interpolate
+between, so instead of transcribing every second of a book we transcribe
+short windows at a fixed interval (plus chapter starts and the ending).
+After each round the caller-supplied `find_gaps` reports where the
+interpolation is unreliable and extra windows are added there.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Window = Tuple[float, float]
+
+MAX_DENSIFY_ROUNDS = 3
+
+
+def window_key(start: float) -> str:
+    """Stable key for a window start (used for progress files)."""
+    return f"{start:.3f}"
+
+
+def plan_sparse_windows(total_duration: float, window_seconds: float = 60.0, interval_seconds: float = 600.0,
+                        chapter_starts: Optional[Iterable[float]] = None) -> List[Window]:
+    """
+    Plan the initial windows: one every `interval_seconds`, one at each chapter
+    start and one covering the last `window_seconds` of the book.
+    """
+    if total_duration <= 0:
+        return []
+
+    starts = []
+    t = 0.0
+    while t < total_duration:
+        starts.append(t)
+        t += max(interval_seconds, window_seconds)
+    starts.extend(chapter_starts or [])
+    starts.append(max(0.0, total_duration - window_seconds))
+
+    return merge_windows([], starts, window_seconds, total_duration)
+
+
+def merge_windows(existing: List[Window], starts: Iterable[float], window_seconds: float,
+                  total_duration: float) -> List[Window]:
+    """Add windows at `starts`, skipping any that would overlap an existing window."""
+    windows = sorted(existing)
+    for start in sorted({round(min(max(float(s), 0.0), total_duration), 3) for s in starts}):
+        if start >= total_duration:
+            continue
+        end = min(start + window_seconds, total_duration)
+        if any(start < w_end and end > w_start for w_start, w_end in windows):
+            continue
+        windows.append((start, end))
+        windows.sort()
+    return windows
+
+
+def collect_segments(segments_by_window: Dict[str, List[Dict]], windows: List[Window]) -> List[Dict]:
+    """Flatten per-window segments into one time-ordered transcript."""
+    out = []
+    for start, _ in sorted(windows):
+        out.extend(segments_by_window.get(window_key(start), []))
+    return out
+
+
+def run_sparse_transcription(
+    transcribe_window: Callable[[float, float], List[Dict]],
+    windows: List[Window],
+    total_duration: float,
+    window_seconds: float = 60.0,
+    find_gaps: Optional[Callable[[List[Dict], List[Window]], List[float]]] = None,
+    completed: Optional[Dict[str, List[Dict]]] = None,
+    on_window: Optional[Callable[[Dict[str, List[Dict]], List[Window]], None]] = None,
+    max_rounds: int = MAX_DENSIFY_ROUNDS,
+) -> Tuple[List[Dict], List[Window]]:
+    """
+    Transcribe every planned window, then densify where `find_gaps` asks.
+
+    Args:
+        transcribe_window: Callable(start, duration) returning segments relative to `start`
+        windows: Initial (start, end) windows in book time
+        find_gaps: Callable(segments, windows) returning new window starts; None disables densifying
+        completed: Previously transcribed windows keyed by `window_key`, for resume
+        on_window: Called after each window with the current results (checkpointing/progress)
+
+    Returns:
+        (segments in book time, final window list)
+    """
+    segments_by_window = dict(completed or {})
+    windows = sorted(windows)
+    rounds = 0
+
+    while True:
+        for start, end in windows:
+            key = window_key(start)
+            if key in segments_by_window:
+                continue
+            segments_by_window[key] = [
+                {"start": seg["start"] + start, "end": seg["end"] + start, "text": seg["text"]}
+                for seg in transcribe_window(start, end - start)
+            ]
+            if on_window:
+                on_window(segments_by_window, windows)
+
+        if not find_gaps or rounds >= max_rounds:
+            break
+
+        new_starts = find_gaps(collect_segments(segments_by_window, windows), windows)
+        densified = merge_windows(windows, new_starts, window_seconds, total_duration)
+        if len(densified) == len(windows):
+            break
+
+        rounds += 1
+        logger.info(f"🔄 Sparse round {rounds}: adding {len(densified) - len(windows)} windows where anchors disagree")
+        windows = densified
+
+    return collect_segments(segments_by_window, windows), windows
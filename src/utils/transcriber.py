@@ -11,13 +11,17 @@ UPDATED VERSION with:
 - Dependency Injection for SmilExtractor
 """
 
+import hashlib
 import json
 import requests
 import logging
 import os
 import shutil
 import subprocess
+import time
 import gc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 import math
@@ -26,19 +30,41 @@ from bisect import bisect_right
 from collections import OrderedDict
 
 from src.utils.logging_utils import sanitize_log_data, time_execution
-from src.utils.transcription_providers import get_transcription_provider
+from src.utils.sparse_transcription import plan_sparse_windows, run_sparse_transcription
+from src.utils.transcription_providers import (
+    LocalWhisperProvider, get_transcription_provider, transcribe_chunk_in_worker
+)
 from src.utils.polisher import Polisher
 from src.utils.storyteller_transcript import StorytellerTranscript
 # We keep the import for type hinting, but we don't instantiate it directly anymore
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_ATTEMPTS = 3
+
+
+def _response_total_size(response, offset: int) -> Optional[int]:
+    """Full size of the remote file from Content-Range, or Content-Length plus the resume offset."""
+    content_range = response.headers.get('Content-Range')
+    if isinstance(content_range, str) and '/' in content_range:
+        total = content_range.rsplit('/', 1)[1].strip()
+        if total.isdigit():
+            return int(total)
+    content_length = response.headers.get('Content-Length')
+    if isinstance(content_length, str) and content_length.isdigit():
+        return int(content_length) + (offset if response.status_code == 206 else 0)
+    return None
+
+
 class AudioTranscriber:
     # [UPDATED] Accepted smil_extractor and polisher as arguments
     def __init__(self, data_dir, smil_extractor, polisher: Polisher):
         self.data_dir = data_dir
         self.cache_root = data_dir / "audio_cache"
         self.cache_root.mkdir(parents=True, exist_ok=True)
+        # Finished transcripts keyed by audio content, shared across jobs and re-links
+        self.transcript_cache_dir = data_dir / "transcript_cache"
 
         self.model_size = os.environ.get("WHISPER_MODEL", "base")
         
@@ -404,6 +430,300 @@ class AudioTranscriber:
 
         return new_files if new_files else [file_path]
 
+    def _prepare_audio_chunks(self, book_cache_dir: Path, audio_urls: list, max_duration: float) -> list:
+        """Download, normalize and split every audio part, reusing a complete cache."""
+        # FIX: Check if files exist for ALL parts before skipping
+        existing_files = sorted(book_cache_dir.glob("part_*_split_*.wav"))
+
+        # Check coverage: Do we have at least one file for every index in audio_urls?
+        missing_parts = False
+        for idx in range(len(audio_urls)):
+            # Look for any file starting with part_{idx:03d}
+            part_exists = any(f.name.startswith(f"part_{idx:03d}_") for f in existing_files)
+            if not part_exists:
+                missing_parts = True
+                break
+
+        if existing_files and not missing_parts:
+            logger.info(f"♻️ Found valid cache ({len(existing_files)} files covering all {len(audio_urls)} parts). Skipping download.")
+            downloaded_files = list(existing_files)
+        else:
+            if existing_files:
+                logger.warning(f"⚠️ Found {len(existing_files)} cached files but some parts are missing. Wiping cache to start fresh")
+                # Keep interrupted downloads so they can resume with a Range request
+                for stale in book_cache_dir.iterdir():
+                    if stale.name.endswith(".partial"):
+                        continue
+                    if stale.is_dir():
+                        shutil.rmtree(stale)
+                    else:
+                        stale.unlink()
+
+            book_cache_dir.mkdir(parents=True, exist_ok=True)
+            downloaded_files = []
+
+            try:
+                workers = max(1, int(os.environ.get("AUDIO_DOWNLOAD_WORKERS", "3")))
+            except ValueError:
+                workers = 3
+            workers = min(workers, max(1, len(audio_urls)))
+
+            local_paths = []
+            for idx, audio_data in enumerate(audio_urls):
+                extension = audio_data.get('ext', '.mp3')
+                if not extension.startswith('.'): extension = f".{extension}"
+                local_paths.append(book_cache_dir / f"part_{idx:03d}{extension}")
+
+            logger.info(f"📥 Phase 1: Downloading {len(audio_urls)} audio files ({workers} at a time)...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._download_part, audio_data['stream_url'], local_path, audio_data.get('size'))
+                    for audio_data, local_path in zip(audio_urls, local_paths)
+                ]
+                # Surface the first failure; the executor still lets the other parts finish
+                for future in futures:
+                    future.result()
+
+            for idx, local_path in enumerate(local_paths):
+                # Normalize to WAV
+                normalized_path = self.normalize_audio_to_wav(local_path)
+                if not normalized_path:
+                    raise ValueError(f"Normalization failed for part {idx+1}")
+
+                # Split if needed
+                downloaded_files.extend(self.split_audio_file(normalized_path, max_duration))
+
+        if not downloaded_files:
+            raise ValueError("No audio files were successfully downloaded and normalized")
+
+        return downloaded_files
+
+    @staticmethod
+    def _hash_transcript_key(variant: str, parts: list) -> str:
+        return hashlib.sha256("\n".join([variant, *parts]).encode("utf-8")).hexdigest()
+
+    def _transcript_key_from_metadata(self, audio_urls: list, variant: str) -> Optional[str]:
+        """Content key from ABS file identity (ino + size + mtime) of every part, if all are known."""
+        if not audio_urls:
+            return None
+        parts = []
+        for audio_data in audio_urls:
+            ino, size, mtime = audio_data.get('ino'), audio_data.get('size'), audio_data.get('mtime_ms')
+            if not (ino and size and mtime):
+                return None
+            parts.append(f"{ino}:{size}:{mtime}")
+        return self._hash_transcript_key(variant, parts)
+
+    def _transcript_key_from_files(self, files: list, variant: str, sample_bytes: int = 65536) -> str:
+        """Content key from the size plus head/middle/tail samples of each local chunk."""
+        parts = []
+        for path in files:
+            size = Path(path).stat().st_size
+            digest = hashlib.sha256(str(size).encode("utf-8"))
+            with open(path, 'rb') as f:
+                for offset in (0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)):
+                    f.seek(offset)
+                    digest.update(f.read(sample_bytes))
+            parts.append(digest.hexdigest())
+        return self._hash_transcript_key(variant, parts)
+
+    def _load_cached_transcript(self, cache_key: Optional[str]) -> Optional[list]:
+        if not cache_key:
+            return None
+        cache_file = self.transcript_cache_dir / f"{cache_key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'r') as f:
+                segments = json.load(f).get('segments')
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable transcript cache entry {cache_key[:12]}: {e}")
+            return None
+        if not segments:
+            return None
+        logger.info(f"⚡ Reusing cached transcript {cache_key[:12]} ({len(segments)} segments) — audio unchanged")
+        try:
+            # Recently used entries are the last to be pruned
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return segments
+
+    def _store_cached_transcript(self, cache_key: Optional[str], segments: list):
+        if not cache_key or not segments:
+            return
+        try:
+            self.transcript_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self.transcript_cache_dir / f"{cache_key}.json"
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump({'segments': segments}, f)
+            tmp_file.replace(cache_file)
+            logger.info(f"💾 Stored transcript {cache_key[:12]} in content cache")
+        except OSError as e:
+            logger.warning(f"⚠️ Could not store transcript in content cache: {e}")
+        self.prune_transcript_cache()
+
+    @staticmethod
+    def _env_number(key: str, default: float) -> float:
+        try:
+            return float(os.environ.get(key, str(default)))
+        except (ValueError, TypeError):
+            logger.warning(f"⚠️ Invalid {key} value, defaulting to {default}")
+            return float(default)
+
+    def prune_transcript_cache(self) -> int:
+        """
+        Drop transcript cache entries unused for TRANSCRIPT_CACHE_MAX_AGE_DAYS, then
+        the least recently used ones until the cache fits TRANSCRIPT_CACHE_MAX_MB.
+        Non-positive limits disable that check. Returns the number removed.
+        """
+        if not self.transcript_cache_dir.exists():
+            return 0
+        max_age = self._env_number("TRANSCRIPT_CACHE_MAX_AGE_DAYS", 90) * 86400
+        max_bytes = self._env_number("TRANSCRIPT_CACHE_MAX_MB", 500) * 1024 * 1024
+
+        entries = []
+        for path in self.transcript_cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            too_old = max_age > 0 and now - mtime > max_age
+            too_big = max_bytes > 0 and total > max_bytes
+            if not (too_old or too_big):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"⚠️ Could not prune transcript cache entry {path.name}: {e}")
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"🧹 Pruned {removed} transcript cache entries")
+        return removed
+
+    def _download_part(self, stream_url: str, local_path: Path, expected_size: Optional[int] = None) -> Path:
+        """
+        Stream one audio part to disk.
+
+        Data lands in `<name>.partial` first. If that file already holds bytes
+        from an interrupted attempt, the download resumes with an HTTP Range
+        request. The part is renamed into place only once its size matches the
+        size ABS reported (or the server's Content-Length/Content-Range).
+        """
+        if expected_size and local_path.exists() and local_path.stat().st_size == expected_size:
+            logger.info(f"   ♻️ {local_path.name} already downloaded")
+            return local_path
+
+        partial_path = local_path.with_name(local_path.name + ".partial")
+        logger.info(f"   Downloading {local_path.name}...")
+
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            offset = partial_path.stat().st_size if partial_path.exists() else 0
+            if expected_size and offset >= expected_size:
+                if offset == expected_size:
+                    break
+                partial_path.unlink()
+                offset = 0
+
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                with requests.get(stream_url, stream=True, timeout=300, headers=headers) as r:
+                    if offset and r.status_code == 416:
+                        # Nothing left to fetch: the partial file is already complete
+                        break
+                    r.raise_for_status()
+                    if offset and r.status_code != 206:
+                        logger.info(f"   Server ignored Range for {local_path.name}, restarting download")
+                        offset = 0
+                    else:
+                        if offset:
+                            logger.info(f"   ♻️ Resuming {local_path.name} from {offset / 1048576:.1f} MB")
+
+                    if expected_size is None:
+                        expected_size = _response_total_size(r, offset)
+
+                    with open(partial_path, 'ab' if offset else 'wb') as f:
+                        for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                break
+            except requests.RequestException as e:
+                if attempt == DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning(f"⚠️ Download of {local_path.name} interrupted ({e}) — retrying ({attempt}/{DOWNLOAD_ATTEMPTS})")
+
+        size = partial_path.stat().st_size if partial_path.exists() else 0
+        if size == 0:
+            raise ValueError(f"File {local_path} is empty or missing.")
+        if expected_size is not None and size != expected_size:
+            if size > expected_size:
+                partial_path.unlink()
+            raise ValueError(f"Size mismatch for {local_path.name}: got {size} bytes, expected {expected_size}")
+
+        partial_path.replace(local_path)
+        return local_path
+
+    def _get_transcription_workers(self, provider) -> int:
+        """Number of chunk worker processes; only local Whisper benefits from a process pool."""
+        try:
+            workers = int(os.environ.get("TRANSCRIPTION_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+        if workers > 1 and not isinstance(provider, LocalWhisperProvider):
+            logger.info(f"ℹ️ TRANSCRIPTION_WORKERS ignored for {provider.get_name()}, transcribing sequentially")
+            return 1
+        return max(1, workers)
+
+    def _make_chunk_executor(self, workers: int):
+        # Spawned (not forked) workers: the parent is a threaded web server
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _transcribe_chunks_parallel(self, chunk_files, pending, workers, commit_chunk):
+        """
+        Transcribe independent chunks across a process pool.
+
+        Results may arrive out of order, so they are buffered and handed to
+        `commit_chunk` strictly in chunk order. That keeps timestamp offsets
+        identical to a sequential run and lets the progress file checkpoint
+        every contiguous chunk as soon as it is available.
+        """
+        threads = os.environ.get("WHISPER_CPU_THREADS", "4")
+        logger.info(f"⚡ Transcribing {len(pending)} chunks across {workers} worker processes × {threads} threads")
+
+        results = {}
+        next_idx = pending[0]
+        with self._make_chunk_executor(workers) as executor:
+            futures = {
+                executor.submit(transcribe_chunk_in_worker, str(chunk_files[idx])): idx
+                for idx in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        logger.error(f"   ❌ Transcription failed for {chunk_files[idx].name}: {e}")
+                        raise
+                    logger.info(f"   Transcribed chunk {idx + 1}/{len(chunk_files)}")
+
+                    while next_idx in results:
+                        commit_chunk(next_idx, results.pop(next_idx))
+                        next_idx += 1
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
     @time_execution
     def process_audio(self, abs_id, audio_urls, full_book_text=None, progress_callback=None) -> Optional[list]:
         """
@@ -435,6 +755,14 @@ class AudioTranscriber:
              except (json.JSONDecodeError, OSError) as e:
                  logger.debug(f"Failed to read progress cache file: {e}")
 
+        provider = get_transcription_provider()
+        cache_variant = f"full|{provider.get_name()}"
+        cache_key = self._transcript_key_from_metadata(audio_urls, cache_variant)
+        cached = self._load_cached_transcript(cache_key)
+        if cached is not None:
+            shutil.rmtree(book_cache_dir, ignore_errors=True)
+            return cached
+
         MAX_DURATION_SECONDS = 45 * 60
 
         downloaded_files = []
@@ -468,95 +796,35 @@ class AudioTranscriber:
 
             # Phase 1: Download and Normalize (if not resuming)
             if not resuming:
-                # FIX: Check if files exist for ALL parts before skipping
-                existing_files = sorted(book_cache_dir.glob("part_*_split_*.wav"))
-                
-                # Check coverage: Do we have at least one file for every index in audio_urls?
-                missing_parts = False
-                for idx in range(len(audio_urls)):
-                    # Look for any file starting with part_{idx:03d}
-                    part_exists = any(f.name.startswith(f"part_{idx:03d}_") for f in existing_files)
-                    if not part_exists:
-                        missing_parts = True
-                        break
-                
-                if existing_files and not missing_parts:
-                    logger.info(f"♻️ Found valid cache ({len(existing_files)} files covering all {len(audio_urls)} parts). Skipping download.")
-                    downloaded_files = list(existing_files)
-                else:
-                    if existing_files:
-                        logger.warning(f"⚠️ Found {len(existing_files)} cached files but some parts are missing. Wiping cache to start fresh")
-                        shutil.rmtree(book_cache_dir)
-                    
-                    # Original logic: Wipe and Start Fresh
-                    book_cache_dir.mkdir(parents=True, exist_ok=True)
-                    downloaded_files = []
-
-                    logger.info(f"📥 Phase 1: Downloading {len(audio_urls)} audio files...")
-                    for idx, audio_data in enumerate(audio_urls):
-                        stream_url = audio_data['stream_url']
-                        extension = audio_data.get('ext', '.mp3')
-                        if not extension.startswith('.'): extension = f".{extension}"
-                        local_path = book_cache_dir / f"part_{idx:03d}{extension}"
-
-                        logger.info(f"   Downloading Part {idx + 1}/{len(audio_urls)}...")
-                        with requests.get(stream_url, stream=True, timeout=300) as r:
-                            r.raise_for_status()
-                            with open(local_path, 'wb') as f:
-                                for chunk in r.iter_content(chunk_size=8192):
-                                    f.write(chunk)
-
-                        if not local_path.exists() or local_path.stat().st_size == 0:
-                            raise ValueError(f"File {local_path} is empty or missing.")
-
-                        # Normalize to WAV
-                        normalized_path = self.normalize_audio_to_wav(local_path)
-                        if not normalized_path:
-                            raise ValueError(f"Normalization failed for part {idx+1}")
-
-                        # Split if needed
-                        downloaded_files.extend(self.split_audio_file(normalized_path, MAX_DURATION_SECONDS))
-
-                    if not downloaded_files:
-                        raise ValueError("No audio files were successfully downloaded and normalized")
+                downloaded_files = self._prepare_audio_chunks(book_cache_dir, audio_urls, MAX_DURATION_SECONDS)
 
-                if not downloaded_files:
-                    raise ValueError("No audio files were successfully downloaded and normalized")
+            if cache_key is None:
+                # ABS didn't give us file identity; fall back to sampling the audio itself
+                cache_key = self._transcript_key_from_files(downloaded_files, cache_variant)
+                cached = self._load_cached_transcript(cache_key)
+                if cached is not None:
+                    shutil.rmtree(book_cache_dir, ignore_errors=True)
+                    return cached
 
             # Phase 2: Transcribe
             logger.info(f"✅ All parts cached. Starting transcription ({len(downloaded_files)} chunks)...")
-            provider = get_transcription_provider()
             logger.info(f"🧠 Phase 2: Transcribing using {provider.get_name()}...")
 
             total_chunks = len(downloaded_files)
-            # Calculate total audio duration for progress reporting
-            total_audio_duration = sum(self.get_audio_duration(f) for f in downloaded_files)
-
-            for idx, local_path in enumerate(downloaded_files):
-                # Skip already-completed chunks when resuming
-                if idx < chunks_completed:
-                    continue
-
-                duration = self.get_audio_duration(local_path)
-                pct = (cumulative_duration / total_audio_duration * 100) if total_audio_duration > 0 else 0
-                logger.info(f"   [{pct:.0f}%] Transcribing chunk {idx + 1}/{total_chunks} ({duration/60:.1f} min)...")
-
-                try:
-                    # Use the transcription provider
-                    segments = provider.transcribe(local_path)
-                    
-                    for segment in segments:
-                        full_transcript.append({
-                            "start": segment["start"] + cumulative_duration,
-                            "end": segment["end"] + cumulative_duration,
-                            "text": segment["text"]
-                        })
-
-                except Exception as e:
-                    logger.error(f"   ❌ Transcription failed for {local_path.name}: {e}")
-                    raise
+            # Probe each chunk once; durations drive both progress reporting and timestamp offsets
+            chunk_durations = [self.get_audio_duration(f) for f in downloaded_files]
+            total_audio_duration = sum(chunk_durations)
+
+            def commit_chunk(idx, segments):
+                nonlocal cumulative_duration, chunks_completed
+                for segment in segments:
+                    full_transcript.append({
+                        "start": segment["start"] + cumulative_duration,
+                        "end": segment["end"] + cumulative_duration,
+                        "text": segment["text"]
+                    })
 
-                cumulative_duration += duration
+                cumulative_duration += chunk_durations[idx]
                 chunks_completed = idx + 1
 
                 # Save progress after each chunk for resumption
@@ -572,7 +840,30 @@ class AudioTranscriber:
                     # Report progress for this phase (handled by SyncManager logic)
                     progress_callback(chunks_completed / total_chunks)
 
-                gc.collect()
+            # Skip already-completed chunks when resuming
+            pending = list(range(chunks_completed, total_chunks))
+            workers = self._get_transcription_workers(provider)
+
+            if workers > 1 and len(pending) > 1:
+                self._transcribe_chunks_parallel(downloaded_files, pending, workers, commit_chunk)
+            else:
+                for idx in pending:
+                    local_path = downloaded_files[idx]
+                    duration = chunk_durations[idx]
+                    pct = (cumulative_duration / total_audio_duration * 100) if total_audio_duration > 0 else 0
+                    logger.info(f"   [{pct:.0f}%] Transcribing chunk {idx + 1}/{total_chunks} ({duration/60:.1f} min)...")
+
+                    try:
+                        # Use the transcription provider
+                        segments = provider.transcribe(local_path)
+                    except Exception as e:
+                        logger.error(f"   ❌ Transcription failed for {local_path.name}: {e}")
+                        raise
+
+                    commit_chunk(idx, segments)
+                    gc.collect()
+
+            self._store_cached_transcript(cache_key, full_transcript)
 
             # Clean up cache only on success
             if book_cache_dir.exists():
@@ -585,6 +876,128 @@ class AudioTranscriber:
             # Don't delete cache dir - allows resume on retry
             raise e
 
+    def extract_audio_window(self, file_path: Path, start: float, duration: float, out_path: Path) -> Optional[Path]:
+        """Cut `duration` seconds starting at `start` out of a chunk as 16kHz mono WAV."""
+        cmd = [
+            'ffmpeg', '-y',
+            '-ss', str(start),
+            '-t', str(duration),
+            '-i', str(file_path),
+            '-ar', '16000',
+            '-ac', '1',
+            '-c:a', 'pcm_s16le',
+            '-f', 'wav',
+            '-loglevel', 'error',
+            str(out_path)
+        ]
+        try:
+            subprocess.run(cmd, check=True)
+            return out_path
+        except subprocess.CalledProcessError as e:
+            logger.error(f"❌ Failed to extract window at {start:.0f}s from '{file_path.name}': {e}")
+            return None
+
+    @time_execution
+    def process_audio_sparse(self, abs_id, audio_urls, chapters=None, find_gaps=None, progress_callback=None) -> Optional[list]:
+        """
+        Sparse ("anchor-only") transcription pipeline.
+
+        Transcribes SPARSE_WINDOW_SECONDS of audio every SPARSE_INTERVAL_SECONDS,
+        plus each chapter start and the ending, then adds windows wherever
+        `find_gaps(segments, windows)` reports the anchors disagree.
+        Returns segments in book time, like `process_audio`.
+        """
+        window_seconds = float(os.environ.get("SPARSE_WINDOW_SECONDS", "60"))
+        interval_seconds = float(os.environ.get("SPARSE_INTERVAL_SECONDS", "600"))
+        MAX_DURATION_SECONDS = 45 * 60
+
+        book_cache_dir = self.cache_root / str(abs_id)
+        book_cache_dir.mkdir(parents=True, exist_ok=True)
+        progress_file = book_cache_dir / "_sparse_progress.json"
+
+        completed = {}
+        if progress_file.exists():
+            try:
+                with open(progress_file, 'r') as f:
+                    completed = json.load(f).get('windows', {})
+                if completed:
+                    logger.info(f"♻️ Resuming sparse transcription: {len(completed)} windows previously done")
+            except (json.JSONDecodeError, OSError) as e:
+                logger.debug(f"Failed to read sparse progress file: {e}")
+
+        provider = get_transcription_provider()
+        cache_variant = f"sparse:{window_seconds:g}:{interval_seconds:g}|{provider.get_name()}"
+        cache_key = self._transcript_key_from_metadata(audio_urls, cache_variant)
+        cached = self._load_cached_transcript(cache_key)
+        if cached is not None:
+            shutil.rmtree(book_cache_dir, ignore_errors=True)
+            return cached
+
+        try:
+            chunk_files = self._prepare_audio_chunks(book_cache_dir, audio_urls, MAX_DURATION_SECONDS)
+            if cache_key is None:
+                cache_key = self._transcript_key_from_files(chunk_files, cache_variant)
+                cached = self._load_cached_transcript(cache_key)
+                if cached is not None:
+                    shutil.rmtree(book_cache_dir, ignore_errors=True)
+                    return cached
+
+            chunk_durations = [self.get_audio_duration(f) for f in chunk_files]
+            chunk_offsets = [sum(chunk_durations[:i]) for i in range(len(chunk_files))]
+            total_duration = sum(chunk_durations)
+
+            chapter_starts = [float(c.get('start', 0)) for c in (chapters or []) if c.get('start') is not None]
+            windows = plan_sparse_windows(total_duration, window_seconds, interval_seconds, chapter_starts)
+
+            logger.info(f"🧠 Sparse transcription using {provider.get_name()}: {len(windows)} windows "
+                        f"of {window_seconds:.0f}s across {total_duration / 3600:.1f}h")
+
+            def transcribe_window(start, duration):
+                idx = max(0, bisect_right(chunk_offsets, start) - 1)
+                local_start = start - chunk_offsets[idx]
+                duration = min(duration, chunk_durations[idx] - local_start)
+                window_path = book_cache_dir / f"window_{start:010.3f}.wav"
+                if duration <= 0 or not self.extract_audio_window(chunk_files[idx], local_start, duration, window_path):
+                    return []
+                try:
+                    return provider.transcribe(window_path)
+                finally:
+                    window_path.unlink(missing_ok=True)
+
+            def on_window(segments_by_window, current_windows):
+                with open(progress_file, 'w') as f:
+                    json.dump({'windows': segments_by_window}, f)
+                if progress_callback:
+                    progress_callback(min(0.99, len(segments_by_window) / max(1, len(current_windows))))
+
+            segments, windows = run_sparse_transcription(
+                transcribe_window, windows, total_duration,
+                window_seconds=window_seconds,
+                find_gaps=find_gaps,
+                completed=completed,
+                on_window=on_window,
+            )
+
+            transcribed = sum(end - start for start, end in windows)
+            pct = (transcribed / total_duration * 100) if total_duration > 0 else 0
+            logger.info(f"✅ Sparse transcription done: {len(windows)} windows, "
+                        f"{transcribed / 60:.0f} of {total_duration / 60:.0f} min ({pct:.0f}%)")
+
+            # Empty end marker so alignment pins the end of the text to the real book length
+            segments.append({"start": total_duration, "end": total_duration, "text": ""})
+            self._store_cached_transcript(cache_key, segments)
+
+            if progress_callback:
+                progress_callback(1.0)
+            if book_cache_dir.exists():
+                shutil.rmtree(book_cache_dir)
+            return segments
+
+        except Exception as e:
+            logger.error(f"❌ Sparse transcription failed: {e}")
+            # Don't delete cache dir - allows resume on retry
+            raise e
+
     def _is_low_quality_text(self, text: str, min_word_count: int = 3) -> bool:
         """
         Check if transcript segment text is low-quality for sync purposes.
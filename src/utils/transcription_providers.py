@@ -7,6 +7,8 @@ Supports local Whisper and cloud providers like Deepgram.
 
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
@@ -14,6 +16,176 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+class WhisperModelPool:
+    """
+    Process-wide pool of loaded faster-whisper models.
+
+    Models are keyed by (model_size, device, compute_type) and reference counted,
+    so successive or concurrent jobs share one copy of the weights. Once a model
+    has no holders it stays warm for `idle_timeout` seconds and is then unloaded.
+    A non-positive timeout keeps idle models loaded until `clear()` is called.
+
+    Loading happens outside the pool lock, so a slow download or load never
+    blocks other keys or `stats()`. Concurrent callers for the same key wait
+    for the one load in progress.
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        if idle_timeout is None:
+            idle_timeout = float(os.environ.get("WHISPER_MODEL_IDLE_TIMEOUT", "300"))
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._loading = {}  # key -> Event set when its load finishes (or fails)
+        self._timers = {}
+        self._stats = {
+            "loads": 0,
+            "unloads": 0,
+            "total_load_seconds": 0.0,
+            "total_unload_seconds": 0.0,
+            "last_load_seconds": None,
+            "last_unload_seconds": None,
+        }
+
+    def acquire(self, model_size: str, device: str, compute_type: str,
+                download_root: str, cpu_threads: Optional[int] = None):
+        """Return a shared model for the key, loading it on first use."""
+        key = (model_size, device, compute_type)
+        while True:
+            with self._lock:
+                self._cancel_timer(key)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry["refcount"] += 1
+                    entry["last_used"] = time.time()
+                    return entry["model"]
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            # Another caller is loading this key; re-check once it is done (it may have failed)
+            loading.wait()
+
+        try:
+            entry = self._load(key, download_root, cpu_threads)
+            with self._lock:
+                self._stats["loads"] += 1
+                self._stats["total_load_seconds"] += entry["load_seconds"]
+                self._stats["last_load_seconds"] = entry["load_seconds"]
+                entry["refcount"] = 1
+                entry["last_used"] = time.time()
+                self._entries[key] = entry
+                return entry["model"]
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            loading.set()
+
+    def release(self, key: tuple):
+        """Drop one reference; idle models are scheduled for eviction."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry["refcount"] = max(0, entry["refcount"] - 1)
+            entry["last_used"] = time.time()
+            if entry["refcount"] == 0 and self.idle_timeout > 0:
+                self._cancel_timer(key)
+                timer = threading.Timer(self.idle_timeout, self.evict_idle)
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Unload every unreferenced model idle for at least `idle_timeout`."""
+        now = time.time() if now is None else now
+        evicted = 0
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry["refcount"] == 0 and now - entry["last_used"] >= self.idle_timeout:
+                    self._unload(key)
+                    evicted += 1
+        return evicted
+
+    def clear(self):
+        """Unload every model regardless of holders (shutdown/tests)."""
+        with self._lock:
+            for key in list(self._entries):
+                self._unload(key)
+
+    def stats(self) -> dict:
+        """Snapshot of pool contents and load/unload timings."""
+        with self._lock:
+            models = [
+                {
+                    "model_size": key[0],
+                    "device": key[1],
+                    "compute_type": key[2],
+                    "cpu_threads": entry["cpu_threads"],
+                    "refcount": entry["refcount"],
+                    "load_seconds": round(entry["load_seconds"], 3),
+                    "idle_seconds": round(time.time() - entry["last_used"], 1) if entry["refcount"] == 0 else 0,
+                }
+                for key, entry in self._entries.items()
+            ]
+            return {**self._stats, "idle_timeout": self.idle_timeout, "models": models}
+
+    def _load(self, key: tuple, download_root: str, cpu_threads: Optional[int]) -> dict:
+        from faster_whisper import WhisperModel
+        model_size, device, compute_type = key
+        logger.info(f"⚙️ Loading Whisper: model={model_size}, device={device}, compute_type={compute_type}")
+
+        model_kwargs = {'device': device, 'compute_type': compute_type}
+        if device == 'cpu':
+            model_kwargs['cpu_threads'] = cpu_threads or 4
+
+        start = time.perf_counter()
+        model = WhisperModel(model_size, download_root=download_root, **model_kwargs)
+        elapsed = time.perf_counter() - start
+        logger.info(f"✅ Whisper model '{model_size}' loaded in {elapsed:.1f}s")
+        return {
+            "model": model,
+            "refcount": 0,
+            "last_used": time.time(),
+            "load_seconds": elapsed,
+            "cpu_threads": model_kwargs.get('cpu_threads'),
+        }
+
+    def _unload(self, key: tuple):
+        self._cancel_timer(key)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        start = time.perf_counter()
+        del entry["model"]
+        import gc
+        gc.collect()
+        elapsed = time.perf_counter() - start
+
+        self._stats["unloads"] += 1
+        self._stats["total_unload_seconds"] += elapsed
+        self._stats["last_unload_seconds"] = elapsed
+        logger.info(f"🧹 Unloaded idle Whisper model '{key[0]}' ({key[1]}/{key[2]}) in {elapsed:.2f}s")
+
+    def _cancel_timer(self, key: tuple):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+
+_model_pool: Optional[WhisperModelPool] = None
+_model_pool_lock = threading.Lock()
+
+
+def get_whisper_model_pool() -> WhisperModelPool:
+    """Return the process-wide Whisper model pool."""
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            _model_pool = WhisperModelPool()
+        return _model_pool
+
+
 class TranscriptionSegment:
     """Represents a single transcription segment with timing."""
     def __init__(self, start: float, end: float, text: str):
@@ -59,7 +231,13 @@ class LocalWhisperProvider(TranscriptionProvider):
         self.model_size = os.environ.get("WHISPER_MODEL", "base")
         self.whisper_device = os.environ.get("WHISPER_DEVICE", "auto").lower()
         self.whisper_compute_type = os.environ.get("WHISPER_COMPUTE_TYPE", "auto").lower()
+        try:
+            self.cpu_threads = max(1, int(os.environ.get("WHISPER_CPU_THREADS", "4")))
+        except ValueError:
+            self.cpu_threads = 4
         self._model = None
+        self._model_key = None
+        self._device_config = None
     
     def get_name(self) -> str:
         return f"LocalWhisper ({self.model_size})"
@@ -88,42 +266,56 @@ class LocalWhisperProvider(TranscriptionProvider):
         return device, compute_type
     
     def _get_model(self):
-        """Lazy-load the Whisper model."""
+        """Acquire the Whisper model from the shared pool."""
         if self._model is None:
-            from faster_whisper import WhisperModel
-            device, compute_type = self._get_device_config()
-            logger.info(f"⚙️ Loading Whisper: model={self.model_size}, device={device}, compute_type={compute_type}")
-            
-            model_kwargs = {'device': device, 'compute_type': compute_type}
-            if device == 'cpu':
-                model_kwargs['cpu_threads'] = 4
-            
-            self._model = WhisperModel(
+            if self._device_config is None:
+                self._device_config = self._get_device_config()
+            device, compute_type = self._device_config
+            self._model = get_whisper_model_pool().acquire(
                 self.model_size,
+                device,
+                compute_type,
                 download_root=str(Path(os.environ.get("DATA_DIR", "/data")) / "models"),
-                **model_kwargs,
+                cpu_threads=self.cpu_threads,
             )
+            self._model_key = (self.model_size, device, compute_type)
         return self._model
+
+    def release_model(self):
+        """Hand the model back to the pool so it can be evicted once idle."""
+        if self._model is not None:
+            get_whisper_model_pool().release(self._model_key)
+            self._model = None
+            self._model_key = None
     
     def transcribe(self, audio_path: Path, progress_callback=None) -> list[dict]:
         """Transcribe using local Whisper model."""
         model = self._get_model()
         segments_out = []
         
-        logger.info(f"🧠 Transcribing with {self.get_name()}: {audio_path.name}")
-        segments, info = model.transcribe(str(audio_path), beam_size=1, best_of=1)
-        
-        for segment in segments:
-            segments_out.append({
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text.strip()
-            })
+        try:
+            logger.info(f"🧠 Transcribing with {self.get_name()}: {audio_path.name}")
+            segments, info = model.transcribe(str(audio_path), beam_size=1, best_of=1)
+            
+            for segment in segments:
+                segments_out.append({
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text.strip()
+                })
+        finally:
+            del model
+            self.release_model()
         
         logger.info(f"✅ Transcription complete: {len(segments_out)} segments")
         return segments_out
 
 
+def transcribe_chunk_in_worker(audio_path: str) -> list[dict]:
+    """Process-pool entry point: transcribe one chunk with this worker's pooled model."""
+    return LocalWhisperProvider().transcribe(Path(audio_path))
+
+
 class DeepgramProvider(TranscriptionProvider):
     """Cloud transcription using Deepgram API."""
     
@@ -28,6 +28,7 @@ from src.version import APP_VERSION, get_update_status
 from src.db.models import State
 from src.sync_clients.sync_client_interface import LocatorResult, UpdateProgressRequest
 from src.utils.storyteller_transcript import StorytellerTranscript
+from src.utils.transcription_providers import get_whisper_model_pool
 
 def _reconfigure_logging():
     """Force update of root logger level based on env var."""
@@ -69,6 +70,11 @@ def setup_dependencies(app, test_container=None):
         ConfigLoader.load_settings(database_service)
         logger.info("✅ Settings loaded into environment variables")
 
+        # The read cache was sized before the DB settings were in the environment
+        database_service.read_cache.configure()
+        database_service.maintenance.configure()
+        database_service.search_index.configure()
+
         # Force reconfigure logging level based on new settings
         _reconfigure_logging()
 
@@ -260,6 +266,12 @@ def sync_daemon():
         # Use the global SYNC_PERIOD_MINS which is validated
         schedule.every(int(SYNC_PERIOD_MINS)).minutes.do(manager.sync_cycle)
         schedule.every(1).minutes.do(manager.check_pending_jobs)
+        try:
+            maintenance_mins = max(1, int(os.environ.get("DB_MAINTENANCE_INTERVAL_MINS", "15")))
+        except (ValueError, TypeError):
+            logger.warning("⚠️ Invalid DB_MAINTENANCE_INTERVAL_MINS value, defaulting to 15")
+            maintenance_mins = 15
+        schedule.every(maintenance_mins).minutes.do(database_service.run_maintenance)
 
         logger.info(f"🔄 Sync daemon started (period: {SYNC_PERIOD_MINS} minutes)")
 
@@ -455,16 +467,18 @@ class EbookResult:
 
 def get_searchable_ebooks(search_term):
     """Get ebooks from Booklore API, filesystem, ABS, and CWA.
-    Returns list of EbookResult objects for consistent interface."""
+    Returns list of EbookResult objects for consistent interface.
+    Sources are looked up in the local search index first (see LibraryService)."""
 
     results = []
     found_filenames = set()
     found_stems = set()  # To dedupe by title stem
+    library_service = container.library_service()
 
     # 1. Booklore
     if container.booklore_client().is_configured():
         try:
-            books = container.booklore_client().search_books(search_term)
+            books = library_service.search_booklore(search_term)
             if books:
                 for b in books:
                     fname = b.get('fileName', '')
@@ -485,58 +499,46 @@ def get_searchable_ebooks(search_term):
     # 2. ABS ebook libraries
     if search_term:
         try:
-            abs_client = container.abs_client()
-            if abs_client:
-                abs_ebooks = abs_client.search_ebooks(search_term)
-                if abs_ebooks:
-                    for ab in abs_ebooks:
-                        ebook_files = abs_client.get_ebook_files(ab['id'])
-                        if ebook_files:
-                            ef = ebook_files[0]
-                            fname = f"{ab['id']}_abs.{ef['ext']}"
-                            if fname.lower() not in found_filenames:
-                                results.append(EbookResult(
-                                    name=fname,
-                                    title=ab.get('title'),
-                                    authors=ab.get('author'),
-                                    source='ABS',
-                                    source_id=ab.get('id')
-                                ))
-                                found_filenames.add(fname.lower())
-                                if ab.get('title'):
-                                    found_stems.add(ab['title'].lower().strip())
+            for ab in library_service.search_abs_ebooks(search_term):
+                fname = f"{ab['id']}_abs.{ab['ext']}"
+                if fname.lower() not in found_filenames:
+                    results.append(EbookResult(
+                        name=fname,
+                        title=ab.get('title'),
+                        authors=ab.get('author'),
+                        source='ABS',
+                        source_id=ab.get('id')
+                    ))
+                    found_filenames.add(fname.lower())
+                    if ab.get('title'):
+                        found_stems.add(ab['title'].lower().strip())
         except Exception as e:
             logger.warning(f"⚠️ ABS ebook search failed: {e}")
 
     # 3. CWA (Calibre-Web Automated)
     if search_term:
         try:
-            library_service = container.library_service()
-            if library_service and library_service.cwa_client and library_service.cwa_client.is_configured():
-                cwa_results = library_service.cwa_client.search_ebooks(search_term)
-                if cwa_results:
-                    for cr in cwa_results:
-                        fname = f"cwa_{cr.get('id', 'unknown')}.{cr.get('ext', 'epub')}"
-                        if fname.lower() not in found_filenames:
-                            results.append(EbookResult(
-                                name=fname,
-                                title=cr.get('title'),
-                                authors=cr.get('author'),
-                                path=cr.get('download_url'),
-                                source='CWA',
-                                source_id=cr.get('id')
-                            ))
-                            found_filenames.add(fname.lower())
-                            if cr.get('title'):
-                                found_stems.add(cr['title'].lower().strip())
+            for cr in library_service.search_cwa(search_term):
+                fname = f"cwa_{cr.get('id', 'unknown')}.{cr.get('ext', 'epub')}"
+                if fname.lower() not in found_filenames:
+                    results.append(EbookResult(
+                        name=fname,
+                        title=cr.get('title'),
+                        authors=cr.get('author'),
+                        path=cr.get('download_url'),
+                        source='CWA',
+                        source_id=cr.get('id')
+                    ))
+                    found_filenames.add(fname.lower())
+                    if cr.get('title'):
+                        found_stems.add(cr['title'].lower().strip())
         except Exception as e:
             logger.warning(f"⚠️ CWA search failed: {e}")
 
     # 4. Search filesystem (Local) - LOW PRIORITY
     if EBOOK_DIR.exists():
         try:
-            all_epubs = list(EBOOK_DIR.glob("**/*.epub"))
-            for eb in all_epubs:
+            for eb in library_service.search_local_ebooks(search_term, EBOOK_DIR):
                 fname_lower = eb.name.lower()
                 stem_lower = eb.stem.lower()
 
@@ -544,10 +546,9 @@ def get_searchable_ebooks(search_term):
                 if fname_lower in found_filenames or stem_lower in found_stems:
                     continue
 
-                if not search_term or search_term.lower() in fname_lower:
-                    results.append(EbookResult(name=eb.name, path=eb, source='Local File'))
-                    found_filenames.add(fname_lower)
-                    found_stems.add(stem_lower)
+                results.append(EbookResult(name=eb.name, path=eb, source='Local File'))
+                found_filenames.add(fname_lower)
+                found_stems.add(stem_lower)
 
         except Exception as e:
             logger.warning(f"⚠️ Filesystem search failed: {e}")
@@ -599,6 +600,7 @@ def settings():
             'ABS_ONLY_SEARCH_IN_ABS_LIBRARY_ID',
             'REPROCESS_ON_CLEAR_IF_NO_ALIGNMENT',
             'INSTANT_SYNC_ENABLED',
+            'DB_READ_CACHE_ENABLED',
         ]
 
         # Current settings in DB
@@ -1999,7 +2001,15 @@ def api_status():
 
         mappings.append(mapping)
 
-    return jsonify({"mappings": mappings})
+    return jsonify({
+        "mappings": mappings,
+        "whisper_pool": get_whisper_model_pool().stats(),
+        "sync_cycle": manager.get_cycle_metrics() if manager else {},
+        "db_read_cache": database_service.get_read_cache_stats(),
+        "database": database_service.get_storage_stats(),
+        "booklore_refresh": container.booklore_client().get_refresh_stats()
+        if container.booklore_client().is_configured() else {},
+    })
 
 
 def logs_view():
@@ -2651,6 +2661,8 @@ if __name__ == '__main__':
         if hasattr(logging.getLogger(), 'handlers'):
             for handler in logging.getLogger().handlers:
                 handler.flush()
+        if manager:
+            manager.shutdown_client_executors()
         sys.exit(0)
 
     signal.signal(signal.SIGTERM, handle_exit_signal)
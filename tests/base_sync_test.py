@@ -165,6 +165,7 @@ class BaseSyncCycleTestCase(unittest.TestCase, ABC):
         database_service.get_books_by_status.return_value = [self.test_book]
         database_service.get_book.return_value = self.test_book
         database_service.get_states_for_book.return_value = self.test_states
+        database_service.get_states_for_active_books.return_value = {self.test_book.abs_id: self.test_states}
         database_service.save_book.return_value = self.test_book
         database_service.save_state.return_value = None
 
@@ -310,8 +311,10 @@ class BaseSyncCycleTestCase(unittest.TestCase, ABC):
             if leader != 'BOOKLORE':
                 self.assertTrue(mocks['booklore_client'].update_progress.called, "BookLore update_progress was not called")
 
-            # Verify state persistence using database service
-            self.assertTrue(mocks['database_service'].save_state.called, "State was not saved to database service")
+            # Verify state persistence through the sync's unit of work
+            unit = mocks['database_service'].unit_of_work.return_value
+            self.assertTrue(unit.save_state.called, "State was not saved to database service")
+            self.assertTrue(unit.commit.called, "Staged states were not committed")
 
         # Verify specific call arguments
         mocks['abs_client'].get_progress.assert_called_with(abs_id)
@@ -326,11 +329,11 @@ class BaseSyncCycleTestCase(unittest.TestCase, ABC):
         abs_id = self.test_mapping['abs_id']
 
         # Get final state from database service instead of manager.state
-        # Since we're mocking the database service, we can verify that save_state was called
-        # and check the call arguments to see what states were saved
+        # Since we're mocking the database service, we can verify that states were staged
+        # on the sync's unit of work and check the call arguments to see what was saved
         if hasattr(manager, 'database_service') and manager.database_service:
             # Verify that save_state was called for each client
-            save_state_calls = manager.database_service.save_state.call_args_list
+            save_state_calls = manager.database_service.unit_of_work.return_value.save_state.call_args_list
 
             # Create a dict of final states from the save_state calls
             final_states = {}
@@ -0,0 +1,141 @@
+"""
+Download tests for AudioTranscriber against a local HTTP stand-in server.
+"""
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.transcriber import AudioTranscriber, DOWNLOAD_CHUNK_SIZE
+
+
+class _AudioServer:
+    """Serves in-memory files with Range support, optionally dropping the first connection."""
+
+    def __init__(self, files, delay=0.0, drop_first_after=None):
+        self.files = files
+        self.delay = delay
+        self.drop_first_after = drop_first_after
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests.append((self.path, self.headers.get("Range")))
+                    first = len(server.requests) == 1
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    data = server.files[self.path]
+                    start = 0
+                    range_header = self.headers.get("Range")
+                    if range_header:
+                        start = int(range_header.split("=")[1].split("-")[0])
+                        if start >= len(data):
+                            self.send_response(416)
+                            self.end_headers()
+                            return
+                        self.send_response(206)
+                        self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                    else:
+                        self.send_response(200)
+                    body = data[start:]
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    time.sleep(server.delay)
+                    if first and server.drop_first_after is not None:
+                        self.wfile.write(body[:server.drop_first_after])
+                        self.wfile.flush()
+                        self.close_connection = True
+                        return
+                    self.wfile.write(body)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestAudioDownload(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        self.transcriber = AudioTranscriber(self.data_dir, MagicMock(), MagicMock())
+        self.cache_dir = self.data_dir / "audio_cache" / "book"
+        self.cache_dir.mkdir(parents=True)
+        self.payload = bytes(range(256)) * 4096  # 1 MiB
+
+    def _serve(self, **kwargs):
+        server = _AudioServer(kwargs.pop("files", {"/a.mp3": self.payload}), **kwargs)
+        self.addCleanup(server.close)
+        return server
+
+    def test_interrupted_download_resumes_with_range(self):
+        server = self._serve(drop_first_after=300_000)
+        target = self.cache_dir / "part_000.mp3"
+
+        self.transcriber._download_part(f"{server.url}/a.mp3", target, expected_size=len(self.payload))
+
+        self.assertEqual(target.read_bytes(), self.payload)
+        self.assertEqual(server.requests[0], ("/a.mp3", None))
+        # Only whole buffers that reached disk before the drop are kept
+        resume_at = (300_000 // DOWNLOAD_CHUNK_SIZE) * DOWNLOAD_CHUNK_SIZE
+        self.assertGreater(resume_at, 0)
+        self.assertEqual(server.requests[1], ("/a.mp3", f"bytes={resume_at}-"))
+        self.assertFalse(target.with_name("part_000.mp3.partial").exists())
+
+    def test_partial_file_from_previous_job_is_resumed(self):
+        server = self._serve()
+        target = self.cache_dir / "part_000.mp3"
+        target.with_name("part_000.mp3.partial").write_bytes(self.payload[:1000])
+
+        self.transcriber._download_part(f"{server.url}/a.mp3", target)
+
+        self.assertEqual(server.requests, [("/a.mp3", "bytes=1000-")])
+        self.assertEqual(target.read_bytes(), self.payload)
+
+    def test_size_mismatch_is_rejected(self):
+        server = self._serve()
+        target = self.cache_dir / "part_000.mp3"
+
+        with self.assertRaises(ValueError):
+            self.transcriber._download_part(f"{server.url}/a.mp3", target, expected_size=len(self.payload) + 1)
+        self.assertFalse(target.exists())
+
+    def test_parts_download_concurrently_up_to_limit(self):
+        files = {f"/{i}.mp3": self.payload[: 1000 + i] for i in range(4)}
+        server = self._serve(files=files, delay=0.2)
+        self.transcriber.normalize_audio_to_wav = MagicMock(side_effect=lambda p: p)
+        self.transcriber.split_audio_file = MagicMock(side_effect=lambda p, d: [p])
+        audio_urls = [{"stream_url": f"{server.url}/{i}.mp3", "ext": "mp3", "size": 1000 + i} for i in range(4)]
+
+        with unittest.mock.patch.dict("os.environ", {"AUDIO_DOWNLOAD_WORKERS": "2"}):
+            chunks = self.transcriber._prepare_audio_chunks(self.cache_dir, audio_urls, 2700)
+
+        self.assertEqual(server.max_active, 2)
+        self.assertEqual([c.name for c in chunks], [f"part_{i:03d}.mp3" for i in range(4)])
+        self.assertEqual([c.stat().st_size for c in chunks], [1000, 1001, 1002, 1003])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the content-addressed blob store and alignment maps kept in it.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.db.blob_store import BlobStore
+from src.db.database_service import DatabaseService
+from src.db.models import Book, BookAlignment
+from src.services.alignment_service import AlignmentService
+from src.utils.polisher import Polisher
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MAP = [{'char': 0, 'ts': 0.0}, {'char': 500, 'ts': 50.0}]
+
+
+class TestBlobStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = BlobStore(Path(self.temp_dir) / 'blobs')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_and_dedupe(self):
+        first = self.store.put(b'x' * 10000)
+        second = self.store.put(b'x' * 10000)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.get(first), b'x' * 10000)
+        stats = self.store.stats()
+        self.assertEqual(stats['count'], 1)
+        self.assertLess(stats['bytes'], 10000)
+
+    def test_corrupt_blob_detected(self):
+        digest = self.store.put(b'original')
+        self.store.path_for(digest).write_bytes(self.store.path_for(self.store.put(b'tampered')).read_bytes())
+
+        self.assertFalse(self.store.verify(digest))
+        with self.assertRaises(ValueError):
+            self.store.get(digest)
+
+    def test_garbage_collection_keeps_referenced_and_recent(self):
+        kept = self.store.put(b'kept')
+        old = self.store.put(b'old')
+        recent = self.store.put(b'recent')
+        past = time.time() - 7200
+        for digest in (kept, old):
+            os.utime(self.store.path_for(digest), (past, past))
+
+        self.assertEqual(self.store.collect_garbage({kept}, min_age_seconds=3600), 1)
+        self.assertEqual(set(self.store.iter_digests()), {kept, recent})
+
+    def test_put_of_existing_blob_protects_it_from_collection(self):
+        digest = self.store.put(b'orphan')
+        past = time.time() - 7200
+        os.utime(self.store.path_for(digest), (past, past))
+
+        # Re-referenced by a write whose row is not committed yet
+        self.store.put(b'orphan')
+
+        self.assertEqual(self.store.collect_garbage(set(), min_age_seconds=3600), 0)
+        self.assertTrue(self.store.exists(digest))
+
+
+class TestAlignmentBlobs(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / 'database.db'
+        self.db = DatabaseService(str(self.db_path))
+        self.alignments = AlignmentService(self.db, Polisher())
+        for abs_id in ('a1', 'a2'):
+            self.db.save_book(Book(abs_id=abs_id, abs_title=abs_id))
+
+    def tearDown(self):
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _row(self, abs_id):
+        with self.db.get_session() as session:
+            row = session.query(BookAlignment).filter_by(abs_id=abs_id).first()
+            session.expunge(row)
+            return row
+
+    def test_saved_map_stored_outside_database(self):
+        self.alignments._save_alignment('a1', MAP)
+
+        row = self._row('a1')
+        self.assertIsNone(row.alignment_map_json)
+        self.assertEqual(row.point_count, 2)
+        self.assertTrue(self.db.blob_store.exists(row.blob_sha256))
+        self.assertEqual(self.alignments._get_alignment('a1'), MAP)
+        self.assertEqual(self.alignments.get_aligned_book_ids(), {'a1'})
+
+    def test_inline_maps_offloaded(self):
+        with self.db.get_session() as session:
+            session.add(BookAlignment(abs_id='a1', alignment_map_json='[{"char": 0, "ts": 0.0}]'))
+            session.add(BookAlignment(abs_id='a2', alignment_map_json='[]'))
+
+        self.assertEqual(self.db.offload_inline_alignments(), 2)
+
+        self.assertIsNone(self._row('a1').alignment_map_json)
+        self.assertEqual(self.alignments._get_alignment('a1'), [{'char': 0, 'ts': 0.0}])
+        self.assertEqual(self.alignments.get_aligned_book_ids(), {'a1'})
+        self.assertEqual(self.db.offload_inline_alignments(), 0)
+
+    def test_missing_blob_reads_as_no_alignment(self):
+        self.alignments._save_alignment('a1', MAP)
+        self.db.blob_store.delete(self._row('a1').blob_sha256)
+
+        self.assertIsNone(self.alignments._get_alignment('a1'))
+
+    def test_replaced_map_blob_collected(self):
+        self.alignments._save_alignment('a1', MAP)
+        old_digest = self._row('a1').blob_sha256
+        self.alignments._save_alignment('a1', MAP + [{'char': 900, 'ts': 90.0}])
+
+        self.assertEqual(self.db.collect_orphan_blobs(min_age_seconds=0), 1)
+        self.assertFalse(self.db.blob_store.exists(old_digest))
+        self.assertEqual(len(self.alignments._get_alignment('a1')), 3)
+
+    def test_integrity_script(self):
+        self.alignments._save_alignment('a1', MAP)
+        script = [sys.executable, str(REPO_ROOT / 'scripts' / 'check_db_integrity.py'), str(self.db_path)]
+
+        self.assertEqual(subprocess.run(script, capture_output=True).returncode, 0)
+
+        self.db.blob_store.delete(self._row('a1').blob_sha256)
+        result = subprocess.run(script, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('Missing blob', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -135,10 +135,35 @@ def test_save_to_db_on_fetch(mock_db):
              client._refresh_book_cache()
              
              # Verify processing happened
-             # Check if save_booklore_book was called
-             mock_db.save_booklore_book.assert_called()
-             saved_book = mock_db.save_booklore_book.call_args[0][0]
-             assert saved_book.filename == "newbook.epub"
+             # New books are saved in one bulk call, not one by one
+             mock_db.save_booklore_book.assert_not_called()
+             mock_db.save_booklore_books.assert_called_once()
+             saved_books = mock_db.save_booklore_books.call_args[0][0]
+             assert [b.filename for b in saved_books] == ["newbook.epub"]
+
+
+def test_refresh_prunes_stale_books_in_bulk(booklore_client, mock_db):
+    booklore_client._book_cache = {
+        "kept.epub": {"id": 1, "fileName": "kept.epub", "title": "Kept"},
+        "gone.epub": {"id": 2, "fileName": "gone.epub", "title": "Gone"},
+        "moved.epub": {"id": 3, "fileName": "moved.epub", "title": "Moved"},
+    }
+    booklore_client._book_id_cache = {v["id"]: v for v in booklore_client._book_cache.values()}
+    response = MagicMock(status_code=200)
+    response.json.return_value = [
+        {"id": 1, "fileName": "kept.epub", "title": "Kept"},
+        {"id": 3, "fileName": "renamed.epub", "title": "Moved"},
+    ]
+    booklore_client._make_request = MagicMock(return_value=response)
+    booklore_client._get_fresh_token = MagicMock(return_value="fake_token")
+
+    with patch.object(booklore_client, '_fetch_book_detail', return_value=None):
+        assert booklore_client._refresh_book_cache() is True
+
+    mock_db.delete_booklore_book.assert_not_called()
+    mock_db.delete_booklore_books.assert_called_once()
+    assert sorted(mock_db.delete_booklore_books.call_args[0][0]) == ["gone.epub", "moved.epub"]
+    assert set(booklore_client._book_cache) == {"kept.epub"}
 
 
 def test_update_progress_zero_clears_cfi(booklore_client):
@@ -262,3 +287,92 @@ def test_update_progress_retries_without_cfi_if_verified_pct_mismatch(booklore_c
     second_post = booklore_client._make_request.call_args_list[2][0]
     assert first_post[2]["epubProgress"]["cfi"] == "epubcfi(/6/4!/4/4/208:0)"
     assert "cfi" not in second_post[2]["epubProgress"]
+
+
+def _library(ids, titles=None):
+    titles = titles or {}
+    return [{"id": i, "fileName": f"book{i}.epub", "title": titles.get(i, f"Book {i}")} for i in ids]
+
+
+def _serve(client, books, honour_order=True):
+    """Serve `books` from a fake paginated /api/v1/books endpoint; returns the endpoints requested."""
+    requested = []
+
+    def make_request(method, endpoint):
+        requested.append(endpoint)
+        query = dict(part.split("=", 1) for part in endpoint.split("?", 1)[1].split("&"))
+        listing = sorted(books, key=lambda b: b["id"], reverse=True) if honour_order and "sort" in query else books
+        size, page = int(query["size"]), int(query["page"])
+        return MagicMock(status_code=200, json=MagicMock(return_value=listing[page * size:(page + 1) * size]))
+
+    client._make_request = MagicMock(side_effect=make_request)
+    client._get_fresh_token = MagicMock(return_value="fake_token")
+    return requested
+
+
+def _detail(book_id, token):
+    return {"id": book_id, "fileName": f"book{book_id}.epub", "title": f"Book {book_id}"}
+
+
+def test_incremental_refresh_fetches_only_new_books(booklore_client, mock_db):
+    _serve(booklore_client, _library(range(1, 451)))
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=_detail):
+        booklore_client._refresh_book_cache()
+        assert booklore_client.get_refresh_stats()['last_refresh']['detail_fetches'] == 450
+
+        requested = _serve(booklore_client, _library(range(1, 454)))
+        booklore_client._refresh_book_cache()
+
+    stats = booklore_client.get_refresh_stats()
+    assert stats['last_refresh']['mode'] == 'incremental'
+    assert stats['last_refresh']['detail_fetches'] == 3
+    assert stats['high_water_id'] == 453
+    assert (stats['full_refreshes'], stats['incremental_refreshes'], stats['detail_fetches']) == (1, 1, 453)
+    # Newest first, and the first page already reaches the old high-water mark
+    assert requested == ["/api/v1/books?page=0&size=200&sort=id,desc"]
+    assert "book453.epub" in booklore_client._book_cache
+
+
+def test_failed_detail_fetch_retried_by_incremental_refresh(booklore_client, mock_db):
+    _serve(booklore_client, _library([1, 2, 3]))
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=_detail):
+        booklore_client._refresh_book_cache()
+
+    _serve(booklore_client, _library([1, 2, 3, 4, 5]))
+    flaky = lambda book_id, token: None if book_id == 4 else _detail(book_id, token)
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=flaky):
+        booklore_client._refresh_book_cache()
+    assert booklore_client.get_refresh_stats()['high_water_id'] == 3
+    assert "book4.epub" not in booklore_client._book_cache
+
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=_detail) as fetch:
+        booklore_client._refresh_book_cache()
+
+    stats = booklore_client.get_refresh_stats()
+    assert (stats['last_refresh']['mode'], stats['last_refresh']['new']) == ('incremental', 1)
+    assert [c.args[0] for c in fetch.call_args_list] == [4]
+    assert stats['high_water_id'] == 5
+    assert "book4.epub" in booklore_client._book_cache
+
+
+def test_full_refresh_refetches_changed_books(booklore_client, mock_db):
+    _serve(booklore_client, _library([1, 2, 3]))
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=_detail):
+        booklore_client._refresh_book_cache()
+        _serve(booklore_client, _library([1, 2, 3], titles={2: "Book 2 (Revised)"}))
+        booklore_client._refresh_book_cache(full=True)
+
+    last = booklore_client.get_refresh_stats()['last_refresh']
+    assert (last['mode'], last['modified'], last['detail_fetches']) == ('full', 1, 1)
+
+
+def test_unordered_server_falls_back_to_full_refresh(booklore_client, mock_db):
+    _serve(booklore_client, _library([1, 2, 3]))
+    with patch.object(booklore_client, '_fetch_book_detail', side_effect=_detail):
+        booklore_client._refresh_book_cache()
+        _serve(booklore_client, _library([1, 3, 4]), honour_order=False)
+        booklore_client._refresh_book_cache()
+
+    last = booklore_client.get_refresh_stats()['last_refresh']
+    assert (last['mode'], last['new'], last['pruned']) == ('full', 1, 1)
+    assert set(booklore_client._book_cache) == {"book1.epub", "book3.epub", "book4.epub"}
@@ -0,0 +1,122 @@
+"""
+find_book_by_filename must return exactly what the old linear scans did.
+
+`legacy_find` is the pre-index implementation, kept here as the reference.
+"""
+
+import os
+import random
+import unittest
+from difflib import SequenceMatcher
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.api.booklore_client import BookloreClient
+
+CORPUS = [
+    "dragon's egg.epub", "dragons egg - book two.epub", "the dragon reborn.epub", "The Way of Kings.epub",
+    "words of radiance.epub", "oathbringer.epub", "rhythm of war.epub", "mistborn.epub",
+    "mistborn - the well of ascension.epub", "mistborn - the hero of ages.epub", "dune.epub",
+    "dune messiah.epub", "children of dune.epub", "god emperor of dune.epub", "project hail mary.pdf",
+    "project hail mary.epub", "the martian.epub", "artemis.cbz", "a.epub", ".epub", "book.epub.epub",
+    "the hobbit (illustrated).epub", "the hobbit.epub", "the lord of the rings 1 - fellowship.epub",
+    "the lord of the rings 2 - two towers.epub", "harry_potter_1.epub", "harry_potter_2.epub",
+    "red rising.epub", "golden son.epub", "morning star.epub", "iron gold.epub", "dark age.epub",
+    "light bringer.epub", "the name of the wind.epub", "the wise man's fear.epub", "leviathan wakes.epub",
+    "caliban's war.epub", "abaddon's gate.epub", "cibola burn.epub", "nemesis games.epub",
+]
+
+QUERIES = [
+    "/books/Dragons Egg.epub", "dragon's egg.kepub", "The Dragon Reborn (Unabridged).epub", "the way of kings.epub",
+    "Way of Kings.epub", "words-of-radiance.epub", "oathbringer", "Rhythm of War.m4b", "mistborn 2.epub",
+    "Mistborn The Well Of Ascension.epub", "dune", "Dune Messiah (1969).epub", "children of dune.azw3",
+    "project hail mary", "The Martian - Andy Weir.epub", "artemis", "a", "zzz unknown title.epub",
+    "the hobbit illustrated.epub", "lord of the rings 2.epub", "harry potter 1.epub", "harry_potter_3.epub",
+    "red rising", "Golden-Son.epub", "morningstar.epub", "the name of wind.epub", "the wise mans fear.epub",
+    "leviathan wakes 10th anniversary.epub", "calibans war.epub", "abaddons gate.epub", "cibola burn",
+    "nemesis game.epub", "book", "epub", "", "Light Bringer.EPUB", "iron gold - pierce brown.epub",
+]
+
+
+def normalize(s):
+    return BookloreClient._normalize_string(None, s)
+
+
+def legacy_find(cache, ebook_filename):
+    target_name = Path(ebook_filename).name.lower()
+    if target_name in cache: return cache[target_name]
+    target_stem = Path(ebook_filename).stem.lower()
+    for cached_name, book_info in cache.items():
+        if Path(cached_name).stem.lower() == target_stem: return book_info
+    for cached_name, book_info in cache.items():
+        if target_stem in cached_name or cached_name.replace('.epub', '') in target_stem:
+            return book_info
+    target_norm = normalize(target_stem)
+    if len(target_norm) > 5:
+        best_match, best_ratio = None, 0.0
+        for cached_name, book_info in cache.items():
+            ratio = SequenceMatcher(None, target_norm, normalize(Path(cached_name).stem)).ratio()
+            if ratio > 0.90 and ratio > best_ratio:
+                best_ratio, best_match = ratio, book_info
+        if best_match:
+            return best_match
+    return None
+
+
+class TestFilenameIndex(unittest.TestCase):
+
+    def setUp(self):
+        with patch.dict(os.environ, {"DATA_DIR": "/tmp/data"}):
+            self.client = BookloreClient(database_service=MagicMock())
+        self.client._cache_timestamp = float('inf')
+
+    def _use(self, names):
+        self.client._book_cache = {name: {'id': i, 'fileName': name} for i, name in enumerate(names)}
+
+    def _assert_same(self, queries):
+        for query in queries:
+            expected = legacy_find(self.client._book_cache, query)
+            actual = self.client.find_book_by_filename(query, allow_refresh=False)
+            self.assertIs(actual, expected, f"Different match for {query!r}")
+
+    def test_matches_linear_scan_on_fixture_corpus(self):
+        self._use(CORPUS)
+        self._assert_same(QUERIES + CORPUS)
+
+    def test_matches_linear_scan_in_any_cache_order(self):
+        rng = random.Random(7)
+        for _ in range(5):
+            names = CORPUS[:]
+            rng.shuffle(names)
+            self._use(names)
+            self._assert_same(QUERIES)
+
+    def test_matches_linear_scan_on_generated_corpus(self):
+        rng = random.Random(42)
+        words = ["night", "dragon", "shadow", "king", "queen", "fire", "storm", "blood", "iron", "star",
+                 "sea", "wind", "war", "crown", "song", "dark", "light", "stone", "witch", "empire"]
+        names = [" ".join(rng.sample(words, rng.randint(2, 4))) + rng.choice([".epub", ".epub", ".pdf"])
+                 for _ in range(400)]
+        self._use(list(dict.fromkeys(names)))
+
+        queries = []
+        for name in rng.sample(names, 150):
+            stem = Path(name).stem
+            i = rng.randrange(len(stem))
+            queries += [stem.title() + ".epub", stem[:i] + stem[i + 1:] + ".epub", stem.replace(" ", "_"),
+                        stem.split(" ")[0], stem + " (unabridged).epub"]
+        self._assert_same(queries)
+
+    def test_index_follows_cache_changes(self):
+        self._use(["first book.epub"])
+        self.assertIsNone(self.client.find_book_by_filename("second book.epub", allow_refresh=False))
+
+        self.client._process_book_detail({'id': 9, 'fileName': 'Second Book.epub'}, persist=False)
+        self.assertEqual(self.client.find_book_by_filename("Second Book (2020).epub", allow_refresh=False)['id'], 9)
+
+        self.client._book_cache = {"third book.epub": {'id': 3}}
+        self.assertEqual(self.client.find_book_by_filename("third book", allow_refresh=False)['id'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
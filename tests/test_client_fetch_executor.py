@@ -0,0 +1,179 @@
+"""
+Tests for the long-lived per-client state fetch executors in SyncManager.
+"""
+
+import logging
+import os
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.db.models import Book
+from src.sync_manager import SyncManager
+from src.utils.logging_utils import ThreadLogBuffer
+
+
+class TestClientFetchExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.fast = Mock()
+        self.fast.get_service_state.return_value = "fast-state"
+        self.slow = Mock()
+        self.slow.get_service_state.side_effect = lambda *args: self.release.wait(5) and "slow-state"
+        self.broken = Mock()
+        self.broken.get_service_state.side_effect = RuntimeError("boom")
+
+        mock_db = Mock()
+        mock_db.get_all_books.return_value = []
+        env = {'SYNC_CLIENT_TIMEOUT_SECONDS': '15', 'SYNC_CLIENT_TIMEOUT_OVERRIDES': 'Slow=1'}
+        with patch.dict(os.environ, env):
+            self.manager = SyncManager(
+                database_service=mock_db,
+                abs_client=Mock(),
+                booklore_client=Mock(),
+                sync_clients={},
+                data_dir=Path('/tmp'),
+            )
+        self.book = Book(abs_id='book-1', abs_title='Book 1', status='active')
+
+    def tearDown(self):
+        self.release.set()
+        self.manager.shutdown_client_executors(wait=True)
+
+    def test_parse_client_timeouts(self):
+        self.assertEqual(self.manager.client_timeouts, {'slow': 1.0})
+        self.assertEqual(self.manager._client_timeout('Slow'), 1.0)
+        self.assertEqual(self.manager._client_timeout('Fast'), 15.0)
+        self.assertEqual(
+            SyncManager._parse_client_timeouts("KoSync=5, Storyteller = 20,bad=x,"),
+            {'kosync': 5.0, 'storyteller': 20.0},
+        )
+
+    def test_executor_reused_across_books(self):
+        clients = {'Fast': self.fast}
+        self.manager._fetch_states_parallel(self.book, {}, 'Book 1', clients_to_use=clients)
+        executor = self.manager._client_executors['Fast']
+        self.manager._fetch_states_parallel(self.book, {}, 'Book 1', clients_to_use=clients)
+
+        self.assertIs(self.manager._client_executors['Fast'], executor)
+        self.assertIsNot(self.manager._client_executor('Fast'), self.manager._client_executor('Other'))
+
+    def test_slow_client_only_drops_its_own_state(self):
+        clients = {'Slow': self.slow, 'Fast': self.fast, 'Broken': self.broken}
+
+        start = time.monotonic()
+        config = self.manager._fetch_states_parallel(self.book, {}, 'Book 1', clients_to_use=clients)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(config, {'Fast': 'fast-state'})
+        # Bounded by the slow client's own timeout, not the 15s default
+        self.assertLess(elapsed, 3.0)
+
+    def test_results_keep_client_order(self):
+        other = Mock()
+        other.get_service_state.return_value = "other-state"
+        clients = {'Fast': self.fast, 'Other': other}
+
+        config = self.manager._fetch_states_parallel(self.book, {}, 'Book 1', clients_to_use=clients)
+
+        self.assertEqual(list(config), ['Fast', 'Other'])
+
+    def test_client_log_lines_join_the_book_buffer(self):
+        client_logger = logging.getLogger('test.client_fetch')
+        client_logger.setLevel(logging.INFO)
+        self.fast.get_service_state.side_effect = lambda *args: client_logger.info("fast") or "fast-state"
+        other = Mock()
+        other.get_service_state.side_effect = lambda *args: client_logger.info("other") or "other-state"
+        clients = {'Fast': self.fast, 'Other': other}
+
+        handler = logging.Handler()
+        emitted = []
+        handler.emit = emitted.append
+        client_logger.addHandler(handler)
+        log_buffer = ThreadLogBuffer()
+        log_buffer.install(client_logger)
+        self.manager._log_buffer = log_buffer
+        try:
+            log_buffer.start()
+            client_logger.info("book start")
+            self.manager._fetch_states_parallel(self.book, {}, 'Book 1', clients_to_use=clients)
+            records = log_buffer.stop()
+        finally:
+            self.manager._log_buffer = None
+            log_buffer.uninstall()
+            client_logger.removeHandler(handler)
+
+        self.assertEqual(emitted, [])
+        self.assertEqual([r.getMessage() for r in records], ["book start", "fast", "other"])
+
+
+class TestParallelBulkFetch(unittest.TestCase):
+
+    def _make_manager(self, clients):
+        mock_db = Mock()
+        mock_db.get_all_books.return_value = []
+        with patch.dict(os.environ, {'SYNC_CLIENT_TIMEOUT_OVERRIDES': 'Hung=1'}):
+            return SyncManager(
+                database_service=mock_db,
+                abs_client=Mock(),
+                booklore_client=Mock(),
+                sync_clients=clients,
+                data_dir=Path('/tmp'),
+            )
+
+    def _client(self, delay=0.0, result=None, error=None):
+        client = Mock()
+        client.is_configured.return_value = True
+
+        def fetch():
+            time.sleep(delay)
+            if error:
+                raise error
+            return result
+
+        client.fetch_bulk_state.side_effect = fetch
+        return client
+
+    def test_bulk_fetches_run_concurrently(self):
+        clients = {name: self._client(0.3, {name: 1}) for name in ('ABS', 'BookLore', 'Storyteller')}
+        manager = self._make_manager(clients)
+        try:
+            start = time.monotonic()
+            states, timings = manager._fetch_bulk_states()
+            elapsed = time.monotonic() - start
+        finally:
+            manager.shutdown_client_executors(wait=True)
+
+        self.assertEqual(states, {name: {name: 1} for name in clients})
+        self.assertEqual(set(timings), set(clients))
+        # Max of the clients, not their sum (0.9s)
+        self.assertLess(elapsed, 0.75)
+
+    def test_bulk_fetch_failures_isolated(self):
+        release = threading.Event()
+        hung = Mock()
+        hung.fetch_bulk_state.side_effect = lambda: release.wait(5)
+        clients = {
+            'ABS': self._client(result={'abs': 1}),
+            'Broken': self._client(error=RuntimeError("boom")),
+            'Empty': self._client(result=None),
+            'Hung': hung,
+        }
+        manager = self._make_manager(clients)
+        try:
+            states, timings = manager._fetch_bulk_states()
+        finally:
+            release.set()
+            manager.shutdown_client_executors(wait=True)
+
+        self.assertEqual(states, {'ABS': {'abs': 1}})
+        self.assertIsNone(timings['Broken'])
+        self.assertIsNone(timings['Hung'])
+        self.assertIsNotNone(timings['Empty'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for the per-cycle preload of states and alignment presence.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book, BookAlignment, State
+from src.services.alignment_service import AlignmentService
+from src.sync_manager import CyclePreload, SyncManager
+from src.utils.polisher import Polisher
+
+
+class TestPreloadQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'test.db'))
+        for abs_id, status in (('a1', 'active'), ('a2', 'active'), ('p1', 'paused')):
+            self.db.save_book(Book(abs_id=abs_id, abs_title=abs_id, status=status))
+        for abs_id, client in (('a1', 'abs'), ('a1', 'kosync'), ('p1', 'abs')):
+            self.db.save_state(State(abs_id=abs_id, client_name=client, percentage=0.5, last_updated=1.0))
+
+        self.alignments = AlignmentService(self.db, Polisher())
+        with self.db.get_session() as session:
+            session.add(BookAlignment(abs_id='a1', alignment_map_json='[{"char": 0, "ts": 0.0}]'))
+            session.add(BookAlignment(abs_id='a2', alignment_map_json='[]'))
+
+    def tearDown(self):
+        self.db.db_manager.engine.dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_states_grouped_for_active_books(self):
+        grouped = self.db.get_states_for_active_books()
+
+        self.assertEqual(set(grouped), {'a1'})
+        self.assertEqual({s.client_name for s in grouped['a1']}, {'abs', 'kosync'})
+
+    def test_aligned_ids_skip_empty_maps(self):
+        self.assertEqual(self.alignments.get_aligned_book_ids(), {'a1'})
+        self.assertEqual(self.alignments.get_aligned_book_ids(['a2']), set())
+
+
+class TestSyncManagerPreload(unittest.TestCase):
+
+    def setUp(self):
+        self.books = [Book(abs_id=f"book-{i}", abs_title=f"Book {i}", status='active') for i in range(3)]
+        self.states = {'book-0': [State(abs_id='book-0', client_name='abs', percentage=0.2)]}
+        self.mock_db = Mock()
+        self.mock_db.get_all_books.return_value = []
+        self.mock_db.get_books_by_status.return_value = self.books
+        self.mock_db.get_book.side_effect = lambda abs_id: next(b for b in self.books if b.abs_id == abs_id)
+        self.mock_db.get_states_for_active_books.return_value = self.states
+        self.mock_db.get_states_for_book.return_value = []
+        self.alignment_service = Mock()
+        self.alignment_service.get_aligned_book_ids.return_value = {'book-1'}
+        self.alignment_service._get_alignment.return_value = None
+
+        self.manager = SyncManager(
+            database_service=self.mock_db,
+            abs_client=Mock(),
+            booklore_client=Mock(),
+            sync_clients={},
+            data_dir=Path('/tmp'),
+            alignment_service=self.alignment_service,
+        )
+        # Startup checks look at alignments too
+        self.alignment_service.reset_mock()
+
+    def test_cycle_preloads_once(self):
+        preloads = []
+        self.manager._sync_book = Mock(side_effect=lambda book, bulk, preload=None: preloads.append(preload))
+
+        self.manager.sync_cycle()
+
+        self.mock_db.get_states_for_active_books.assert_called_once_with()
+        self.alignment_service.get_aligned_book_ids.assert_called_once_with()
+        self.assertEqual(len(preloads), 3)
+        self.assertTrue(all(p is preloads[0] for p in preloads))
+        self.assertEqual(preloads[0].aligned_ids, {'book-1'})
+
+    def test_sync_book_uses_preloaded_data(self):
+        preload = CyclePreload(states_by_book=self.states, aligned_ids={'book-0'}, loaded_at=1.0)
+        self.manager._fetch_states_parallel = Mock(return_value={})
+
+        self.manager._sync_book(self.books[0], {}, preload)
+
+        self.mock_db.get_states_for_book.assert_not_called()
+        self.alignment_service._get_alignment.assert_not_called()
+        prev_states = self.manager._fetch_states_parallel.call_args.args[1]
+        self.assertEqual(list(prev_states), ['abs'])
+
+    def test_instant_sync_queries_per_book(self):
+        self.manager._fetch_states_parallel = Mock(return_value={})
+
+        self.manager.sync_cycle(target_abs_id='book-0')
+
+        self.mock_db.get_states_for_active_books.assert_not_called()
+        self.mock_db.get_states_for_book.assert_called_once_with('book-0')
+
+    def test_preload_dropped_after_outside_change(self):
+        preload = self.manager._preload_cycle_data()
+        self.manager._invalidate_book_snapshot('book-0')
+        received = {}
+        self.manager._sync_book = Mock(side_effect=lambda book, bulk, preload=None: received.update({book.abs_id: preload}))
+
+        self.manager._sync_book_if_free(self.books[0], {}, preload=preload)
+        self.manager._sync_book_if_free(self.books[1], {}, preload=preload)
+
+        self.assertIsNone(received['book-0'])
+        self.assertIs(received['book-1'], preload)
+
+
+if __name__ == '__main__':
+    unittest.main()
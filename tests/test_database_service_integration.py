@@ -591,6 +591,27 @@ class TestDatabaseServiceIntegration(unittest.TestCase):
         self.assertEqual(len(remaining), 1)
         self.assertEqual(remaining[0].source_id, active_id)
 
+    def test_bulk_booklore_books(self):
+        """Test bulk upsert and delete of Booklore cache rows."""
+        from sqlalchemy import event
+        from src.db.models import BookloreBook
+
+        self.db_service.save_booklore_book(BookloreBook(filename='a.epub', title='Old A'))
+
+        commits = []
+        event.listen(self.db_service.db_manager.engine, 'commit', commits.append)
+        written = self.db_service.save_booklore_books(
+            [BookloreBook(filename=f'{c}.epub', title=f'Book {c}') for c in 'abcde']
+        )
+        deleted = self.db_service.delete_booklore_books(['b.epub', 'c.epub', 'missing.epub'])
+
+        self.assertEqual((written, deleted), (5, 2))
+        self.assertEqual(len(commits), 2)
+        books = {b.filename: b.title for b in self.db_service.get_all_booklore_books()}
+        self.assertEqual(books, {'a.epub': 'Book a', 'd.epub': 'Book d', 'e.epub': 'Book e'})
+        self.assertEqual(self.db_service.save_booklore_books([]), 0)
+        self.assertEqual(self.db_service.delete_booklore_books([]), 0)
+
     def test_migration_partial_data(self):
         """Test migration with partial/missing data scenarios."""
         with tempfile.TemporaryDirectory() as temp_dir:
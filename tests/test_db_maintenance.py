@@ -0,0 +1,121 @@
+"""
+Tests for scheduled SQLite maintenance (checkpoint, analyze, vacuum) and storage stats.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book
+
+
+class TestSQLiteMaintenance(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / 'test.db'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _open(self, **thresholds):
+        db = DatabaseService(str(self.db_path))
+        db.maintenance.configure(**{'idle_seconds': 0, 'analyze_hours': 24, 'vacuum_free_percent': 20, **thresholds})
+        self.addCleanup(db.db_manager.close)
+        return db
+
+    def _fill_and_delete(self, db, rows=3000):
+        """Leave a large run of free pages behind."""
+        with db.db_manager.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE IF NOT EXISTS filler (id INTEGER PRIMARY KEY, blob TEXT)"))
+            conn.execute(text("INSERT INTO filler (blob) VALUES (:blob)"), [{'blob': 'x' * 1000}] * rows)
+        with db.db_manager.engine.begin() as conn:
+            conn.execute(text("DELETE FROM filler"))
+
+    def test_idle_checkpoint_truncates_wal(self):
+        db = self._open()
+        for i in range(50):
+            db.save_book(Book(abs_id=f'b{i}', abs_title=f'Book {i}'))
+        self.assertGreater(db.get_storage_stats()['wal_bytes'], 0)
+
+        done = db.run_maintenance()
+
+        self.assertTrue(done['idle'])
+        self.assertFalse(done['checkpoint']['busy'])
+        self.assertEqual(db.get_storage_stats()['wal_bytes'], 0)
+
+    def test_busy_database_skips_checkpoint(self):
+        db = self._open(idle_seconds=3600)
+        db.save_book(Book(abs_id='b1', abs_title='Book 1'))
+
+        done = db.run_maintenance()
+
+        self.assertFalse(done['idle'])
+        self.assertIsNone(done['checkpoint'])
+        self.assertIsNone(done['vacuum_pages'])
+        self.assertEqual(db.get_storage_stats()['maintenance']['skipped_busy'], 1)
+
+    def test_full_analyze_then_optimize(self):
+        db = self._open()
+        db.save_book(Book(abs_id='b1', abs_title='Book 1', status='active'))
+
+        first = db.run_maintenance()
+        second = db.run_maintenance()
+
+        self.assertEqual(first['analyze'], 'full')
+        self.assertEqual(second['analyze'], 'optimize')
+        with db.db_manager.engine.connect() as conn:
+            tables = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))}
+        self.assertIn('sqlite_stat1', tables)
+        self.assertIsNotNone(db.get_storage_stats()['maintenance']['last_analyze_at'])
+
+    def test_incremental_vacuum_releases_free_pages(self):
+        db = self._open()
+        self.assertEqual(db.get_storage_stats()['auto_vacuum'], 'incremental')
+        self._fill_and_delete(db)
+        self.assertGreater(db.get_storage_stats()['free_percent'], 20)
+
+        done = db.run_maintenance()
+
+        self.assertGreater(done['vacuum_pages'], 0)
+        self.assertEqual(db.get_storage_stats()['freelist_count'], 0)
+
+    def test_legacy_database_converted_to_incremental(self):
+        # Created before the bridge set auto_vacuum, so the mode is NONE
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE filler (id INTEGER PRIMARY KEY, blob TEXT)")
+        conn.commit()
+        conn.close()
+        db = self._open()
+        self.assertEqual(db.get_storage_stats()['auto_vacuum'], 'none')
+        self._fill_and_delete(db)
+
+        db.run_maintenance()
+
+        stats = db.get_storage_stats()
+        self.assertEqual(stats['auto_vacuum'], 'incremental')
+        self.assertEqual(stats['freelist_count'], 0)
+
+    def test_few_free_pages_left_alone(self):
+        db = self._open()
+        self._fill_and_delete(db, rows=20)
+
+        self.assertEqual(db.run_maintenance()['vacuum_pages'], 0)
+
+    def test_storage_stats(self):
+        db = self._open()
+        stats = db.get_storage_stats()
+
+        for key in ('db_bytes', 'wal_bytes', 'page_size', 'page_count', 'freelist_count', 'free_percent'):
+            self.assertIn(key, stats)
+        self.assertGreater(stats['db_bytes'], 0)
+        self.assertEqual(stats['maintenance']['runs'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
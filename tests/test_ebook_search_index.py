@@ -0,0 +1,178 @@
+"""
+Tests for the ebook full-text search index and the LibraryService lookups that use it.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.api.booklore_client import BookloreClient
+from src.db.database_service import DatabaseService
+from src.services.library_service import LibraryService
+
+
+def booklore_doc(book_id, title, filename, authors='', series=''):
+    return {'source_id': book_id, 'title': title, 'authors': authors, 'series': series, 'filename': filename,
+            'payload': {'id': book_id, 'fileName': filename, 'title': title}}
+
+
+class TestEbookSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'database.db'))
+        self.index = self.db.search_index
+
+    def tearDown(self):
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _ids(self, term, source='Booklore'):
+        return [hit['id'] for hit in self.index.search(source, term)]
+
+    def test_matches_words_across_fields(self):
+        self.index.replace_source('Booklore', [
+            booklore_doc(1, "Dragon's Egg", 'dragons_egg.epub', authors='Jane Doe'),
+            booklore_doc(2, 'The Way of Kings', 'wok.epub', authors='Brandon Sanderson', series='Stormlight'),
+        ])
+
+        self.assertEqual(self._ids('dragons'), [1])
+        self.assertEqual(self._ids("Dragon's egg"), [1])
+        self.assertEqual(self._ids('sanders'), [2])
+        self.assertEqual(self._ids('stormlight kings'), [2])
+        self.assertEqual(self._ids('ns_eg'), [1])  # filename substring
+        self.assertEqual(self._ids(''), [1, 2])
+        self.assertEqual(self._ids('zzz'), [])
+        self.assertEqual(self._ids('dragons', source='CWA'), [])
+
+    def test_replace_source_leaves_other_sources(self):
+        self.index.replace_source('Booklore', [booklore_doc(1, 'Dune', 'dune.epub')])
+        self.index.replace_source('Local File', [{'source_id': '/books/dune.epub', 'filename': 'dune.epub',
+                                                  'payload': {'path': '/books/dune.epub'}}])
+        self.index.replace_source('Booklore', [booklore_doc(2, 'Dune Messiah', 'messiah.epub')])
+
+        self.assertEqual(self._ids('dune'), [2])
+        self.assertEqual(len(self.index.search('Local File', 'dune')), 1)
+        self.assertEqual(self.index.stats()['documents'], {'Booklore': 1, 'Local File': 1})
+
+    def test_cached_results_expire(self):
+        self.index.store_results('CWA', 'Dune  Herbert', [{'source_id': '7', 'title': 'Dune', 'payload': {'id': '7'}}])
+
+        self.assertEqual(self.index.cached_results('CWA', 'dune herbert'), [{'id': '7'}])
+        self.assertIsNone(self.index.cached_results('CWA', 'dune'))
+
+        with patch('src.db.search_index.time.time', return_value=time.time() + 7 * 3600):
+            self.assertIsNone(self.index.cached_results('CWA', 'dune herbert'))
+            self.assertEqual(self.index.purge_expired(), 1)
+        self.assertEqual(self.index.stats()['cached_searches'], 0)
+
+
+class TestLibraryServiceSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'database.db'))
+        self.books_dir = Path(self.temp_dir) / 'books'
+        self.books_dir.mkdir()
+        self.booklore = MagicMock()
+        self.cwa = MagicMock()
+        self.abs = MagicMock()
+        self.abs.ebook_stream_url.side_effect = lambda item_id, ino: f"url/{item_id}/{ino}"
+        self.service = LibraryService(self.db, self.booklore, self.cwa, self.abs, str(Path(self.temp_dir) / 'cache'))
+
+    def tearDown(self):
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_booklore_index_hits_merged_with_cache_search(self):
+        self.db.search_index.replace_source('Booklore', [booklore_doc(1, 'Mistborn', 'mistborn.epub')])
+        self.booklore.search_books.return_value = [{'id': 1, 'fileName': 'mistborn.epub'}]
+
+        self.assertEqual([b['id'] for b in self.service.search_booklore('mistborn')], [1])
+        self.booklore.refresh_if_stale.assert_called_once()
+
+        self.booklore.search_books.return_value = [{'id': 2, 'fileName': 'elantris.epub'}]
+        self.assertEqual(self.service.search_booklore('elantris')[0]['id'], 2)
+
+    def test_booklore_mid_word_match_kept_next_to_prefix_hit(self):
+        potter = booklore_doc(1, "Harry Potter and the Philosopher's Stone", 'hp1.epub')
+        otter = booklore_doc(2, 'Otter Tales', 'otter.epub')
+        self.db.search_index.replace_source('Booklore', [potter, otter])
+        # What BookloreClient.search_books' substring match returns for 'otter'
+        self.booklore.search_books.return_value = [potter['payload'], otter['payload']]
+
+        self.assertEqual([b['id'] for b in self.service.search_booklore('otter')], [2, 1])
+
+    def test_booklore_refresh_mirrors_cache(self):
+        with patch.dict(os.environ, {"DATA_DIR": self.temp_dir}):
+            client = BookloreClient(database_service=self.db)
+        client._book_cache = {'warbreaker.epub': {'id': 5, 'fileName': 'Warbreaker.epub', 'title': 'Warbreaker',
+                                                  'authors': 'Brandon Sanderson', 'series': ''}}
+        client._update_search_index()
+
+        hits = self.db.search_index.search('Booklore', 'sanderson')
+        self.assertEqual([(h['id'], h['fileName']) for h in hits], [(5, 'Warbreaker.epub')])
+
+    def test_abs_search_replayed_from_index(self):
+        self.abs.search_ebooks.return_value = [{'id': 'li_1', 'title': 'Dune', 'author': 'Frank Herbert'},
+                                               {'id': 'li_2', 'title': 'Dune (Audio)', 'author': 'Frank Herbert'}]
+        self.abs.get_ebook_files.side_effect = lambda item_id: (
+            [{'ext': 'epub', 'ino': '42', 'stream_url': 'old'}] if item_id == 'li_1' else [])
+
+        first = self.service.search_abs_ebooks('Dune')
+        second = self.service.search_abs_ebooks('dune')
+
+        self.assertEqual(first, second)
+        self.assertEqual([(r['id'], r['ext'], r['stream_url']) for r in second], [('li_1', 'epub', 'url/li_1/42')])
+        self.assertEqual(self.abs.search_ebooks.call_count, 1)
+        self.assertEqual(self.abs.get_ebook_files.call_count, 2)
+
+    def test_empty_remote_results_not_cached(self):
+        self.cwa.is_configured.return_value = True
+        self.cwa.search_ebooks.return_value = []
+        self.service.search_cwa('Dune')
+        self.cwa.search_ebooks.return_value = [{'id': '3', 'title': 'Dune', 'author': 'FH', 'ext': 'epub'}]
+
+        self.assertEqual(self.service.search_cwa('Dune')[0]['id'], '3')
+        self.assertEqual(self.service.search_cwa('Dune')[0]['id'], '3')
+        self.assertEqual(self.cwa.search_ebooks.call_count, 2)
+
+    def test_booklore_refreshed_before_index_search(self):
+        self.db.search_index.replace_source('Booklore', [booklore_doc(1, 'Dune', 'dune.epub')])
+        self.booklore.refresh_if_stale.side_effect = lambda: self.db.search_index.replace_source(
+            'Booklore', [booklore_doc(1, 'Dune', 'dune.epub'), booklore_doc(2, 'Dune Messiah', 'messiah.epub')])
+
+        self.assertEqual([b['id'] for b in self.service.search_booklore('dune')], [1, 2])
+
+    def _local_names(self, term):
+        return sorted(p.name for p in self.service.search_local_ebooks(term, self.books_dir))
+
+    def test_local_files_rescanned_when_tree_changes(self):
+        (self.books_dir / 'Dune.epub').write_bytes(b'x')
+        self.assertEqual(self._local_names('dune'), ['Dune.epub'])
+
+        # New file next to an existing hit
+        (self.books_dir / 'Dune Messiah.epub').write_bytes(b'x')
+        self.assertEqual(self._local_names('dune'), ['Dune Messiah.epub', 'Dune.epub'])
+
+        (self.books_dir / 'sub').mkdir()
+        (self.books_dir / 'sub' / 'Children of Dune.epub').write_bytes(b'x')
+        (self.books_dir / 'Dune.epub').unlink()
+        self.assertEqual(self._local_names('dune'), ['Children of Dune.epub', 'Dune Messiah.epub'])
+        self.assertEqual(self.db.search_index.stats()['documents'], {'Local File': 2})
+
+    def test_unchanged_local_tree_not_rescanned(self):
+        (self.books_dir / 'Dune.epub').write_bytes(b'x')
+        self.service.index_local_ebooks(self.books_dir)
+
+        with patch.object(self.service, 'index_local_ebooks') as rescan:
+            self.assertEqual(self._local_names('dune'), ['Dune.epub'])
+        rescan.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for bulk KoSync progress fetching against external KOSync servers.
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.api.api_clients import KoSyncClient
+from src.db.models import Book, State
+from src.sync_clients.kosync_sync_client import KoSyncSyncClient
+
+ENV = {
+    'KOSYNC_SERVER': 'https://sync.example.com',
+    'KOSYNC_USER': 'user',
+    'KOSYNC_KEY': 'key',
+    'KOSYNC_BULK_CONCURRENCY': '3',
+    'KOSYNC_TIMEOUT_SECONDS': '2',
+}
+
+
+@patch.dict(os.environ, ENV)
+class TestKoSyncClientBulk(unittest.TestCase):
+
+    def test_get_uses_timeout(self):
+        client = KoSyncClient()
+        response = Mock(status_code=200)
+        response.json.return_value = {'percentage': 0.25, 'progress': '/body/DocFragment[2]', 'timestamp': 1700}
+        with patch.object(client.session, 'get', return_value=response) as mock_get:
+            details = client.get_progress_details('hash-1')
+
+        self.assertEqual(details, {'pct': 0.25, 'xpath': '/body/DocFragment[2]', 'ts': 1700})
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], 2.0)
+
+    def test_bulk_is_concurrent_and_bounded(self):
+        client = KoSyncClient()
+        active, peak = [0], [0]
+        guard = threading.Lock()
+
+        def details(doc_id):
+            with guard:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with guard:
+                active[0] -= 1
+            return None if doc_id == 'missing' else {'pct': 0.5, 'xpath': None, 'ts': 1}
+
+        with patch.object(client, 'get_progress_details', side_effect=details):
+            result = client.get_progress_bulk(['a', 'b', 'c', 'd', 'e', 'missing', 'a'])
+
+        self.assertEqual(set(result), {'a', 'b', 'c', 'd', 'e', 'missing'})
+        self.assertIsNone(result['missing'])
+        self.assertEqual(peak[0], 3)
+        self.assertEqual(client.get_progress_bulk([]), {})
+
+
+class TestKoSyncSyncClientBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.api = Mock()
+        self.api.is_local_server.return_value = False
+        self.database_service = Mock()
+        self.database_service.get_books_by_status.return_value = [
+            Book(abs_id='a1', kosync_doc_id='h1'),
+            Book(abs_id='a2', kosync_doc_id='h2'),
+            Book(abs_id='a3', kosync_doc_id=None),
+        ]
+        self.client = KoSyncSyncClient(self.api, Mock(), self.database_service)
+        self.book = Book(abs_id='a1', abs_title='Book', kosync_doc_id='h1')
+
+    def test_fetch_bulk_state_keyed_by_book(self):
+        self.api.get_progress_bulk.return_value = {'h1': {'pct': 0.4, 'xpath': '/x', 'ts': 10}, 'h2': None}
+
+        bulk = self.client.fetch_bulk_state()
+
+        self.api.get_progress_bulk.assert_called_once_with(['h1', 'h2'])
+        self.assertEqual(bulk, {'a1': {'pct': 0.4, 'xpath': '/x', 'ts': 10}, 'a2': None})
+
+    def test_failed_bulk_entry_not_refetched(self):
+        state = self.client.get_service_state(self.book, None, 'Book', {'a1': None})
+
+        self.assertIsNone(state)
+        self.api.get_progress.assert_not_called()
+
+    def test_book_missing_from_snapshot_fetched_individually(self):
+        self.api.get_progress.return_value = (0.3, '/y')
+
+        state = self.client.get_service_state(self.book, None, 'Book', {})
+
+        self.api.get_progress.assert_called_once_with('h1')
+        self.assertEqual(state.current['pct'], 0.3)
+
+    def test_unchanged_document_reports_no_delta(self):
+        prev = State(abs_id='a1', client_name='kosync', percentage=0.4)
+        entry = {'pct': 0.405, 'xpath': '/x', 'ts': 10}
+
+        first = self.client.get_service_state(self.book, prev, 'Book', {'a1': entry})
+        self.client.book_synced(self.book)
+        second = self.client.get_service_state(self.book, prev, 'Book', {'a1': dict(entry)})
+        moved = self.client.get_service_state(self.book, prev, 'Book', {'a1': {**entry, 'ts': 11}})
+
+        self.assertAlmostEqual(first.delta, 0.005)
+        self.assertEqual(second.delta, 0)
+        self.assertAlmostEqual(moved.delta, 0.005)
+
+    def test_significant_delta_kept_when_unchanged(self):
+        prev = State(abs_id='a1', client_name='kosync', percentage=0.1)
+        entry = {'pct': 0.5, 'xpath': '/x', 'ts': 10}
+
+        self.client.get_service_state(self.book, prev, 'Book', {'a1': entry})
+        self.client.book_synced(self.book)
+        again = self.client.get_service_state(self.book, prev, 'Book', {'a1': entry})
+
+        # A sync that failed last cycle must still be retried
+        self.assertAlmostEqual(again.delta, 0.4)
+
+    def test_reading_remembered_only_after_successful_sync(self):
+        prev = State(abs_id='a1', client_name='kosync', percentage=0.4)
+        entry = {'pct': 0.405, 'xpath': '/x', 'ts': 10}
+
+        self.client.get_service_state(self.book, prev, 'Book', {'a1': entry})
+        # The book's sync failed, so book_synced() was never called
+        retried = self.client.get_service_state(self.book, prev, 'Book', {'a1': dict(entry)})
+
+        self.assertAlmostEqual(retried.delta, 0.005)
+
+    def test_readings_pruned_to_active_books(self):
+        entry = {'pct': 0.4, 'xpath': '/x', 'ts': 10}
+        gone = Book(abs_id='gone', abs_title='Gone', kosync_doc_id='hg')
+        for book in (self.book, gone):
+            self.client.get_service_state(book, None, 'Book', {book.abs_id: entry})
+            self.client.book_synced(book)
+        self.api.get_progress_bulk.return_value = {'h1': entry, 'h2': None}
+
+        self.client.fetch_bulk_state()
+
+        self.assertEqual(set(self.client._seen_documents), {'a1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
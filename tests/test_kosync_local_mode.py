@@ -0,0 +1,133 @@
+"""
+Tests for KoSync local mode (target server is the bridge's own KOSync server).
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.api.api_clients import KoSyncClient
+from src.db.database_service import DatabaseService
+from src.db.models import Book, KosyncDocument
+from src.sync_clients.kosync_sync_client import KoSyncSyncClient
+from src.sync_clients.sync_client_interface import LocatorResult, UpdateProgressRequest
+
+
+class TestLocalServerDetection(unittest.TestCase):
+
+    def _client(self, url, **env):
+        env = {'KOSYNC_SERVER': url, 'KOSYNC_USER': 'user', 'KOSYNC_KEY': 'key', **env}
+        with patch.dict(os.environ, env):
+            client = KoSyncClient()
+            return client.is_local_server()
+
+    def test_loopback_urls_detected(self):
+        self.assertTrue(self._client('http://127.0.0.1:5757'))
+        self.assertTrue(self._client('http://localhost:5757/koreader/'))
+        self.assertTrue(self._client('http://localhost:6000', KOSYNC_PORT='6000'))
+
+    def test_other_servers_not_detected(self):
+        self.assertFalse(self._client('https://sync.koreader.rocks'))
+        self.assertFalse(self._client('http://127.0.0.1:8081'))
+        self.assertFalse(self._client('http://192.168.1.10:5757'))
+
+    def test_mode_override(self):
+        self.assertTrue(self._client('http://bridge:5757', KOSYNC_LOCAL_MODE='true'))
+        self.assertFalse(self._client('http://127.0.0.1:5757', KOSYNC_LOCAL_MODE='false'))
+
+
+class TestKoSyncLocalMode(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'test.db'))
+
+        for i in range(3):
+            self.db.save_book(Book(abs_id=f'book-{i}', abs_title=f'Book {i}', status='active',
+                                   kosync_doc_id=f'hash-{i}', ebook_filename=f'book-{i}.epub'))
+        self.db.save_book(Book(abs_id='paused', abs_title='Paused', status='paused', kosync_doc_id='hash-p'))
+
+        self.db.save_kosync_document(KosyncDocument(
+            document_hash='hash-0', linked_abs_id='book-0', percentage=0.2, progress='/body/DocFragment[2]/p[1]/text().0',
+            timestamp=datetime(2026, 1, 1)))
+        # A second device hash for the same book that is further along
+        self.db.save_kosync_document(KosyncDocument(
+            document_hash='hash-0b', linked_abs_id='book-0', percentage=0.6, progress='/body/DocFragment[5]/p[3]/text().0'))
+        # Unlinked doc matched through the book's kosync_doc_id
+        self.db.save_kosync_document(KosyncDocument(document_hash='hash-1', percentage=0.1, progress='/body/DocFragment[1]'))
+        self.db.save_kosync_document(KosyncDocument(document_hash='hash-p', linked_abs_id='paused', percentage=0.9))
+
+        self.api = Mock()
+        self.api.is_local_server.return_value = True
+        self.api.get_progress.return_value = (0.05, '/body/DocFragment[1]/text().0')
+        self.client = KoSyncSyncClient(self.api, Mock(), self.db)
+
+    def tearDown(self):
+        self.db.db_manager.engine.dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_bulk_state_reads_active_books_in_one_pass(self):
+        bulk = self.client.fetch_bulk_state()
+
+        self.assertEqual(set(bulk), {'book-0', 'book-1'})
+        self.assertEqual(bulk['book-0']['pct'], 0.6)
+        self.assertEqual(bulk['book-0']['xpath'], '/body/DocFragment[5]/p[3]/text().0')
+        self.assertEqual(bulk['book-1']['pct'], 0.1)
+        self.api.get_progress.assert_not_called()
+
+    def test_service_state_from_bulk_without_http(self):
+        bulk = self.client.fetch_bulk_state()
+        book = self.db.get_book('book-0')
+
+        state = self.client.get_service_state(book, None, 'Book 0', bulk)
+
+        self.assertEqual(state.current['pct'], 0.6)
+        self.api.get_progress.assert_not_called()
+
+    def test_book_without_progress_falls_back_to_server(self):
+        book = self.db.get_book('book-2')
+
+        state = self.client.get_service_state(book, None, 'Book 2', {})
+
+        self.api.get_progress.assert_called_once_with('hash-2')
+        self.assertEqual(state.current['pct'], 0.05)
+
+    def test_instant_sync_reads_single_book(self):
+        book = self.db.get_book('book-1')
+
+        state = self.client.get_service_state(book, None, 'Book 1', None)
+
+        self.assertEqual(state.current['pct'], 0.1)
+        self.api.get_progress.assert_not_called()
+
+    def test_remote_server_uses_http(self):
+        self.api.is_local_server.return_value = False
+
+        self.client.get_service_state(self.db.get_book('book-0'), None, 'Book 0', None)
+        self.api.get_progress.assert_called_once_with('hash-0')
+
+    def test_update_writes_document_and_clears_debounce(self):
+        from src.api import kosync_server
+
+        book = self.db.get_book('book-2')
+        kosync_server._kosync_debounce['book-2'] = {'last_event': 0, 'title': 'Book 2', 'synced': False}
+        request = UpdateProgressRequest(LocatorResult(percentage=0.4, xpath='/body/DocFragment[3]/p[2]'))
+
+        result = self.client.update_progress(book, request)
+
+        self.assertTrue(result.success)
+        self.api.update_progress.assert_not_called()
+        doc = self.db.get_kosync_document('hash-2')
+        self.assertAlmostEqual(float(doc.percentage), 0.4)
+        self.assertEqual(doc.progress, '/body/DocFragment[3]/p[2]/text().0')
+        self.assertEqual(doc.device, 'abs-sync-bot')
+        self.assertEqual(doc.linked_abs_id, 'book-2')
+        self.assertNotIn('book-2', kosync_server._kosync_debounce)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Tests for parallel book processing in SyncManager's scheduled cycle.
+"""
+
+import logging
+import os
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.db.models import Book
+from src.sync_manager import SyncManager
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestParallelBookSync(unittest.TestCase):
+
+    def setUp(self):
+        self.books = [Book(abs_id=f"book-{i}", abs_title=f"Book {i}", status='active') for i in range(6)]
+        self.mock_db = Mock()
+        self.mock_db.get_all_books.return_value = []
+        self.mock_db.get_books_by_status.return_value = self.books
+
+    def _make_manager(self, workers, client_concurrency=4):
+        env = {'SYNC_BOOK_WORKERS': str(workers), 'SYNC_CLIENT_CONCURRENCY': str(client_concurrency)}
+        with patch.dict(os.environ, env):
+            return SyncManager(
+                database_service=self.mock_db,
+                abs_client=Mock(),
+                booklore_client=Mock(),
+                sync_clients={},
+                data_dir=Path('/tmp'),
+            )
+
+    def test_single_worker_runs_in_calling_thread(self):
+        manager = self._make_manager(1)
+        threads = []
+        manager._sync_book = Mock(side_effect=lambda book, bulk, preload=None: threads.append(threading.current_thread()))
+
+        manager.sync_cycle()
+
+        self.assertEqual(len(threads), len(self.books))
+        self.assertTrue(all(t is threading.current_thread() for t in threads))
+        self.assertEqual(manager.get_cycle_metrics()['workers'], 1)
+
+    def test_books_processed_concurrently(self):
+        manager = self._make_manager(3)
+        barrier = threading.Barrier(3, timeout=5)
+        synced = []
+
+        def sync_book(book, bulk, preload=None):
+            # Would time out (BrokenBarrierError) if books ran one after another
+            barrier.wait()
+            synced.append(book.abs_id)
+            return True
+
+        manager._sync_book = Mock(side_effect=sync_book)
+        manager.sync_cycle()
+
+        self.assertCountEqual(synced, [b.abs_id for b in self.books])
+        metrics = manager.get_cycle_metrics()
+        self.assertEqual(metrics['workers'], 3)
+        self.assertEqual(metrics['books'], 6)
+        self.assertEqual(metrics['books_synced'], 6)
+        self.assertEqual(metrics['books_failed'], 0)
+
+    def test_logs_grouped_per_book_in_order(self):
+        manager = self._make_manager(3)
+        sm_logger = logging.getLogger('src.sync_manager')
+
+        def sync_book(book, bulk, preload=None):
+            index = int(book.abs_id.split('-')[1])
+            sm_logger.info(f"{book.abs_id} start")
+            # Later books finish first, so raw output would interleave
+            time.sleep(0.02 * (len(self.books) - index))
+            sm_logger.info(f"{book.abs_id} end")
+
+        manager._sync_book = Mock(side_effect=sync_book)
+        handler = _ListHandler()
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            manager.sync_cycle()
+        finally:
+            root.removeHandler(handler)
+
+        lines = [m for m in handler.messages if m.startswith('book-')]
+        expected = []
+        for book in self.books:
+            expected += [f"{book.abs_id} start", f"{book.abs_id} end"]
+        self.assertEqual(lines, expected)
+
+    def test_metrics_count_outcomes(self):
+        manager = self._make_manager(2)
+        results = {'book-0': True, 'book-1': None, 'book-2': False}
+
+        def sync_book(book, bulk, preload=None):
+            if book.abs_id == 'book-3':
+                raise RuntimeError("boom")
+            return results.get(book.abs_id)
+
+        manager._sync_book = Mock(side_effect=sync_book)
+        busy = manager._get_book_lock('book-4')
+        busy.acquire()
+        try:
+            manager.sync_cycle()
+        finally:
+            busy.release()
+
+        metrics = manager.get_cycle_metrics()
+        self.assertEqual(metrics['books_synced'], 1)
+        self.assertEqual(metrics['books_unchanged'], 2)  # book-1, book-5
+        self.assertEqual(metrics['books_failed'], 2)  # book-2, book-3
+        self.assertEqual(metrics['books_locked'], 1)  # book-4
+        self.assertGreaterEqual(metrics['duration_seconds'], 0)
+
+    def test_client_concurrency_cap(self):
+        manager = self._make_manager(4, client_concurrency=2)
+        active, peak = [0], [0]
+        guard = threading.Lock()
+
+        def call():
+            with guard:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with guard:
+                active[0] -= 1
+
+        threads = [threading.Thread(target=manager._call_client, args=('KoSync', call)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(peak[0], 2)
+        # Other clients have their own cap
+        self.assertIsNot(manager._client_slot('KoSync'), manager._client_slot('Storyteller'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Query-plan regression tests for the hot lookups in DatabaseService.
+
+Each test captures the SQL a DatabaseService method actually runs, feeds it
+to EXPLAIN QUERY PLAN and fails if SQLite would scan a whole table (or sort
+rows it could read in index order).
+"""
+
+import re
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import event
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book, BookloreBook, Job, KosyncDocument, PendingSuggestion, State
+
+FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+class TestHotQueryPlans(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'plans.db'))
+        for i in range(20):
+            self.db.save_book(Book(abs_id=f'b{i}', abs_title=f'Book {i}', kosync_doc_id=f'h{i}',
+                                   status='active' if i % 2 else 'paused'))
+            self.db.save_state(State(abs_id=f'b{i}', client_name='abs', percentage=0.1, last_updated=float(i)))
+            self.db.save_job(Job(abs_id=f'b{i}', last_attempt=float(i)))
+            self.db.save_kosync_document(KosyncDocument(document_hash=f'h{i}', filename=f'book-{i}.epub',
+                                                        linked_abs_id=f'b{i}', booklore_id=str(i)))
+            self.db.save_pending_suggestion(PendingSuggestion(source_id=f's{i}', title=f'Suggestion {i}'))
+            self.db.save_booklore_book(BookloreBook(filename=f'book-{i}.epub', title=f'Book {i}'))
+
+    def tearDown(self):
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _plans(self, call):
+        """Run `call` and return the EXPLAIN QUERY PLAN details of every SELECT it issued."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append((statement, parameters))
+
+        engine = self.db.db_manager.engine
+        event.listen(engine, 'before_cursor_execute', capture)
+        try:
+            call()
+        finally:
+            event.remove(engine, 'before_cursor_execute', capture)
+
+        self.assertTrue(statements, "No SELECT was captured")
+        plans = []
+        with engine.connect() as conn:
+            for statement, parameters in statements:
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+                plans.append([row[-1] for row in rows])
+        return plans
+
+    def assertIndexed(self, call, sorted_by_index=False):
+        for plan in self._plans(call):
+            scans = [step for step in plan if FULL_SCAN.match(step)]
+            self.assertFalse(scans, f"Full table scan in plan: {plan}")
+            if sorted_by_index:
+                self.assertFalse([step for step in plan if 'TEMP B-TREE' in step], f"Sort not served by index: {plan}")
+
+    def test_book_lookups(self):
+        self.assertIndexed(lambda: self.db.get_book('b1'))
+        self.assertIndexed(lambda: self.db.get_book_by_kosync_id('h1'))
+        self.assertIndexed(lambda: self.db.get_books_by_status('active'))
+
+    def test_state_lookups(self):
+        self.assertIndexed(lambda: self.db.get_state('b1', 'abs'))
+        self.assertIndexed(lambda: self.db.get_states_for_book('b1'))
+        self.assertIndexed(lambda: self.db.get_states_for_active_books())
+
+    def test_job_lookups(self):
+        self.assertIndexed(lambda: self.db.get_latest_job('b1'), sorted_by_index=True)
+        self.assertIndexed(lambda: self.db.get_jobs_for_book('b1'), sorted_by_index=True)
+        self.assertIndexed(lambda: self.db.update_latest_job('b1', progress=0.5), sorted_by_index=True)
+
+    def test_kosync_document_lookups(self):
+        self.assertIndexed(lambda: self.db.get_kosync_document('h1'))
+        self.assertIndexed(lambda: self.db.get_kosync_doc_by_filename('book-1.epub'))
+        self.assertIndexed(lambda: self.db.get_kosync_doc_by_booklore_id('1'))
+        self.assertIndexed(lambda: self.db.get_kosync_documents_for_book('b1'))
+        self.assertIndexed(lambda: self.db.get_kosync_documents_for_active_books(['b1', 'b3']))
+
+    def test_suggestion_lookups(self):
+        self.assertIndexed(lambda: self.db.get_pending_suggestion('s1'))
+        self.assertIndexed(lambda: self.db.suggestion_exists('s1'))
+        self.assertIndexed(lambda: self.db.get_all_pending_suggestions(), sorted_by_index=True)
+
+    def test_booklore_lookup(self):
+        self.assertIndexed(lambda: self.db.get_booklore_book('book-1.epub'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Tests for the DatabaseService read-through cache.
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book, KosyncDocument
+from src.db.read_cache import EntityCache
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def test_counts_hits_and_misses(self):
+        cache = EntityCache(enabled=True, ttl=60, max_entries=10)
+        loads = []
+
+        for _ in range(3):
+            cache.get_or_load('books', 'b1', lambda: loads.append(1) or {'abs_id': 'b1'})
+
+        self.assertEqual(len(loads), 1)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+        self.assertEqual(stats['namespaces']['books']['entries'], 1)
+
+    def test_expired_entries_reloaded(self):
+        cache = EntityCache(enabled=True, ttl=60, max_entries=10)
+        cache.get_or_load('books', 'b1', lambda: 'old')
+
+        with patch('src.db.read_cache.time.monotonic', return_value=10 ** 9):
+            self.assertEqual(cache.get_or_load('books', 'b1', lambda: 'new'), 'new')
+
+    def test_oldest_entries_evicted(self):
+        cache = EntityCache(enabled=True, ttl=60, max_entries=2)
+        for key in ('a', 'b', 'c'):
+            cache.get_or_load('books', key, lambda: key)
+
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertEqual(cache.get_or_load('books', 'a', lambda: 'reloaded'), 'reloaded')
+
+    def test_load_racing_a_write_is_not_cached(self):
+        cache = EntityCache(enabled=True, ttl=60, max_entries=10)
+
+        def stale_load():
+            # A write commits and invalidates while this read is in flight
+            cache.invalidate('books', 'b1')
+            return 'stale'
+
+        cache.get_or_load('books', 'b1', stale_load)
+        self.assertEqual(cache.get_or_load('books', 'b1', lambda: 'fresh'), 'fresh')
+
+    def test_disabled_always_loads(self):
+        cache = EntityCache(enabled=False, ttl=60, max_entries=10)
+        cache.get_or_load('books', 'b1', lambda: 'first')
+
+        self.assertEqual(cache.get_or_load('books', 'b1', lambda: 'second'), 'second')
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_configured_from_environment(self):
+        with patch.dict('os.environ', {'DB_READ_CACHE_ENABLED': 'false', 'DB_READ_CACHE_TTL_SECONDS': 'soon'}):
+            cache = EntityCache()
+
+        self.assertFalse(cache.enabled)
+        self.assertEqual(cache.ttl, 60.0)
+
+
+class TestDatabaseServiceReadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'test.db'))
+        self.db.read_cache.configure(enabled=True, ttl=60, max_entries=100)
+        self.db.save_book(Book(abs_id='b1', abs_title='Book 1', status='active'))
+        self.db.save_kosync_document(KosyncDocument(document_hash='h1', percentage=0.25))
+        self.db.set_setting('SYNC_PERIOD_MINS', '5')
+
+        self.selects = []
+        event.listen(self.db.db_manager.engine, 'before_cursor_execute', self._count_select)
+
+    def tearDown(self):
+        event.remove(self.db.db_manager.engine, 'before_cursor_execute', self._count_select)
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _count_select(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            self.selects.append(statement)
+
+    def test_repeat_reads_served_from_cache(self):
+        for _ in range(5):
+            self.assertEqual(self.db.get_book('b1').abs_title, 'Book 1')
+            self.assertEqual(self.db.get_setting('SYNC_PERIOD_MINS'), '5')
+            self.assertAlmostEqual(float(self.db.get_kosync_document('h1').percentage), 0.25)
+
+        self.assertEqual(len(self.selects), 3)
+        stats = self.db.get_read_cache_stats()
+        self.assertEqual(stats['hits'], 12)
+        self.assertEqual(stats['misses'], 3)
+
+    def test_returned_books_are_independent_copies(self):
+        book = self.db.get_book('b1')
+        book.status = 'paused'
+
+        self.assertEqual(self.db.get_book('b1').status, 'active')
+
+    def test_writes_invalidate(self):
+        book = self.db.get_book('b1')
+        book.abs_title = 'Renamed'
+        self.db.save_book(book)
+        self.db.set_setting('SYNC_PERIOD_MINS', '10')
+        self.db.link_kosync_document('h1', 'b1')
+
+        self.assertEqual(self.db.get_book('b1').abs_title, 'Renamed')
+        self.assertEqual(self.db.get_setting('SYNC_PERIOD_MINS'), '10')
+        self.assertEqual(self.db.get_kosync_document('h1').linked_abs_id, 'b1')
+
+        self.db.delete_book('b1')
+        self.assertIsNone(self.db.get_book('b1'))
+        self.assertIsNone(self.db.get_kosync_document('h1').linked_abs_id)
+
+    def test_missing_rows_cached_until_created(self):
+        self.assertIsNone(self.db.get_kosync_document('new-hash'))
+        self.assertIsNone(self.db.get_kosync_document('new-hash'))
+        self.assertEqual(self.db.get_setting('UNSET', 'fallback'), 'fallback')
+        self.assertEqual(len(self.selects), 2)
+
+        self.db.save_kosync_document(KosyncDocument(document_hash='new-hash', percentage=0.5))
+        self.db.set_setting('UNSET', 'value')
+
+        self.assertIsNotNone(self.db.get_kosync_document('new-hash'))
+        self.assertEqual(self.db.get_setting('UNSET', 'fallback'), 'value')
+
+    def test_unit_of_work_invalidates_books(self):
+        self.db.get_book('b1')
+        unit = self.db.unit_of_work()
+        unit.save_book(Book(abs_id='b1', abs_title='Book 1', status='active', transcript_file='DB_MANAGED'))
+        unit.commit()
+
+        self.assertEqual(self.db.get_book('b1').transcript_file, 'DB_MANAGED')
+
+    def test_cached_document_can_be_saved(self):
+        doc = self.db.get_kosync_document('h1')
+        doc.percentage = 0.75
+        self.db.save_kosync_document(doc)
+
+        self.assertAlmostEqual(float(self.db.get_kosync_document('h1').percentage), 0.75)
+
+    def test_concurrent_readers(self):
+        errors = []
+
+        def read():
+            try:
+                for _ in range(50):
+                    self.assertEqual(self.db.get_book('b1').abs_id, 'b1')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.services.alignment_service import AlignmentService
+from src.utils.polisher import Polisher
+from src.utils.transcriber import AudioTranscriber
+from src.utils.sparse_transcription import (
+    merge_windows, plan_sparse_windows, run_sparse_transcription, window_key
+)
+
+
+class TestSparseWindowPlanning(unittest.TestCase):
+
+    def test_plan_includes_interval_chapters_and_ending(self):
+        windows = plan_sparse_windows(3000, window_seconds=60, interval_seconds=1000, chapter_starts=[1500, 1020])
+
+        starts = [w[0] for w in windows]
+        # 1020 overlaps the 1000 window and is dropped; ending window covers the last minute
+        self.assertEqual(starts, [0.0, 1000.0, 1500.0, 2000.0, 2940.0])
+        self.assertTrue(all(end - start == 60 for start, end in windows))
+
+    def test_merge_skips_overlaps_and_clamps_to_duration(self):
+        windows = merge_windows([(0.0, 60.0)], [30.0, 500.0, 990.0, 2000.0], 60, 1000)
+        self.assertEqual(windows, [(0.0, 60.0), (500.0, 560.0), (990.0, 1000.0)])
+
+    def test_runner_offsets_resumes_and_densifies(self):
+        calls = []
+
+        def transcribe(start, duration):
+            calls.append(start)
+            return [{"start": 1.0, "end": 2.0, "text": f"w{int(start)}"}]
+
+        gap_requests = []
+
+        def find_gaps(segments, windows):
+            gap_requests.append(len(windows))
+            return [300.0] if len(gap_requests) == 1 else []
+
+        completed = {window_key(0.0): [{"start": 1.0, "end": 2.0, "text": "cached"}]}
+        segments, windows = run_sparse_transcription(
+            transcribe, [(0.0, 60.0), (600.0, 660.0)], 1000, window_seconds=60,
+            find_gaps=find_gaps, completed=completed,
+        )
+
+        self.assertEqual(calls, [600.0, 300.0])
+        self.assertEqual(windows, [(0.0, 60.0), (300.0, 360.0), (600.0, 660.0)])
+        self.assertEqual([s["text"] for s in segments], ["cached", "w300", "w600"])
+        self.assertEqual(segments[1]["start"], 301.0)
+
+
+class TestProcessAudioSparse(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        self.transcriber = AudioTranscriber(self.data_dir, MagicMock(), MagicMock())
+
+    @patch.dict("os.environ", {"SPARSE_WINDOW_SECONDS": "60", "SPARSE_INTERVAL_SECONDS": "1000"})
+    def test_windows_map_to_chunks_and_end_marker_is_added(self):
+        chunks = [Path("part_000_split_001.wav"), Path("part_000_split_002.wav")]
+        self.transcriber._prepare_audio_chunks = MagicMock(return_value=chunks)
+        self.transcriber.get_audio_duration = MagicMock(side_effect=[1500.0, 1000.0])
+        extracted = []
+
+        def extract(chunk, start, duration, out_path):
+            extracted.append((chunk.name, start, duration))
+            return out_path
+        self.transcriber.extract_audio_window = extract
+
+        provider = MagicMock()
+        provider.transcribe.return_value = [{"start": 0.5, "end": 1.5, "text": "hello"}]
+        with patch("src.utils.transcriber.get_transcription_provider", return_value=provider):
+            audio_urls = [{"ino": str(i), "size": 10, "mtime_ms": 1} for i in range(2)]
+            segments = self.transcriber.process_audio_sparse("book-1", audio_urls, chapters=[{"start": 1700.0}])
+
+        self.assertEqual(extracted, [
+            ("part_000_split_001.wav", 0.0, 60.0),
+            ("part_000_split_001.wav", 1000.0, 60.0),
+            ("part_000_split_002.wav", 200.0, 60.0),
+            ("part_000_split_002.wav", 500.0, 60.0),
+            ("part_000_split_002.wav", 940.0, 60.0),
+        ])
+        self.assertEqual([s["start"] for s in segments], [0.5, 1000.5, 1700.5, 2000.5, 2440.5, 2500.0])
+        self.assertEqual(segments[-1]["text"], "")
+        self.assertFalse((self.data_dir / "audio_cache" / "book-1").exists())
+
+
+class TestFindSparseGaps(unittest.TestCase):
+
+    def setUp(self):
+        self.service = AlignmentService(None, Polisher())
+        rng = random.Random(3)
+        vocab = ["".join(rng.choice("abcdefghij") for _ in range(6)) for _ in range(3000)]
+        # 20 minutes at 3 words/s, then 20 minutes at 1.5 words/s
+        self.words = []
+        ts = 0.0
+        for i in range(7200):
+            rate = 3.0 if ts < 1200 else 1.5
+            self.words.append((rng.choice(vocab) + ("." if i % 10 == 9 else ""), ts))
+            ts += 1.0 / rate
+        self.total = ts
+        self.text = " ".join(w for w, _ in self.words)
+
+    def _transcribe(self, windows):
+        segments = []
+        for start, end in windows:
+            inside = [w for w in self.words if start <= w[1] < end]
+            for i in range(0, len(inside), 10):
+                group = inside[i:i + 10]
+                segments.append({"start": group[0][1], "end": group[-1][1] + 0.3, "text": " ".join(w for w, _ in group)})
+        return segments
+
+    def test_flags_windows_where_narration_speed_changes(self):
+        windows = [(0.0, 60.0), (600.0, 660.0), (1800.0, 1860.0), (self.total - 60, self.total)]
+        gaps = self.service.find_sparse_gaps(self._transcribe(windows), windows, self.text, max_error_seconds=20)
+
+        self.assertTrue(gaps)
+        self.assertTrue(any(660 < g < 1800 for g in gaps))
+
+    def test_no_gaps_when_interpolation_holds(self):
+        windows = [(0.0, 60.0), (500.0, 560.0), (1000.0, 1060.0)]
+        words = [w for w in self.words if w[1] < 1150]
+        text = " ".join(w for w, _ in words)
+        segments = self._transcribe(windows) + [{"start": 1150.0, "end": 1150.0, "text": ""}]
+
+        # Uniform narration speed: leave-one-out interpolation lands on the real anchors
+        gaps = self.service.find_sparse_gaps(segments, windows, text, max_error_seconds=20)
+        self.assertEqual(gaps, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for the unique (abs_id, client_name) index on states and the save_state upsert.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy.exc import IntegrityError
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book, State
+
+
+class TestStateDedupeMigration(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.temp_dir) / 'dupes.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_db_with_duplicates(self):
+        """A pre-index database where concurrent writers left duplicate states behind."""
+        db = DatabaseService(self.db_path)
+        db.save_book(Book(abs_id='b1', abs_title='Book 1', status='active'))
+        db.db_manager.close()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP INDEX ix_states_abs_id_client_name")
+        conn.execute("UPDATE alembic_version SET version_num = 'f6b2c4d8e9a1'")
+        conn.executemany(
+            "INSERT INTO states (abs_id, client_name, last_updated, percentage) VALUES (?, ?, ?, ?)",
+            [
+                ('b1', 'abs', 10.0, 0.1),
+                ('b1', 'abs', 30.0, 0.3),
+                ('b1', 'abs', 20.0, 0.2),
+                ('b1', 'kosync', None, 0.4),
+                ('b1', 'kosync', None, 0.5),
+                ('b1', 'storyteller', 5.0, 0.6),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    def test_upgrade_keeps_newest_state_per_client(self):
+        self._make_db_with_duplicates()
+
+        db = DatabaseService(self.db_path)
+        try:
+            states = {s.client_name: s.percentage for s in db.get_states_for_book('b1')}
+        finally:
+            db.db_manager.close()
+
+        self.assertEqual(len(states), 3)
+        self.assertAlmostEqual(states['abs'], 0.3)
+        # No timestamps to compare: the later row wins
+        self.assertAlmostEqual(states['kosync'], 0.5)
+        self.assertAlmostEqual(states['storyteller'], 0.6)
+
+    def test_index_rejects_duplicates(self):
+        self._make_db_with_duplicates()
+
+        db = DatabaseService(self.db_path)
+        try:
+            with self.assertRaises(IntegrityError):
+                with db.get_session() as session:
+                    session.add(State(abs_id='b1', client_name='abs', percentage=0.9))
+        finally:
+            db.db_manager.close()
+
+
+class TestSaveStateUpsert(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'test.db'))
+        self.db.save_book(Book(abs_id='b1', abs_title='Book 1', status='active'))
+
+    def tearDown(self):
+        self.db.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_insert_then_update_same_row(self):
+        first = self.db.save_state(State(abs_id='b1', client_name='abs', percentage=0.1, last_updated=1.0))
+        second = self.db.save_state(State(abs_id='b1', client_name='abs', percentage=0.2, last_updated=2.0,
+                                          xpath='/body/p[1]'))
+
+        self.assertIsNotNone(first.id)
+        self.assertEqual(first.id, second.id)
+        self.assertAlmostEqual(second.percentage, 0.2)
+        self.assertEqual(second.xpath, '/body/p[1]')
+        self.assertEqual(len(self.db.get_states_for_book('b1')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
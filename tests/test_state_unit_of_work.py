@@ -0,0 +1,93 @@
+"""
+Tests for staging book and state writes in one transaction.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from src.db.database_service import DatabaseService
+from src.db.models import Book, State
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DatabaseService(str(Path(self.temp_dir) / 'test.db'))
+        self.db.save_book(Book(abs_id='b1', abs_title='Book 1', status='active'))
+        self.db.save_state(State(abs_id='b1', client_name='abs', percentage=0.1, last_updated=1.0))
+
+    def tearDown(self):
+        self.db.db_manager.engine.dispose()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _states(self, abs_id):
+        return {s.client_name: s for s in self.db.get_states_for_book(abs_id)}
+
+    def test_nothing_written_until_commit(self):
+        unit = self.db.unit_of_work()
+        unit.save_state(State(abs_id='b1', client_name='kosync', percentage=0.2, last_updated=2.0))
+
+        self.assertNotIn('kosync', self._states('b1'))
+        self.assertEqual(unit.commit(), 1)
+        self.assertAlmostEqual(float(self._states('b1')['kosync'].percentage), 0.2)
+
+    def test_upserts_books_and_states(self):
+        unit = self.db.unit_of_work()
+        unit.save_book(Book(abs_id='b1', abs_title='Book 1', status='active', transcript_file='DB_MANAGED'))
+        unit.save_book(Book(abs_id='b2', abs_title='Book 2', status='pending'))
+        unit.save_state(State(abs_id='b1', client_name='abs', percentage=0.5, last_updated=3.0, timestamp=120.0))
+        unit.save_state(State(abs_id='b2', client_name='abs', percentage=0.3, last_updated=3.0))
+        unit.commit()
+
+        self.assertEqual(self.db.get_book('b1').transcript_file, 'DB_MANAGED')
+        self.assertEqual(self.db.get_book('b2').status, 'pending')
+        states = self.db.get_states_for_book('b1')
+        self.assertEqual(len(states), 1)
+        self.assertAlmostEqual(float(states[0].percentage), 0.5)
+        self.assertEqual(states[0].timestamp, 120.0)
+        self.assertEqual(len(self.db.get_states_for_book('b2')), 1)
+
+    def test_last_write_wins_per_client(self):
+        unit = self.db.unit_of_work()
+        unit.save_state(State(abs_id='b1', client_name='kosync', percentage=0.2, last_updated=2.0))
+        unit.save_state(State(abs_id='b1', client_name='kosync', percentage=0.4, last_updated=2.0))
+
+        self.assertEqual(len(unit), 1)
+        unit.commit()
+        self.assertAlmostEqual(float(self._states('b1')['kosync'].percentage), 0.4)
+
+    def test_commit_uses_one_transaction(self):
+        commits = []
+        event.listen(self.db.db_manager.engine, 'commit', lambda conn: commits.append(conn))
+        unit = self.db.unit_of_work()
+        unit.save_book(Book(abs_id='b1', abs_title='Renamed', status='active'))
+        for client in ('abs', 'kosync', 'storyteller', 'booklore'):
+            unit.save_state(State(abs_id='b1', client_name=client, percentage=0.6, last_updated=4.0))
+
+        unit.commit()
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(unit.commit(), 0)
+        self.assertEqual(len(commits), 1)
+
+    def test_failed_commit_writes_nothing(self):
+        unit = self.db.unit_of_work()
+        unit.save_book(Book(abs_id='b1', abs_title='Renamed', status='active'))
+        unit.save_state(State(abs_id='b1', client_name='abs', percentage=0.9, last_updated=5.0))
+
+        with patch.object(DatabaseService, '_upsert_states', side_effect=RuntimeError('disk full')):
+            with self.assertRaises(RuntimeError):
+                unit.commit()
+
+        self.assertEqual(self.db.get_book('b1').abs_title, 'Book 1')
+        self.assertAlmostEqual(float(self._states('b1')['abs'].percentage), 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
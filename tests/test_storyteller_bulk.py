@@ -0,0 +1,182 @@
+"""
+Tests for Storyteller bulk position fetching.
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from src.api.storyteller_api import StorytellerAPIClient
+from src.db.models import Book
+from src.sync_clients.storyteller_sync_client import StorytellerSyncClient
+
+ENV = {
+    'STORYTELLER_API_URL': 'http://test-storyteller:8001',
+    'STORYTELLER_USER': 'testuser',
+    'STORYTELLER_PASSWORD': 'testpass',
+    'STORYTELLER_BULK_CONCURRENCY': '4',
+}
+
+
+def _position(pct, ts=1000, href='OEBPS/ch1.html', frag='s1'):
+    return {
+        'timestamp': ts,
+        'locator': {'href': href, 'locations': {'totalProgression': pct, 'fragments': [frag]}},
+    }
+
+
+@patch.dict(os.environ, ENV)
+class TestStorytellerBulkPositions(unittest.TestCase):
+
+    def _listing_response(self, books):
+        response = Mock(status_code=200)
+        response.json.return_value = books
+        return response
+
+    def test_only_requested_uuids_fetched_concurrently(self):
+        client = StorytellerAPIClient()
+        active, peak, calls = [0], [0], []
+        guard = threading.Lock()
+
+        def details(uuid):
+            with guard:
+                calls.append(uuid)
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with guard:
+                active[0] -= 1
+            return _position(0.5, href='ch1.html', frag='frag')
+
+        with patch.object(client, '_fetch_position', side_effect=details), \
+                patch.object(client, '_make_request') as mock_request:
+            positions = client.get_all_positions_bulk({'u1', 'u2', 'u3'})
+
+        # Few enough books that the listing isn't worth it
+        mock_request.assert_not_called()
+        self.assertCountEqual(calls, ['u1', 'u2', 'u3'])
+        self.assertEqual(set(positions), {'u1', 'u2', 'u3'})
+        self.assertGreater(peak[0], 1)
+        self.assertEqual(positions['u1']['href'], 'ch1.html')
+        self.assertIn('fetched_at', positions['u1'])
+
+    def test_embedded_positions_used_from_listing(self):
+        client = StorytellerAPIClient()
+        books = [{'uuid': f'u{i}', 'title': f'Book {i}', 'position': _position(i / 10)} for i in range(8)]
+        books.append({'uuid': 'other', 'title': 'Unlinked', 'position': _position(0.9)})
+        wanted = {f'u{i}' for i in range(8)}
+
+        with patch.object(client, '_make_request', return_value=self._listing_response(books)), \
+                patch.object(client, '_fetch_position') as details:
+            positions = client.get_all_positions_bulk(wanted)
+
+        details.assert_not_called()
+        self.assertEqual(set(positions), wanted)
+        self.assertAlmostEqual(positions['u3']['pct'], 0.3)
+        self.assertEqual(positions['u3']['frag'], 's1')
+        self.assertTrue(client._list_includes_positions)
+        # Title cache is refreshed from the same listing
+        self.assertIn('book 3', client._book_cache)
+
+    def test_listing_without_positions_is_not_retried(self):
+        client = StorytellerAPIClient()
+        books = [{'uuid': f'u{i}', 'title': f'Book {i}'} for i in range(8)]
+        wanted = {f'u{i}' for i in range(8)}
+
+        with patch.object(client, '_make_request', return_value=self._listing_response(books)) as mock_request, \
+                patch.object(client, '_fetch_position', return_value=_position(0.1)):
+            first = client.get_all_positions_bulk(wanted)
+            second = client.get_all_positions_bulk(wanted)
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertFalse(client._list_includes_positions)
+        self.assertEqual(set(first), wanted)
+        self.assertEqual(set(second), wanted)
+
+    def test_missing_positions_omitted(self):
+        client = StorytellerAPIClient()
+        with patch.object(client, '_fetch_position', return_value=None):
+            self.assertEqual(client.get_all_positions_bulk({'u1'}), {})
+        self.assertEqual(client.get_all_positions_bulk(set()), {})
+
+
+class TestStorytellerSyncClientBulk(unittest.TestCase):
+
+    def test_fetch_bulk_state_limited_to_linked_books(self):
+        api = Mock()
+        api.get_all_positions_bulk.return_value = {'u1': {}}
+        database_service = Mock()
+        database_service.get_books_by_status.return_value = [
+            Book(abs_id='a1', storyteller_uuid='u1'),
+            Book(abs_id='a2', storyteller_uuid=None),
+        ]
+        client = StorytellerSyncClient(api, Mock(), database_service)
+
+        self.assertEqual(client.fetch_bulk_state(), {'u1': {}})
+        api.get_all_positions_bulk.assert_called_once_with({'u1'})
+
+    def test_fetch_bulk_state_skipped_without_linked_books(self):
+        api = Mock()
+        database_service = Mock()
+        database_service.get_books_by_status.return_value = [Book(abs_id='a1')]
+        client = StorytellerSyncClient(api, Mock(), database_service)
+
+        self.assertEqual(client.fetch_bulk_state(), {})
+        api.get_all_positions_bulk.assert_not_called()
+
+
+class TestStorytellerServiceStateFromBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.api = Mock()
+        self.api.is_configured.return_value = True
+        self.api.get_position_details.return_value = (0.2, 50, 'live.html', 'live-frag')
+        self.client = StorytellerSyncClient(self.api, Mock())
+        self.book = Book(abs_id='a1', abs_title='Book', storyteller_uuid='u1')
+
+    def _entry(self, age=0.0):
+        return {
+            'pct': 0.4, 'ts': 100, 'href': 'ch2.html', 'frag': 's9',
+            'uuid': 'u1', 'fetched_at': time.time() - age,
+        }
+
+    def test_uses_fresh_bulk_entry(self):
+        state = self.client.get_service_state(self.book, None, 'Book', {'u1': self._entry()})
+
+        self.api.get_position_details.assert_not_called()
+        self.assertEqual(state.current, {'pct': 0.4, 'ts': 100, 'href': 'ch2.html', 'frag': 's9'})
+        self.assertAlmostEqual(state.delta, 0.4)
+
+    def test_missing_entry_fetches_per_book(self):
+        state = self.client.get_service_state(self.book, None, 'Book', {'other': self._entry()})
+
+        self.api.get_position_details.assert_called_once_with('u1')
+        self.assertEqual(state.current['href'], 'live.html')
+
+    def test_stale_entry_fetches_per_book(self):
+        stale = self._entry(age=StorytellerSyncClient.BULK_MAX_AGE_SECONDS + 1)
+        state = self.client.get_service_state(self.book, None, 'Book', {'u1': stale})
+
+        self.api.get_position_details.assert_called_once_with('u1')
+        self.assertEqual(state.current['pct'], 0.2)
+
+    def test_bulk_and_per_book_states_match(self):
+        payload = {'timestamp': 100, 'locator': {'href': 'ch2.html', 'locations': {
+            'totalProgression': 0.4, 'fragments': ['s9'], 'cfi': 'epubcfi(/6/4)'}}}
+        self.api.get_position_details.return_value = StorytellerAPIClient._parse_position(payload)
+        entry = StorytellerAPIClient._position_entry('u1', payload, time.time())
+
+        from_bulk = self.client.get_service_state(self.book, None, 'Book', {'u1': entry})
+        per_book = self.client.get_service_state(self.book, None, 'Book', None)
+
+        self.assertEqual(from_bulk.current, per_book.current)
+
+    def test_no_bulk_context_fetches_per_book(self):
+        self.client.get_service_state(self.book, None, 'Book', None)
+        self.api.get_position_details.assert_called_once_with('u1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for SyncManager's per-book locking.
+
+Instant syncs only take the lock for their own book, and the scheduled
+cycle skips (rather than waits for) books that are being synced right now.
+"""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.db.models import Book
+from src.sync_manager import SyncManager
+
+
+class TestSyncLocking(unittest.TestCase):
+
+    def setUp(self):
+        self.books = {
+            abs_id: Book(abs_id=abs_id, abs_title=f"Book {abs_id}", status='active')
+            for abs_id in ('book-a', 'book-b', 'book-c')
+        }
+        self.mock_db = Mock()
+        self.mock_db.get_all_books.return_value = []
+        self.mock_db.get_book.side_effect = lambda abs_id: self.books.get(abs_id)
+        self.mock_db.get_books_by_status.return_value = list(self.books.values())
+
+        self.manager = SyncManager(
+            database_service=self.mock_db,
+            abs_client=Mock(),
+            booklore_client=Mock(),
+            sync_clients={},
+            data_dir=Path('/tmp'),
+        )
+        self.synced = []
+        self.manager._sync_book = Mock(side_effect=lambda book, bulk, preload=None: self.synced.append(book.abs_id))
+
+    def test_instant_sync_not_blocked_by_other_book(self):
+        other_lock = self.manager._get_book_lock('book-b')
+        other_lock.acquire()
+        try:
+            start = time.time()
+            self.manager.sync_cycle(target_abs_id='book-a')
+            elapsed = time.time() - start
+        finally:
+            other_lock.release()
+
+        self.assertEqual(self.synced, ['book-a'])
+        self.assertLess(elapsed, 1.0)
+
+    def test_instant_sync_not_blocked_by_running_cycle(self):
+        self.manager._cycle_lock.acquire()
+        try:
+            self.manager.sync_cycle(target_abs_id='book-a')
+        finally:
+            self.manager._cycle_lock.release()
+
+        self.assertEqual(self.synced, ['book-a'])
+
+    def test_instant_sync_waits_for_same_book(self):
+        lock = self.manager._get_book_lock('book-a')
+        lock.acquire()
+        threading.Timer(0.2, lock.release).start()
+
+        self.manager.sync_cycle(target_abs_id='book-a')
+
+        self.assertEqual(self.synced, ['book-a'])
+        self.assertFalse(lock.locked())
+
+    def test_daemon_skips_book_being_synced(self):
+        lock = self.manager._get_book_lock('book-b')
+        lock.acquire()
+        try:
+            start = time.time()
+            self.manager.sync_cycle()
+            elapsed = time.time() - start
+        finally:
+            lock.release()
+
+        self.assertEqual(self.synced, ['book-a', 'book-c'])
+        self.assertLess(elapsed, 1.0)
+
+    def test_daemon_skips_when_cycle_already_running(self):
+        self.manager._cycle_lock.acquire()
+        try:
+            self.manager.sync_cycle()
+        finally:
+            self.manager._cycle_lock.release()
+
+        self.assertEqual(self.synced, [])
+
+    def test_book_locks_released_after_cycle(self):
+        self.manager._sync_book.side_effect = RuntimeError("boom")
+        self.manager.sync_cycle()
+
+        for abs_id in self.books:
+            self.assertFalse(self.manager._get_book_lock(abs_id).locked())
+        self.assertFalse(self.manager._cycle_lock.locked())
+
+    def test_get_book_lock_is_stable(self):
+        self.assertIs(self.manager._get_book_lock('book-a'), self.manager._get_book_lock('book-a'))
+        self.assertIsNot(self.manager._get_book_lock('book-a'), self.manager._get_book_lock('book-b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.transcriber import AudioTranscriber
+
+transcriber_module = sys.modules[AudioTranscriber.__module__]
+LocalWhisperProvider = transcriber_module.LocalWhisperProvider
+
+
+class TestParallelChunkTranscription(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        self.transcriber = AudioTranscriber(self.data_dir, MagicMock(), MagicMock())
+        self.durations = {0: 100.0, 1: 50.0, 2: 75.0, 3: 25.0}
+        self.transcriber.get_audio_duration = MagicMock(
+            side_effect=lambda p: self.durations[int(Path(p).stem.split("_")[-1])]
+        )
+        # Run the "process pool" on threads so patched workers stay in-process
+        self.transcriber._make_chunk_executor = lambda workers: ThreadPoolExecutor(max_workers=workers)
+
+        self.book_dir = self.data_dir / "audio_cache" / "book-1"
+        self.book_dir.mkdir(parents=True)
+        for i in self.durations:
+            (self.book_dir / f"part_000_split_{i:03d}.wav").touch()
+
+    def _fake_worker(self, audio_path):
+        idx = int(Path(audio_path).stem.split("_")[-1])
+        # Later chunks finish first to exercise in-order merging
+        time.sleep(0.02 * (len(self.durations) - idx))
+        return [{"start": 1.0, "end": 2.0, "text": f"chunk {idx}"}]
+
+    def _run(self, workers, worker=None):
+        provider = MagicMock(spec=LocalWhisperProvider)
+        provider.get_name.return_value = "LocalWhisper (tiny)"
+        provider.transcribe.side_effect = lambda p: self._fake_worker(str(p))
+        with patch.dict("os.environ", {"TRANSCRIPTION_WORKERS": str(workers)}), \
+             patch.object(transcriber_module, "get_transcription_provider", return_value=provider), \
+             patch.object(transcriber_module, "transcribe_chunk_in_worker", side_effect=worker or self._fake_worker):
+            callback = MagicMock()
+            result = self.transcriber.process_audio("book-1", [{"stream_url": "x", "ext": "mp3"}],
+                                                    progress_callback=callback)
+        return result, callback, provider
+
+    def test_parallel_matches_sequential_offsets(self):
+        sequential, _, _ = self._run(workers=1)
+        # Successful runs wipe the cache dir and store the transcript, so reset both
+        shutil.rmtree(self.transcriber.transcript_cache_dir)
+        self.book_dir.mkdir(parents=True)
+        for i in self.durations:
+            (self.book_dir / f"part_000_split_{i:03d}.wav").touch()
+        parallel, callback, provider = self._run(workers=3)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual([s["start"] for s in parallel], [1.0, 101.0, 151.0, 226.0])
+        provider.transcribe.assert_not_called()
+        self.assertEqual([c.args[0] for c in callback.call_args_list], [0.25, 0.5, 0.75, 1.0])
+
+    def test_failure_checkpoints_contiguous_prefix(self):
+        def worker(audio_path):
+            idx = int(Path(audio_path).stem.split("_")[-1])
+            if idx == 2:
+                time.sleep(0.05)
+                raise RuntimeError("boom")
+            return [{"start": 0.0, "end": 1.0, "text": f"chunk {idx}"}]
+
+        with self.assertRaises(RuntimeError):
+            self._run(workers=4, worker=worker)
+
+        progress = json.loads((self.book_dir / "_progress.json").read_text())
+        self.assertEqual(progress["chunks_completed"], 2)
+        self.assertEqual(progress["cumulative_duration"], 150.0)
+        self.assertFalse(progress["done"])
+        self.assertEqual([s["text"] for s in progress["transcript"]], ["chunk 0", "chunk 1"])
+
+    def test_resume_only_transcribes_remaining_chunks(self):
+        (self.book_dir / "_progress.json").write_text(json.dumps({
+            "chunks_completed": 2,
+            "cumulative_duration": 150.0,
+            "transcript": [{"start": 0.0, "end": 1.0, "text": "a"}, {"start": 100.0, "end": 101.0, "text": "b"}],
+            "done": False,
+        }))
+        seen = []
+        lock = threading.Lock()
+
+        def worker(audio_path):
+            with lock:
+                seen.append(Path(audio_path).name)
+            return self._fake_worker(audio_path)
+
+        result, _, _ = self._run(workers=2, worker=worker)
+
+        self.assertEqual(sorted(seen), ["part_000_split_002.wav", "part_000_split_003.wav"])
+        self.assertEqual([s["start"] for s in result], [0.0, 100.0, 151.0, 226.0])
+
+    def test_cloud_provider_stays_sequential(self):
+        provider = MagicMock()
+        provider.get_name.return_value = "Deepgram (nova-2)"
+        with patch.dict("os.environ", {"TRANSCRIPTION_WORKERS": "4"}):
+            self.assertEqual(self.transcriber._get_transcription_workers(provider), 1)
+            self.assertEqual(self.transcriber._get_transcription_workers(MagicMock(spec=LocalWhisperProvider)), 4)
+
+
+class TestTranscriptContentCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        self.transcriber = AudioTranscriber(self.data_dir, MagicMock(), MagicMock())
+        self.cache_dir = self.transcriber.transcript_cache_dir
+        self.segments = [{"start": 0.0, "end": 1.0, "text": "x" * 1000}]
+
+    def test_entry_reused_across_books(self):
+        self.transcriber._store_cached_transcript("k1", self.segments)
+
+        # Keyed by the audio only: a re-created mapping or another book finds it
+        self.assertEqual(self.transcriber._load_cached_transcript("k1"), self.segments)
+        self.assertEqual([p.name for p in self.cache_dir.iterdir()], ["k1.json"])
+
+    def test_prune_least_recently_used(self):
+        now = time.time()
+        for i, key in enumerate(["old", "mid", "new"]):
+            self.transcriber._store_cached_transcript(key, self.segments)
+            path = self.cache_dir / f"{key}.json"
+            os.utime(path, (now - 100 + i, now - 100 + i))
+        # Reading an entry makes it the most recently used
+        self.transcriber._load_cached_transcript("old")
+        size_mb = (self.cache_dir / "old.json").stat().st_size / (1024 * 1024)
+
+        with patch.dict("os.environ", {"TRANSCRIPT_CACHE_MAX_MB": str(size_mb * 2.5)}):
+            self.assertEqual(self.transcriber.prune_transcript_cache(), 1)
+        self.assertEqual(sorted(p.name for p in self.cache_dir.iterdir()), ["new.json", "old.json"])
+
+        os.utime(self.cache_dir / "new.json", (now - 91 * 86400, now - 91 * 86400))
+        self.assertEqual(self.transcriber.prune_transcript_cache(), 1)
+        self.assertEqual([p.name for p in self.cache_dir.iterdir()], ["old.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
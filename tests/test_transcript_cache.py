@@ -0,0 +1,78 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.transcriber import AudioTranscriber
+
+transcriber_module = sys.modules[AudioTranscriber.__module__]
+
+
+class TestContentAddressedTranscriptCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir, ignore_errors=True)
+        self.transcriber = AudioTranscriber(self.data_dir, MagicMock(), MagicMock())
+        self.transcriber.get_audio_duration = MagicMock(return_value=100.0)
+
+        def prepare(book_cache_dir, audio_urls, max_duration):
+            chunk = book_cache_dir / "part_000_split_001.wav"
+            chunk.write_bytes(b"RIFF" + b"\x01" * 4096)
+            return [chunk]
+        self.transcriber._prepare_audio_chunks = MagicMock(side_effect=prepare)
+
+        self.provider = MagicMock()
+        self.provider.get_name.return_value = "LocalWhisper (tiny)"
+        self.provider.transcribe.return_value = [{"start": 0.0, "end": 1.0, "text": "hello there"}]
+        patcher = patch.object(transcriber_module, "get_transcription_provider", return_value=self.provider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _audio(self, mtime=1700000000000):
+        return [{"stream_url": "http://abs/file/1", "ext": "mp3", "ino": "123", "size": 5000, "mtime_ms": mtime}]
+
+    def test_same_audio_reuses_transcript_for_any_book(self):
+        first = self.transcriber.process_audio("book-a", self._audio())
+        second = self.transcriber.process_audio("book-b", self._audio())
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.provider.transcribe.call_count, 1)
+        # Metadata key: the second job never downloads anything
+        self.assertEqual(self.transcriber._prepare_audio_chunks.call_count, 1)
+        self.assertFalse((self.data_dir / "audio_cache" / "book-b").exists())
+
+    def test_changed_audio_or_model_is_retranscribed(self):
+        self.transcriber.process_audio("book-a", self._audio())
+        self.transcriber.process_audio("book-a", self._audio(mtime=1800000000000))
+        self.provider.get_name.return_value = "LocalWhisper (small)"
+        self.transcriber.process_audio("book-a", self._audio(mtime=1800000000000))
+
+        self.assertEqual(self.provider.transcribe.call_count, 3)
+
+    def test_sampled_file_key_when_metadata_missing(self):
+        audio = [{"stream_url": "http://abs/file/1", "ext": "mp3"}]
+        self.transcriber.process_audio("book-a", audio)
+        self.transcriber.process_audio("book-b", audio)
+
+        # Audio had to be fetched to be sampled, but transcription was reused
+        self.assertEqual(self.transcriber._prepare_audio_chunks.call_count, 2)
+        self.assertEqual(self.provider.transcribe.call_count, 1)
+
+    def test_file_key_tracks_content(self):
+        path = self.data_dir / "chunk.wav"
+        path.write_bytes(b"a" * 300000)
+        key = self.transcriber._transcript_key_from_files([path], "full|x")
+        self.assertEqual(key, self.transcriber._transcript_key_from_files([path], "full|x"))
+
+        data = bytearray(path.read_bytes())
+        data[150000] = ord("b")
+        path.write_bytes(bytes(data))
+        self.assertNotEqual(key, self.transcriber._transcript_key_from_files([path], "full|x"))
+
+
+if __name__ == '__main__':
+    unittest.main()
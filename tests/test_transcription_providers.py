@@ -2,12 +2,16 @@ import unittest
 from unittest.mock import patch, MagicMock
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from utils.transcription_providers import LocalWhisperProvider, DeepgramProvider, get_transcription_provider
+from utils.transcription_providers import (
+    LocalWhisperProvider, DeepgramProvider, WhisperModelPool, get_transcription_provider, get_whisper_model_pool
+)
 
 class TestLocalWhisperProvider(unittest.TestCase):
     
@@ -83,6 +87,112 @@ class TestLocalWhisperProvider(unittest.TestCase):
                 compute_type='float16'
             )
 
+    @patch("faster_whisper.WhisperModel")
+    @patch("utils.transcription_providers.logger")
+    @patch.dict(os.environ, {"WHISPER_MODEL": "tiny", "WHISPER_CPU_THREADS": "8"}, clear=True)
+    def test_transcribe_shares_pooled_model(self, mock_logger, mock_whisper_model):
+        """Successive providers reuse one pooled model and release it after each run."""
+        pool = get_whisper_model_pool()
+        pool.clear()
+        mock_whisper_model.return_value.transcribe.return_value = ([], None)
+        try:
+            for _ in range(2):
+                provider = LocalWhisperProvider()
+                with patch.object(provider, '_get_device_config', return_value=('cpu', 'int8')):
+                    provider.transcribe(Path("chunk.wav"))
+                self.assertIsNone(provider._model)
+
+            mock_whisper_model.assert_called_once()
+            self.assertEqual(mock_whisper_model.call_args.kwargs['cpu_threads'], 8)
+            stats = pool.stats()
+            self.assertEqual(len(stats['models']), 1)
+            self.assertEqual(stats['models'][0]['refcount'], 0)
+        finally:
+            pool.clear()
+
+
+class TestWhisperModelPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = WhisperModelPool(idle_timeout=60)
+        patcher = patch("faster_whisper.WhisperModel", side_effect=lambda *a, **kw: MagicMock())
+        self.mock_whisper_model = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.pool.clear)
+
+    def test_acquire_refcounts_by_key(self):
+        a = self.pool.acquire("base", "cpu", "int8", download_root="/tmp/models")
+        b = self.pool.acquire("base", "cpu", "int8", download_root="/tmp/models")
+        c = self.pool.acquire("base", "cuda", "float16", download_root="/tmp/models")
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(self.mock_whisper_model.call_count, 2)
+        refcounts = {(m['device'], m['refcount']) for m in self.pool.stats()['models']}
+        self.assertEqual(refcounts, {("cpu", 2), ("cuda", 1)})
+
+    def test_evicts_only_idle_unreferenced_models(self):
+        self.pool.acquire("base", "cpu", "int8", download_root="/tmp/models")
+        self.pool.acquire("small", "cpu", "int8", download_root="/tmp/models")
+        self.pool.release(("base", "cpu", "int8"))
+
+        now = time.time()
+        self.assertEqual(self.pool.evict_idle(now=now), 0)
+        self.assertEqual(self.pool.evict_idle(now=now + 61), 1)
+
+        stats = self.pool.stats()
+        self.assertEqual([m['model_size'] for m in stats['models']], ["small"])
+        self.assertEqual(stats['unloads'], 1)
+        self.assertIsNotNone(stats['last_unload_seconds'])
+
+    def test_reacquire_cancels_pending_eviction(self):
+        key = ("base", "cpu", "int8")
+        self.pool.acquire(*key, download_root="/tmp/models")
+        self.pool.release(key)
+        self.assertIn(key, self.pool._timers)
+
+        self.pool.acquire(*key, download_root="/tmp/models")
+        self.assertNotIn(key, self.pool._timers)
+        self.assertEqual(self.mock_whisper_model.call_count, 1)
+
+    def test_slow_load_does_not_block_pool(self):
+        started, release = threading.Event(), threading.Event()
+
+        def load(size, **kwargs):
+            if size == "large":
+                started.set()
+                release.wait(5)
+            return MagicMock()
+
+        self.mock_whisper_model.side_effect = load
+        results = []
+        waiters = [threading.Thread(target=lambda: results.append(
+            self.pool.acquire("large", "cpu", "int8", download_root="/tmp/models"))) for _ in range(2)]
+        for t in waiters:
+            t.start()
+        self.assertTrue(started.wait(5))
+
+        # Other keys and stats() proceed while 'large' is still loading
+        self.pool.acquire("base", "cpu", "int8", download_root="/tmp/models")
+        self.assertEqual([m['model_size'] for m in self.pool.stats()['models']], ["base"])
+
+        release.set()
+        for t in waiters:
+            t.join(5)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(self.mock_whisper_model.call_count, 2)
+        large = next(m for m in self.pool.stats()['models'] if m['model_size'] == "large")
+        self.assertEqual(large['refcount'], 2)
+
+    def test_cpu_threads_only_applied_on_cpu(self):
+        self.pool.acquire("base", "cpu", "int8", download_root="/tmp/models", cpu_threads=6)
+        self.pool.acquire("base", "cuda", "float16", download_root="/tmp/models", cpu_threads=6)
+
+        cpu_call, gpu_call = self.mock_whisper_model.call_args_list
+        self.assertEqual(cpu_call.kwargs['cpu_threads'], 6)
+        self.assertNotIn('cpu_threads', gpu_call.kwargs)
+
+
 class TestDeepgramProvider(unittest.TestCase):
     
     def test_init_without_key(self):
@@ -0,0 +1,164 @@
+"""
+Tests for skipping books whose bulk-reported client state hasn't changed.
+"""
+
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.db.models import Book
+from src.sync_clients.abs_sync_client import ABSSyncClient
+from src.sync_clients.kosync_sync_client import KoSyncSyncClient
+from src.sync_clients.storyteller_sync_client import StorytellerSyncClient
+from src.sync_manager import SyncManager
+
+
+def _bulk_client(snapshot):
+    """A configured client whose fingerprint is its bulk entry for the book."""
+    client = Mock()
+    client.is_configured.return_value = True
+    client.get_supported_sync_types.return_value = {'audiobook', 'ebook'}
+    client.fetch_bulk_state.side_effect = lambda: dict(snapshot)
+    client.bulk_fingerprint.side_effect = lambda book, bulk: (bulk or {}).get(book.abs_id, ('absent',))
+    return client
+
+
+class TestUnchangedFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.books = [Book(abs_id=f"book-{i}", abs_title=f"Book {i}", status='active') for i in range(3)]
+        self.mock_db = Mock()
+        self.mock_db.get_all_books.return_value = []
+        self.mock_db.get_books_by_status.return_value = self.books
+        self.mock_db.get_book.side_effect = lambda abs_id: next(b for b in self.books if b.abs_id == abs_id)
+        self.snapshot = {b.abs_id: (0.1, 100) for b in self.books}
+        self.manager = self._make_manager({'KoSync': _bulk_client(self.snapshot)})
+
+    def _make_manager(self, clients, **env):
+        with patch.dict(os.environ, env):
+            manager = SyncManager(
+                database_service=self.mock_db,
+                abs_client=Mock(),
+                booklore_client=Mock(),
+                sync_clients=clients,
+                data_dir=Path('/tmp'),
+            )
+        manager._sync_book = Mock(return_value=None)
+        self.addCleanup(manager.shutdown_client_executors, True)
+        return manager
+
+    def _synced_ids(self):
+        return [call.args[0].abs_id for call in self.manager._sync_book.call_args_list]
+
+    def test_idle_books_skipped_on_next_cycle(self):
+        self.manager.sync_cycle()
+        self.manager._sync_book.reset_mock()
+
+        self.manager.sync_cycle()
+
+        self.manager._sync_book.assert_not_called()
+        metrics = self.manager.get_cycle_metrics()
+        self.assertEqual(metrics['books_skipped'], 3)
+        self.assertEqual(metrics['books_unchanged'], 0)
+
+    def test_changed_book_processed(self):
+        self.manager.sync_cycle()
+        self.manager._sync_book.reset_mock()
+
+        self.snapshot['book-1'] = (0.2, 200)
+        self.manager.sync_cycle()
+
+        self.assertEqual(self._synced_ids(), ['book-1'])
+        self.assertEqual(self.manager.get_cycle_metrics()['books_skipped'], 2)
+
+    def test_mapping_change_processed(self):
+        self.manager.sync_cycle()
+        self.manager._sync_book.reset_mock()
+
+        self.books[2].ebook_filename = 'relinked.epub'
+        self.manager.sync_cycle()
+
+        self.assertEqual(self._synced_ids(), ['book-2'])
+
+    def test_client_without_fingerprint_disables_skip(self):
+        per_book = Mock()
+        per_book.is_configured.return_value = True
+        per_book.get_supported_sync_types.return_value = {'audiobook', 'ebook'}
+        per_book.fetch_bulk_state.return_value = None
+        per_book.bulk_fingerprint.return_value = None
+        self.manager = self._make_manager({'KoSync': _bulk_client(self.snapshot), 'BookLore': per_book})
+
+        self.manager.sync_cycle()
+        self.manager.sync_cycle()
+
+        self.assertEqual(self.manager._sync_book.call_count, 6)
+
+    def test_failed_books_retried(self):
+        self.manager._sync_book.side_effect = lambda book, bulk, preload=None: False if book.abs_id == 'book-0' else None
+        self.manager.sync_cycle()
+        self.manager._sync_book.reset_mock()
+
+        self.manager.sync_cycle()
+
+        self.assertEqual(self._synced_ids(), ['book-0'])
+
+    def test_fingerprint_expires(self):
+        self.manager.sync_cycle()
+        self.manager._book_fingerprints = {
+            abs_id: (fingerprint, recorded_at - self.manager.fingerprint_max_age)
+            for abs_id, (fingerprint, recorded_at) in self.manager._book_fingerprints.items()
+        }
+        self.manager._sync_book.reset_mock()
+
+        self.manager.sync_cycle()
+
+        self.assertEqual(self.manager._sync_book.call_count, 3)
+
+    def test_instant_sync_invalidates(self):
+        self.manager.sync_cycle()
+        self.manager.sync_cycle(target_abs_id='book-0')
+        self.manager._sync_book.reset_mock()
+
+        self.manager.sync_cycle()
+
+        self.assertEqual(self._synced_ids(), ['book-0'])
+
+    def test_disabled_with_zero_max_age(self):
+        self.manager = self._make_manager({'KoSync': _bulk_client(self.snapshot)},
+                                          SYNC_UNCHANGED_SKIP_MAX_AGE_SECONDS='0')
+        self.manager.sync_cycle()
+        self.manager.sync_cycle()
+
+        self.assertEqual(self.manager._sync_book.call_count, 6)
+
+
+class TestClientFingerprints(unittest.TestCase):
+
+    def setUp(self):
+        self.book = Book(abs_id='a1', storyteller_uuid='u1', kosync_doc_id='h1')
+
+    def test_abs(self):
+        client = ABSSyncClient(Mock(), Mock(), Mock())
+        self.assertIsNone(client.bulk_fingerprint(self.book, None))
+        self.assertEqual(client.bulk_fingerprint(self.book, {}), ('absent',))
+        item = {'currentTime': 12.5, 'lastUpdate': 99, 'isFinished': False}
+        self.assertEqual(client.bulk_fingerprint(self.book, {'a1': item}), (12.5, 99, False))
+
+    def test_kosync(self):
+        client = KoSyncSyncClient(Mock(), Mock())
+        self.assertIsNone(client.bulk_fingerprint(self.book, None))
+        self.assertEqual(client.bulk_fingerprint(self.book, {'a1': {'pct': 0.3, 'xpath': '/x', 'ts': 7}}), (0.3, 7))
+        self.assertEqual(client.bulk_fingerprint(self.book, {'a1': None}), ('missing',))
+
+    def test_storyteller(self):
+        client = StorytellerSyncClient(Mock(), Mock())
+        entry = {'pct': 0.4, 'ts': 5, 'href': 'ch.html', 'frag': 'f', 'cfi': None, 'uuid': 'u1', 'fetched_at': 0}
+        self.assertEqual(client.bulk_fingerprint(self.book, {'u1': entry}), (0.4, 5, 'ch.html', 'f'))
+        # Missing from the snapshot means a per-book fetch, so no fingerprint
+        self.assertIsNone(client.bulk_fingerprint(self.book, {}))
+        self.assertEqual(client.bulk_fingerprint(Book(abs_id='a2'), None), ('unlinked',))
+
+
+if __name__ == '__main__':
+    unittest.main()
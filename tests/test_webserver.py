@@ -21,9 +21,12 @@ class MockContainer:
         self.mock_sync_manager = Mock()
         self.mock_abs_client = Mock()
         self.mock_booklore_client = Mock()
+        self.mock_booklore_client.get_refresh_stats.return_value = {}
         self.mock_storyteller_client = Mock()
         self.mock_database_service = Mock()
         self.mock_database_service.get_all_settings.return_value = {}  # Default empty settings
+        self.mock_database_service.get_read_cache_stats.return_value = {}
+        self.mock_database_service.get_storage_stats.return_value = {}
         self.mock_ebook_parser = Mock()
         self.mock_sync_clients = Mock()
         self.mock_forge_service = Mock()
@@ -35,6 +38,7 @@ class MockContainer:
         self.mock_sync_manager.storyteller_client = self.mock_storyteller_client
         self.mock_sync_manager.get_abs_title.return_value = 'Test Book Title'
         self.mock_sync_manager.get_duration.return_value = 3600
+        self.mock_sync_manager.get_cycle_metrics.return_value = {}
         self.mock_sync_manager.clear_progress = Mock()
 
     def sync_manager(self):